@@ -14,6 +14,7 @@ all nodes in the graph - O(n) complexity.
 from __future__ import annotations
 
 from collections import defaultdict
+from collections.abc import Mapping
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING
 
@@ -93,6 +94,17 @@ class AttributeIndex:
             old_node: Previous node object
             new_node: Updated node object
         """
+        if old_node is new_node:
+            # Mutated in place: the previous values are gone, so drop the
+            # ID from every bucket before re-adding it.
+            for index in (self._by_status, self._by_priority, self._by_type):
+                for value in [v for v, ids in index.items() if node_id in ids]:
+                    index[value].discard(node_id)
+                    if not index[value]:
+                        del index[value]
+            self.add_node(node_id, new_node)
+            return
+
         # Remove old attributes
         self._by_status[old_node.status].discard(node_id)
         self._by_priority[old_node.priority].discard(node_id)
@@ -147,7 +159,21 @@ class AttributeIndex:
         """
         return self._by_type.get(node_type, set()).copy()
 
-    def rebuild(self, nodes: dict[str, Node]) -> None:
+    def count_by_status(self) -> dict[str, int]:
+        """Get the number of nodes per status (O(distinct statuses))."""
+        return {status: len(ids) for status, ids in self._by_status.items() if ids}
+
+    def count_by_priority(self) -> dict[str, int]:
+        """Get the number of nodes per priority (O(distinct priorities))."""
+        return {
+            priority: len(ids) for priority, ids in self._by_priority.items() if ids
+        }
+
+    def count_by_type(self) -> dict[str, int]:
+        """Get the number of nodes per type (O(distinct types))."""
+        return {node_type: len(ids) for node_type, ids in self._by_type.items() if ids}
+
+    def rebuild(self, nodes: Mapping[str, Node]) -> None:
         """
         Rebuild the entire index from a node dictionary.
 
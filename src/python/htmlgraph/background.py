@@ -0,0 +1,34 @@
+"""
+Detached background processes for hooks.
+
+Hooks run once per event and should return quickly; work whose result the
+hook doesn't need is handed to a child process that outlives it.
+"""
+
+from __future__ import annotations
+
+import subprocess
+import sys
+from typing import Any
+
+
+def popen_detached(args: list[str], **kwargs: Any) -> subprocess.Popen[bytes]:
+    """
+    Start a process detached from the caller.
+
+    The child gets its own session (a new detached process group on Windows)
+    so it keeps running after the hook exits. stdin defaults to /dev/null;
+    other keyword arguments are passed to subprocess.Popen.
+
+    Raises:
+        OSError: If the process could not be started
+    """
+    kwargs.setdefault("stdin", subprocess.DEVNULL)
+    kwargs.setdefault("close_fds", True)
+    if sys.platform == "win32":
+        kwargs["creationflags"] = (
+            subprocess.CREATE_NEW_PROCESS_GROUP | subprocess.DETACHED_PROCESS
+        )
+    else:
+        kwargs["start_new_session"] = True
+    return subprocess.Popen(args, **kwargs)
@@ -44,12 +44,60 @@ Analytics:
 """
 
 import argparse
+import functools
 import os
+import re
 import subprocess
 import sys
+from collections.abc import Callable
 from datetime import datetime
 from pathlib import Path
-from typing import Any
+from typing import Any, TypeVar
+
+_T = TypeVar("_T")
+
+# Selectors that pin a single node ID ("#feat-001" or "[id='feat-001']")
+_ID_SELECTOR_RE = re.compile(r"""#([\w-]+)|\[id=(['"]?)([^'"\]]+)\2\]""")
+
+
+class CliError(Exception):
+    """Raised by command handlers to abort with a message and exit code."""
+
+    def __init__(self, msg: str, code: int = 1):
+        self.msg = msg
+        self.code = code
+        super().__init__(msg)
+
+
+def cli_handler(
+    fn: Callable[[argparse.Namespace], _T],
+) -> Callable[[argparse.Namespace], _T]:
+    """Map handler errors to a formatted stderr message and exit code."""
+
+    @functools.wraps(fn)
+    def wrapper(args: argparse.Namespace) -> _T:
+        try:
+            return fn(args)
+        except CliError as e:
+            print(f"Error: {e.msg}", file=sys.stderr)
+            sys.exit(e.code)
+        except (FileNotFoundError, ValueError) as e:
+            print(f"Error: {e}", file=sys.stderr)
+            sys.exit(1)
+
+    return wrapper
+
+
+def write_stdout_bytes(data: bytes, flush: bool = True) -> None:
+    """Write pre-encoded output to stdout without a decode/encode round-trip."""
+    sys.stdout.flush()
+    buffer = getattr(sys.stdout, "buffer", None)
+    if buffer is None:
+        sys.stdout.write(data.decode("utf-8"))
+    else:
+        buffer.write(data)
+        if flush:
+            buffer.flush()
 
 
 def create_json_response(
@@ -248,12 +296,12 @@ fi
 
 if ! command -v htmlgraph &> /dev/null; then
   if command -v python3 &> /dev/null; then
-    python3 -m htmlgraph.git_events commit &> /dev/null &
+    HTMLGRAPH_SYNC_GIT_EVENTS=1 python3 -m htmlgraph.git_events commit &> /dev/null &
   fi
   exit 0
 fi
 
-htmlgraph git-event commit &> /dev/null &
+HTMLGRAPH_SYNC_GIT_EVENTS=1 htmlgraph git-event commit &> /dev/null &
 exit 0
 """
 
@@ -459,7 +507,7 @@ exit 0
         styles_src = Path(__file__).parent / "styles.css"
         styles_dest = graph_dir / "styles.css"
         if styles_src.exists() and not styles_dest.exists():
-            styles_dest.write_text(styles_src.read_text())
+            shutil.copyfile(styles_src, styles_dest)
 
         index_path = Path(args.dir) / "index.html"
         if not index_path.exists():
@@ -483,6 +531,9 @@ exit 0
                 ".htmlgraph/index.sqlite-wal",
                 ".htmlgraph/index.sqlite-shm",
                 ".htmlgraph/git-hook-errors.log",
+                ".htmlgraph/.status-index.json",
+                ".htmlgraph/drift-classification.log",
+                ".htmlgraph/drift-classification.pid",
             ],
         )
 
@@ -812,49 +863,198 @@ def cmd_install_hooks(args: argparse.Namespace) -> None:
         print("  htmlgraph install-hooks --disable <hook>    # Disable hook")
 
 
-def cmd_status(args: argparse.Namespace) -> None:
-    """Show status of the graph."""
+# Collection directory -> node type counted by `htmlgraph status`.
+_STATUS_COLLECTIONS = {
+    "features": "feature",
+    "bugs": "bug",
+    "chores": "chore",
+    "spikes": "spike",
+    "epics": "epic",
+    "phases": "phase",
+    "sessions": "session",
+    "tracks": "track",
+    "agents": "agent",
+}
+_STATUS_INDEX_NAME = ".status-index.json"
+_STATUS_INDEX_VERSION = 1
+# Files modified this recently are re-parsed next time rather than cached,
+# since a same-tick rewrite would not change their (mtime_ns, size) key.
+# Covers coarse (1-2 s) filesystem timestamps as well as fine-grained ones.
+_STATUS_RACY_WINDOW_NS = 2_000_000_000
+
+
+def _status_node_files(collection_dir: Path, nested: bool) -> dict[str, os.stat_result]:
+    """
+    Stat a collection's ``*.html`` files (and ``*/index.html`` if nested).
+
+    Files are returned in the order HtmlGraph loads them: flat files in
+    directory order, then nested index files.
+    """
+    files: dict[str, os.stat_result] = {}
+    nested_dirs: list[os.DirEntry[str]] = []
+    with os.scandir(collection_dir) as entries:
+        for entry in entries:
+            if entry.name.endswith(".html") and entry.is_file():
+                files[entry.name] = entry.stat()
+            elif nested and entry.is_dir():
+                nested_dirs.append(entry)
+    for entry in nested_dirs:
+        try:
+            files[f"{entry.name}/index.html"] = os.stat(
+                os.path.join(entry.path, "index.html")
+            )
+        except FileNotFoundError:
+            pass
+    return files
+
+
+def _load_status_counts(graph_dir: Path) -> tuple[dict[str, int], dict[str, int]]:
+    """
+    Count nodes per collection and per status using an incremental index.
+
+    Per-file ``(mtime_ns, size, id, type, status)`` entries are kept in
+    ``<graph_dir>/.status-index.json``. Only files whose stat key changed
+    since the last run are parsed; the index is rewritten atomically when
+    anything changed. Counting rules match ``SDK.<collection>.all()``,
+    including which file wins when two files share a node ID (the one
+    loaded last, in directory order).
+
+    Returns:
+        Tuple of (by_collection, by_status) counts
+    """
     import json
+    import tempfile
+    import time
     from collections import Counter
 
-    from htmlgraph.sdk import SDK
+    from htmlgraph.converter import _try_html_to_node
 
-    # Use SDK to query all collections
-    sdk = SDK(directory=args.graph_dir)
+    index_path = graph_dir / _STATUS_INDEX_NAME
+    try:
+        index = json.loads(index_path.read_bytes())
+        cached_collections = (
+            index["collections"]
+            if index.get("version") == _STATUS_INDEX_VERSION
+            else {}
+        )
+    except (OSError, ValueError, KeyError, TypeError, AttributeError):
+        cached_collections = {}
 
-    total = 0
+    now_ns = time.time_ns()
+    new_collections: dict[str, dict[str, list[Any]]] = {}
+    by_collection: dict[str, int] = {}
     by_status: Counter[str] = Counter()
-    by_collection = {}
+    dirty = False
+
+    for coll_name, node_type in _STATUS_COLLECTIONS.items():
+        collection_dir = graph_dir / coll_name
+        if not collection_dir.is_dir():
+            continue
+        cached = cached_collections.get(coll_name)
+        if not isinstance(cached, dict):
+            cached = {}
+        entries: dict[str, list[Any]] = {}
+        nodes: dict[str, tuple[str, str]] = {}
+
+        files = _status_node_files(collection_dir, coll_name == "tracks")
+        # Same order as HtmlGraph.reload() so duplicate IDs resolve the same way
+        for name, st in files.items():
+            entry = cached.get(name)
+            if not (
+                isinstance(entry, list)
+                and len(entry) == 5
+                and entry[0] == st.st_mtime_ns
+                and entry[1] == st.st_size
+            ):
+                node = _try_html_to_node(collection_dir / name)
+                if node is None:
+                    entry = [st.st_mtime_ns, st.st_size, None, None, None]
+                else:
+                    entry = [
+                        st.st_mtime_ns,
+                        st.st_size,
+                        node.id,
+                        node.type,
+                        node.status,
+                    ]
+                dirty = True
+            if now_ns - st.st_mtime_ns >= _STATUS_RACY_WINDOW_NS:
+                entries[name] = entry
+            else:
+                dirty = True
+            if entry[2] is not None:
+                nodes[entry[2]] = (entry[3], entry[4])
+
+        if len(entries) != len(cached):
+            dirty = True
+        new_collections[coll_name] = entries
+
+        count = 0
+        for type_, status in nodes.values():
+            if type_ == node_type:
+                count += 1
+                by_status[status] += 1
+        if count > 0:
+            by_collection[coll_name] = count
+
+    if dirty or new_collections.keys() != cached_collections.keys():
+        payload = json.dumps(
+            {"version": _STATUS_INDEX_VERSION, "collections": new_collections}
+        ).encode("utf-8")
+        fd, tmp_name = tempfile.mkstemp(
+            dir=graph_dir, prefix=_STATUS_INDEX_NAME, suffix=".tmp"
+        )
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(payload)
+            os.replace(tmp_name, index_path)
+        except OSError:
+            try:
+                os.unlink(tmp_name)
+            except OSError:
+                pass
+
+    return by_collection, dict(by_status)
+
+
+def cmd_status(args: argparse.Namespace) -> None:
+    """Show status of the graph."""
+    import json
+    from collections import Counter
 
     # All available collections
-    collections = [
-        "features",
-        "bugs",
-        "chores",
-        "spikes",
-        "epics",
-        "phases",
-        "sessions",
-        "tracks",
-        "agents",
-    ]
+    collections = list(_STATUS_COLLECTIONS)
 
-    for coll_name in collections:
-        coll = getattr(sdk, coll_name)
-        try:
-            nodes = coll.all()
-            count = len(nodes)
-            if count > 0:
-                by_collection[coll_name] = count
-                total += count
-
-                # Count by status
-                for node in nodes:
-                    status = getattr(node, "status", "unknown")
-                    by_status[status] += 1
-        except Exception:
-            # Collection might not exist yet
-            pass
+    by_collection: dict[str, int]
+    try:
+        # Fast path: only files changed since the last run are parsed
+        by_collection, counts = _load_status_counts(Path(args.graph_dir))
+        by_status: Counter[str] = Counter(counts)
+    except OSError:
+        from htmlgraph.sdk import SDK
+
+        # Use SDK to query all collections
+        sdk = SDK(directory=args.graph_dir)
+        by_status = Counter()
+        by_collection = {}
+
+        for coll_name in collections:
+            coll = getattr(sdk, coll_name)
+            try:
+                nodes = coll.all()
+                count = len(nodes)
+                if count > 0:
+                    by_collection[coll_name] = count
+
+                    # Count by status
+                    for node in nodes:
+                        status = getattr(node, "status", "unknown")
+                        by_status[status] += 1
+            except Exception:
+                # Collection might not exist yet
+                pass
+
+    total = sum(by_collection.values())
 
     # Output based on format flag
     if args.format == "json":
@@ -869,34 +1069,38 @@ def cmd_status(args: argparse.Namespace) -> None:
         )
         print(json.dumps(response, indent=2))
     else:
-        # Text output (default)
+        # Text output (default), emitted with a single write
+        lines: list[str] = []
         if not args.quiet:
-            print(f"HtmlGraph Status: {args.graph_dir}")
-            print(f"{'=' * 40}")
+            lines.append(f"HtmlGraph Status: {args.graph_dir}")
+            lines.append(f"{'=' * 40}")
 
-        print(f"Total nodes: {total}")
+        lines.append(f"Total nodes: {total}")
 
         if not args.quiet:
-            print("\nBy Collection:")
+            lines.append("\nBy Collection:")
             for coll, count in sorted(by_collection.items()):
-                print(f"  {coll}: {count}")
-            print("\nBy Status:")
+                lines.append(f"  {coll}: {count}")
+            lines.append("\nBy Status:")
             for status, count in sorted(by_status.items()):
-                print(f"  {status}: {count}")
+                lines.append(f"  {status}: {count}")
 
         # Verbose output
         if args.verbose >= 1:
-            print("\n--- Verbose Details ---")
-            print(f"Graph directory: {args.graph_dir}")
-            print(f"Collections scanned: {len(collections)}")
-            print(f"Collections with data: {len(by_collection)}")
+            lines.append("\n--- Verbose Details ---")
+            lines.append(f"Graph directory: {args.graph_dir}")
+            lines.append(f"Collections scanned: {len(collections)}")
+            lines.append(f"Collections with data: {len(by_collection)}")
 
         if args.verbose >= 2:
-            print("\nAll collections checked:")
+            lines.append("\nAll collections checked:")
             for coll_name in collections:
                 count = by_collection.get(coll_name, 0)
                 marker = "✓" if count > 0 else "○"
-                print(f"  {marker} {coll_name}: {count}")
+                lines.append(f"  {marker} {coll_name}: {count}")
+
+        lines.append("")
+        sys.stdout.write("\n".join(lines))
 
 
 def cmd_debug(args: argparse.Namespace) -> None:
@@ -988,34 +1192,89 @@ def cmd_debug(args: argparse.Namespace) -> None:
 
 def cmd_query(args: argparse.Namespace) -> None:
     """Query nodes with CSS selector."""
-    import json
-
-    from htmlgraph.converter import node_to_dict
-    from htmlgraph.graph import HtmlGraph
+    from htmlgraph.graph import CompiledQuery, HtmlGraph
 
     graph_dir = Path(args.graph_dir)
     if not graph_dir.exists():
         print(f"Error: {graph_dir} not found.", file=sys.stderr)
         sys.exit(1)
 
-    results = []
-    for collection_dir in graph_dir.iterdir():
-        if collection_dir.is_dir() and not collection_dir.name.startswith("."):
-            graph = HtmlGraph(collection_dir, auto_load=True)
-            for node in graph.query(args.selector):
-                data = node_to_dict(node)
-                data["_collection"] = collection_dir.name
-                results.append(data)
-
-    if args.format == "json":
-        print(json.dumps(results, indent=2, default=str))
-    else:
-        for result in results:  # type: dict[str, Any]
-            status = result.get("status", "?")
-            priority = result.get("priority", "?")
-            print(
-                f"[{result['_collection']}] {result['id']}: {result['title']} ({status}, {priority})"
+    as_json = args.format == "json"
+    if as_json:
+        from htmlgraph.converter import dumps_json_bytes, node_to_json_bytes
+
+    # Parse the selector once and share it across every collection's graph
+    compiled = CompiledQuery(selector=args.selector)
+    # An ID-only selector can be answered by loading at most one file per
+    # collection (node files are named <id>.html) instead of all of them
+    id_match = _ID_SELECTOR_RE.fullmatch(args.selector.strip())
+    node_id = (id_match.group(1) or id_match.group(3)) if id_match else None
+
+    # JSON is streamed one node at a time so peak memory stays bounded by a
+    # single node and consumers (e.g. jq) can start reading immediately.
+    emitted = 0
+    rows: list[tuple[str, str, str, str, str]] = []
+    try:
+        # DirEntry.is_dir() reuses the d_type from readdir, avoiding a stat per entry
+        with os.scandir(graph_dir) as entries:
+            for entry in entries:
+                if not entry.is_dir() or entry.name.startswith("."):
+                    continue
+                if node_id is not None:
+                    node = HtmlGraph(Path(entry.path)).get_or_load(node_id)
+                    matches = (
+                        [node]
+                        if node is not None
+                        and node.id == node_id
+                        and compiled.matches(node)
+                        else []
+                    )
+                else:
+                    graph = HtmlGraph(Path(entry.path), auto_load=True)
+                    matches = graph.query(compiled)
+                if as_json:
+                    # Splice "_collection" into each node's serialized object
+                    # instead of copying every node into a merged dict
+                    collection_suffix = (
+                        b',"_collection":' + dumps_json_bytes(entry.name) + b"}"
+                    )
+                for node in matches:
+                    if as_json:
+                        write_stdout_bytes(
+                            (b",\n" if emitted else b"[\n")
+                            + node_to_json_bytes(node)[:-1]
+                            + collection_suffix,
+                            flush=False,
+                        )
+                        emitted += 1
+                    else:
+                        # Text output only needs four fields; skip the model_dump copy
+                        rows.append(
+                            (
+                                entry.name,
+                                node.id,
+                                node.title,
+                                getattr(node, "status", "?"),
+                                getattr(node, "priority", "?"),
+                            )
+                        )
+    except Exception:
+        # Close an array that was already started so stdout stays valid
+        # JSON, then let the error surface (non-zero exit, message on stderr)
+        if as_json and emitted:
+            write_stdout_bytes(b"\n]\n")
+        raise
+
+    if as_json:
+        write_stdout_bytes(b"\n]\n" if emitted else b"[]\n")
+    elif rows:
+        sys.stdout.write(
+            "\n".join(
+                f"[{collection}] {node_id}: {title} ({status}, {priority})"
+                for collection, node_id, title, status, priority in rows
             )
+            + "\n"
+        )
 
 
 # =============================================================================
@@ -2477,9 +2736,12 @@ def cmd_git_event(args: argparse.Namespace) -> None:
         log_git_commit,
         log_git_merge,
         log_git_push,
+        spawn_git_commit_logger,
     )
 
     if args.event_type == "commit":
+        if spawn_git_commit_logger():
+            return
         success = log_git_commit()
         if not success:
             sys.exit(1)
@@ -2933,9 +3195,7 @@ def cmd_orchestrator_enable(args: argparse.Namespace) -> None:
     from htmlgraph.orchestrator_mode import OrchestratorModeManager
 
     manager = OrchestratorModeManager(args.graph_dir)
-    level: Literal["strict", "guidance"] = (
-        args.level if hasattr(args, "level") and args.level else "strict"
-    )
+    level: Literal["strict", "guidance"] = getattr(args, "level", None) or "strict"
     manager.enable(level=level)
 
     level_text = "strict enforcement" if level == "strict" else "guidance mode"
@@ -3758,28 +4018,32 @@ def cmd_track_delete(args: argparse.Namespace) -> None:
         print(f"  Removed: {args.graph_dir}/tracks/{args.track_id}/")
 
 
+# Fallback (rare) landing page when the packaged dashboard template is missing.
+_DEFAULT_INDEX_HTML = (
+    b"<!doctype html><html><head><meta charset='utf-8'><title>HtmlGraph</title></head>"
+    b"<body><h1>HtmlGraph</h1><p>Run <code>htmlgraph serve</code> and open "
+    b"<code>http://localhost:8080</code>.</p></body></html>"
+)
+
+
 def create_default_index(path: Path) -> None:
     """
     Create a default index.html for new projects.
 
     The dashboard UI evolves quickly; to keep new projects consistent with the
     current dashboard, prefer a packaged HTML template over a hardcoded string.
+    The template is copied byte-for-byte (no decode/encode round-trip).
     """
+    import shutil
+
     template = Path(__file__).parent / "dashboard.html"
     try:
-        if template.exists():
-            path.write_text(template.read_text(encoding="utf-8"), encoding="utf-8")
-            return
-    except Exception:
+        shutil.copyfile(template, path)
+        return
+    except OSError:
         pass
 
-    # Fallback (rare): minimal landing page.
-    path.write_text(
-        "<!doctype html><html><head><meta charset='utf-8'><title>HtmlGraph</title></head>"
-        "<body><h1>HtmlGraph</h1><p>Run <code>htmlgraph serve</code> and open "
-        "<code>http://localhost:8080</code>.</p></body></html>",
-        encoding="utf-8",
-    )
+    path.write_bytes(_DEFAULT_INDEX_HTML)
 
 
 def install_htmlgraph_plugin(args: argparse.Namespace) -> None:
@@ -4111,6 +4375,21 @@ def cmd_claude(args: argparse.Namespace) -> None:
         sys.exit(1)
 
 
+# Session subcommand handlers. Aliases share the same handler object.
+SESSION_DISPATCH: dict[str, Callable[[argparse.Namespace], None]] = {
+    "start": cmd_session_start,
+    "end": cmd_session_end,
+    "list": cmd_session_list,
+    "start-info": cmd_session_start_info,
+    "status-report": cmd_session_status_report,
+    "resume": cmd_session_status_report,
+    "dedupe": cmd_session_dedupe,
+    "link": cmd_session_link,
+    "validate-attribution": cmd_session_validate_attribution,
+    "handoff": cmd_session_handoff,
+}
+
+
 def main() -> None:
     parser = argparse.ArgumentParser(
         description="HtmlGraph - HTML is All You Need",
@@ -5609,26 +5888,9 @@ For more help: https://github.com/Shakes-tzd/htmlgraph
     elif args.command == "query":
         cmd_query(args)
     elif args.command == "session":
-        if args.session_command == "start":
-            cmd_session_start(args)
-        elif args.session_command == "end":
-            cmd_session_end(args)
-        elif args.session_command == "list":
-            cmd_session_list(args)
-        elif args.session_command == "start-info":
-            cmd_session_start_info(args)
-        elif (
-            args.session_command == "status-report" or args.session_command == "resume"
-        ):
-            cmd_session_status_report(args)
-        elif args.session_command == "dedupe":
-            cmd_session_dedupe(args)
-        elif args.session_command == "link":
-            cmd_session_link(args)
-        elif args.session_command == "validate-attribution":
-            cmd_session_validate_attribution(args)
-        elif args.session_command == "handoff":
-            cmd_session_handoff(args)
+        session_handler = SESSION_DISPATCH.get(args.session_command)
+        if session_handler is not None:
+            session_handler(args)
         else:
             session_parser.print_help()
             sys.exit(1)
@@ -5857,6 +6119,7 @@ For more help: https://github.com/Shakes-tzd/htmlgraph
 # =============================================================================
 
 
+@cli_handler
 def cmd_deploy_init(args: argparse.Namespace) -> None:
     """Initialize deployment configuration."""
     from htmlgraph.deploy import create_deployment_config_template
@@ -5864,15 +6127,12 @@ def cmd_deploy_init(args: argparse.Namespace) -> None:
     output_path = Path(args.output or "htmlgraph-deploy.toml")
 
     if output_path.exists() and not args.force:
-        print(
-            f"Error: {output_path} already exists. Use --force to overwrite.",
-            file=sys.stderr,
-        )
-        sys.exit(1)
+        raise CliError(f"{output_path} already exists. Use --force to overwrite.")
 
     create_deployment_config_template(output_path)
 
 
+@cli_handler
 def cmd_deploy_run(args: argparse.Namespace) -> None:
     """Run deployment process."""
     from htmlgraph.deploy import Deployer, DeploymentConfig
@@ -5881,18 +6141,15 @@ def cmd_deploy_run(args: argparse.Namespace) -> None:
     config_path = Path(args.config or "htmlgraph-deploy.toml")
 
     if not config_path.exists():
-        print(f"Error: Configuration file not found: {config_path}", file=sys.stderr)
-        print(
-            "Run 'htmlgraph deploy init' to create a template configuration.",
-            file=sys.stderr,
+        raise CliError(
+            f"Configuration file not found: {config_path}\n"
+            "Run 'htmlgraph deploy init' to create a template configuration."
         )
-        sys.exit(1)
 
     try:
         config = DeploymentConfig.from_toml(config_path)
     except Exception as e:
-        print(f"Error loading configuration: {e}", file=sys.stderr)
-        sys.exit(1)
+        raise CliError(f"Failed to load configuration: {e}") from e
 
     # Handle shortcut flags
     skip_steps = []
@@ -6004,44 +6261,53 @@ def cmd_sync_docs(args: argparse.Namespace) -> int:
 # =============================================================================
 
 
+@cli_handler
 def cmd_archive_create(args: argparse.Namespace) -> None:
     """Create archive from old entities."""
     from pathlib import Path
 
     from htmlgraph.archive import ArchiveManager
 
-    htmlgraph_dir = Path(args.graph_dir).resolve()
+    graph_dir, older_than, period, dry_run = (
+        args.graph_dir,
+        args.older_than,
+        args.period,
+        args.dry_run,
+    )
+    htmlgraph_dir = Path(graph_dir).resolve()
 
     if not htmlgraph_dir.exists():
-        print(f"Error: Directory not found: {htmlgraph_dir}", file=sys.stderr)
-        sys.exit(1)
+        raise CliError(f"Directory not found: {htmlgraph_dir}")
 
     manager = ArchiveManager(htmlgraph_dir)
 
     # Run archive operation
     result = manager.archive_entities(
-        older_than_days=args.older_than,
-        period=args.period,
-        dry_run=args.dry_run,
+        older_than_days=older_than,
+        period=period,
+        dry_run=dry_run,
     )
+    archive_files = result["archive_files"]
+    details = result["details"]
 
     if result["dry_run"]:
         print("\n🔍 DRY RUN - Preview (no changes made)\n")
         print(f"Would archive: {result['would_archive']} entities")
-        print(f"Archive files: {len(result['archive_files'])}")
+        print(f"Archive files: {len(archive_files)}")
         print("\nDetails:")
-        for archive_key, count in result["details"].items():
+        for archive_key, count in details.items():
             print(f"  {archive_key}: {count} entities")
     else:
         print(f"\n✅ Archived {result['archived_count']} entities")
-        print(f"Created {len(result['archive_files'])} archive file(s):")
-        for archive_file in result["archive_files"]:
-            count = result["details"].get(archive_file.replace(".html", ""), 0)
+        print(f"Created {len(archive_files)} archive file(s):")
+        for archive_file in archive_files:
+            count = details.get(archive_file.replace(".html", ""), 0)
             print(f"  - {archive_file} ({count} entities)")
 
     manager.close()
 
 
+@cli_handler
 def cmd_archive_search(args: argparse.Namespace) -> None:
     """Search archived entities."""
     import json
@@ -6049,36 +6315,43 @@ def cmd_archive_search(args: argparse.Namespace) -> None:
 
     from htmlgraph.archive import ArchiveManager
 
-    htmlgraph_dir = Path(args.graph_dir).resolve()
+    graph_dir, query, limit, output_format = (
+        args.graph_dir,
+        args.query,
+        args.limit,
+        args.format,
+    )
+    htmlgraph_dir = Path(graph_dir).resolve()
 
     if not htmlgraph_dir.exists():
-        print(f"Error: Directory not found: {htmlgraph_dir}", file=sys.stderr)
-        sys.exit(1)
+        raise CliError(f"Directory not found: {htmlgraph_dir}")
 
     manager = ArchiveManager(htmlgraph_dir)
 
     # Search archives
-    results = manager.search(args.query, limit=args.limit)
+    results = manager.search(query, limit=limit)
 
-    if args.format == "json":
-        print(json.dumps({"query": args.query, "results": results}, indent=2))
+    if output_format == "json":
+        print(json.dumps({"query": query, "results": results}, indent=2))
     else:
-        print(f"\n🔍 Search results for: '{args.query}'\n")
+        print(f"\n🔍 Search results for: '{query}'\n")
         print(f"Found {len(results)} result(s):\n")
 
         for i, result in enumerate(results, 1):
+            description = result["description_snippet"]
             print(f"{i}. {result['entity_id']} ({result['entity_type']})")
             print(f"   Archive: {result['archive_file']}")
             print(f"   Status: {result['status']}")
             print(f"   Title: {result['title_snippet']}")
-            if result["description_snippet"]:
-                print(f"   Description: {result['description_snippet']}")
+            if description:
+                print(f"   Description: {description}")
             print(f"   Relevance: {result['rank']:.2f}")
             print()
 
     manager.close()
 
 
+@cli_handler
 def cmd_archive_stats(args: argparse.Namespace) -> None:
     """Show archive statistics."""
     import json
@@ -6089,8 +6362,7 @@ def cmd_archive_stats(args: argparse.Namespace) -> None:
     htmlgraph_dir = Path(args.graph_dir).resolve()
 
     if not htmlgraph_dir.exists():
-        print(f"Error: Directory not found: {htmlgraph_dir}", file=sys.stderr)
-        sys.exit(1)
+        raise CliError(f"Directory not found: {htmlgraph_dir}")
 
     manager = ArchiveManager(htmlgraph_dir)
 
@@ -6112,42 +6384,43 @@ def cmd_archive_stats(args: argparse.Namespace) -> None:
     manager.close()
 
 
+@cli_handler
 def cmd_archive_restore(args: argparse.Namespace) -> None:
     """Restore archived entity."""
     from pathlib import Path
 
     from htmlgraph.archive import ArchiveManager
 
-    htmlgraph_dir = Path(args.graph_dir).resolve()
+    graph_dir, entity_id = args.graph_dir, args.entity_id
+    htmlgraph_dir = Path(graph_dir).resolve()
 
     if not htmlgraph_dir.exists():
-        print(f"Error: Directory not found: {htmlgraph_dir}", file=sys.stderr)
-        sys.exit(1)
+        raise CliError(f"Directory not found: {htmlgraph_dir}")
 
     manager = ArchiveManager(htmlgraph_dir)
 
     # Restore entity
-    success = manager.unarchive(args.entity_id)
-
-    if success:
-        print(f"✅ Restored {args.entity_id} from archive")
-    else:
-        print(f"❌ Entity not found in archives: {args.entity_id}", file=sys.stderr)
-        sys.exit(1)
+    success = manager.unarchive(entity_id)
 
     manager.close()
 
+    if not success:
+        raise CliError(f"Entity not found in archives: {entity_id}")
+
+    print(f"✅ Restored {entity_id} from archive")
+
 
+@cli_handler
 def cmd_archive_list(args: argparse.Namespace) -> None:
     """List all archive files."""
     import json
     from pathlib import Path
 
-    htmlgraph_dir = Path(args.graph_dir).resolve()
+    graph_dir, output_format = args.graph_dir, args.format
+    htmlgraph_dir = Path(graph_dir).resolve()
 
     if not htmlgraph_dir.exists():
-        print(f"Error: Directory not found: {htmlgraph_dir}", file=sys.stderr)
-        sys.exit(1)
+        raise CliError(f"Directory not found: {htmlgraph_dir}")
 
     archive_dir = htmlgraph_dir / "archives"
 
@@ -6155,23 +6428,22 @@ def cmd_archive_list(args: argparse.Namespace) -> None:
         print("No archives found")
         return
 
-    archive_files = sorted(archive_dir.glob("*.html"))
+    archive_stats = [(f.name, f.stat()) for f in sorted(archive_dir.glob("*.html"))]
 
-    if args.format == "json":
+    if output_format == "json":
         file_list = [
             {
-                "filename": f.name,
-                "size_kb": f.stat().st_size / 1024,
-                "modified": f.stat().st_mtime,
+                "filename": name,
+                "size_kb": st.st_size / 1024,
+                "modified": st.st_mtime,
             }
-            for f in archive_files
+            for name, st in archive_stats
         ]
         print(json.dumps({"archives": file_list}, indent=2))
     else:
-        print(f"\n📦 Archive Files ({len(archive_files)})\n")
-        for f in archive_files:
-            size_kb = f.stat().st_size / 1024
-            print(f"  - {f.name} ({size_kb:.1f} KB)")
+        print(f"\n📦 Archive Files ({len(archive_stats)})\n")
+        for name, st in archive_stats:
+            print(f"  - {name} ({st.st_size / 1024:.1f} KB)")
 
 
 if __name__ == "__main__":
@@ -4,11 +4,19 @@ Bidirectional converters between HTML files and Pydantic models.
 Provides:
 - html_to_node: Parse HTML file into Node model
 - node_to_html: Write Node model to HTML file
+- dumps_json_bytes / node_to_json_bytes / session_to_json_bytes: Fast JSON export
 - Preserves all semantic information
 - Handles edge cases (missing fields, malformed HTML)
 """
 
+import fnmatch
+import json
 import logging
+import os
+import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime
 from pathlib import Path
 from typing import Any, cast
 
@@ -22,10 +30,27 @@ from htmlgraph.models import (
     Spike,
     Step,
 )
-from htmlgraph.parser import HtmlParser
+from htmlgraph.parser import _O_BINARY, HtmlParser, _parse_iso
+
+try:
+    import orjson
+
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
 
 logger = logging.getLogger(__name__)
 
+# Below this many files, thread pool startup costs more than it saves.
+_PARALLEL_LOAD_THRESHOLD = 8
+_MAX_LOAD_WORKERS = 32
+
+# Anything stat-keyed whose mtime is this close to "now" is racy: a change
+# within the same timestamp tick keeps the same mtime. Like git's racy-index
+# check, this has to cover the coarsest common granularity (2 s on FAT,
+# 1 s on HFS+ and ext3), not just sub-millisecond ext4/APFS timestamps.
+_RACY_MTIME_WINDOW_NS = 2_000_000_000
+
 
 def html_to_node(filepath: Path | str) -> Node:
     """
@@ -45,7 +70,21 @@ def html_to_node(filepath: Path | str) -> Node:
     if not filepath.exists():
         raise FileNotFoundError(f"HTML file not found: {filepath}")
 
-    parser = HtmlParser.from_file(filepath)
+    return _parser_to_node(HtmlParser.from_file(filepath), filepath)
+
+
+def _read_node_file(filepath: Path | str) -> Node:
+    """
+    html_to_node() for paths the converter built itself.
+
+    Skips the Path() coercion and the exists() stat; a missing file still
+    raises FileNotFoundError, from the read.
+    """
+    return _parser_to_node(HtmlParser.from_file(filepath), filepath)
+
+
+def _parser_to_node(parser: HtmlParser, filepath: Path | str) -> Node:
+    """Build a Node (or subclass) from an already-loaded parser."""
     data = parser.parse_full_node()
 
     # Validate required fields
@@ -91,6 +130,25 @@ def html_to_node(filepath: Path | str) -> Node:
     return cast(Node, model_class(**data))
 
 
+def _write_html_file(filepath: Path, html_content: str) -> None:
+    """
+    Write HTML text as UTF-8 with raw os-level writes.
+
+    Counterpart of parser.read_html_file(): skips the TextIOWrapper and
+    buffering layers behind Path.write_text(), with the same platform
+    newline translation.
+    """
+    if os.linesep != "\n":
+        html_content = html_content.replace("\n", os.linesep)
+    data = memoryview(html_content.encode("utf-8"))
+    fd = os.open(filepath, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | _O_BINARY, 0o666)
+    try:
+        while data:
+            data = data[os.write(fd, data) :]
+    finally:
+        os.close(fd)
+
+
 def node_to_html(
     node: Node,
     filepath: Path | str,
@@ -110,16 +168,66 @@ def node_to_html(
         Path to written file
     """
     filepath = Path(filepath)
+    html_content = node.to_html(stylesheet_path=stylesheet_path)
 
-    if create_dirs:
+    # The parent almost always exists already, so only mkdir when the
+    # write fails for lack of it rather than spending a syscall per save
+    try:
+        _write_html_file(filepath, html_content)
+    except FileNotFoundError:
+        if not create_dirs:
+            raise
         filepath.parent.mkdir(parents=True, exist_ok=True)
-
-    html_content = node.to_html(stylesheet_path=stylesheet_path)
-    filepath.write_text(html_content, encoding="utf-8")
+        _write_html_file(filepath, html_content)
 
     return filepath
 
 
+# Fields whose rendering is confined to the <article> attributes and the
+# header badges, so they can be patched in place without a full re-render.
+_PATCHABLE_FIELDS = frozenset({"status", "priority", "updated"})
+
+
+def _patch_rendered_fields(
+    html: str, old: Node, new: Node, stylesheet_path: str
+) -> str | None:
+    """
+    Patch status/priority/updated directly in rendered node HTML.
+
+    The substituted fragments mirror Node.to_html(). Returns None when any
+    fragment does not occur exactly once (hand-edited file, ambiguous
+    content), so the caller can fall back to a full render.
+    """
+    if f'<link rel="stylesheet" href="{stylesheet_path}">' not in html:
+        return None
+
+    def status_badge(status: str) -> str:
+        label = status.replace("-", " ").title()
+        return f'<span class="badge status-{status}">{label}</span>'
+
+    def priority_badge(priority: str) -> str:
+        label = priority.title()
+        return f'<span class="badge priority-{priority}">{label} Priority</span>'
+
+    replacements = [
+        (f'data-status="{old.status}"', f'data-status="{new.status}"'),
+        (status_badge(old.status), status_badge(new.status)),
+        (f'data-priority="{old.priority}"', f'data-priority="{new.priority}"'),
+        (priority_badge(old.priority), priority_badge(new.priority)),
+        (
+            f'data-updated="{old.updated.isoformat()}"',
+            f'data-updated="{new.updated.isoformat()}"',
+        ),
+    ]
+    for before, after in replacements:
+        if before == after:
+            continue
+        if html.count(before) != 1:
+            return None
+        html = html.replace(before, after)
+    return html
+
+
 def update_node_html(
     filepath: Path | str,
     updates: dict[str, Any],
@@ -139,16 +247,27 @@ def update_node_html(
     Example:
         update_node_html("task.html", {"status": "done"})
     """
-    # Load existing node
-    node = html_to_node(filepath)
+    filepath = Path(filepath)
+    if not filepath.exists():
+        raise FileNotFoundError(f"HTML file not found: {filepath}")
+
+    # Read once; the same text feeds the parser and the in-place patch
+    original_html = filepath.read_text(encoding="utf-8")
+    old_node = _parser_to_node(HtmlParser.from_string(original_html), filepath)
 
-    # Apply updates
-    for key, value in updates.items():
-        if hasattr(node, key):
-            setattr(node, key, value)
+    # Apply all known fields in one copy (unknown keys are ignored)
+    fields = type(old_node).model_fields
+    node = old_node.model_copy(update={k: v for k, v in updates.items() if k in fields})
 
-    # Write back
-    node_to_html(node, filepath, stylesheet_path=stylesheet_path)
+    html_content = None
+    if updates.keys() <= _PATCHABLE_FIELDS:
+        html_content = _patch_rendered_fields(
+            original_html, old_node, node, stylesheet_path
+        )
+    if html_content is None:
+        html_content = node.to_html(stylesheet_path=stylesheet_path)
+
+    _write_html_file(filepath, html_content)
 
     return node
 
@@ -159,66 +278,89 @@ def merge_nodes(base: Node, overlay: Node) -> Node:
 
     Useful for updating nodes while preserving unspecified fields.
 
+    Only fields explicitly set on the overlay are applied. Edges are merged
+    per relationship type and properties are merged key by key; steps and
+    all other fields are replaced.
+
     Args:
         base: Base node with default values
         overlay: Node with values to apply over base
 
     Returns:
-        New Node instance with merged values
+        New Node instance (same class as base) with merged values
     """
-    base_dict = base.model_dump()
-    overlay_dict = overlay.model_dump(exclude_unset=True)
+    base_fields = type(base).model_fields
+    update: dict[str, Any] = {}
 
-    # Deep merge for nested structures
-    for key, value in overlay_dict.items():
+    for key in overlay.model_fields_set:
+        if key not in base_fields:
+            continue
+        value = getattr(overlay, key)
         if key == "edges" and value:
-            # Merge edge dictionaries
-            base_edges = base_dict.get("edges", {})
-            for rel_type, edge_list in value.items():
-                if rel_type in base_edges:
-                    # Replace edges of same type
-                    base_edges[rel_type] = edge_list
-                else:
-                    base_edges[rel_type] = edge_list
-            base_dict["edges"] = base_edges
+            # Replace edges of the same relationship type, keep the others
+            update["edges"] = {**base.edges, **value}
         elif key == "steps" and value:
             # Replace steps entirely
-            base_dict["steps"] = value
+            update["steps"] = list(value)
         elif key == "properties" and value:
             # Merge properties
-            base_dict.setdefault("properties", {}).update(value)
+            update["properties"] = {**base.properties, **value}
         else:
-            base_dict[key] = value
+            update[key] = value
 
-    return Node.from_dict(base_dict)
+    # The shallow copy shares containers with base and overlay; a deep copy of
+    # the merged node makes the result independent of both
+    return base.model_copy(update=update).model_copy(deep=True)
 
 
 def node_to_dict(node: Node) -> dict[str, Any]:
     """
     Convert Node to a plain dictionary (JSON-serializable).
 
-    Useful for API responses or JSON export.
+    Useful for API responses or JSON export. Datetimes (including nested
+    edge and step timestamps) are serialized to ISO strings by Pydantic's
+    Rust core in a single pass.
     """
-    data = node.model_dump()
+    result: dict[str, Any] = node.model_dump(mode="json")
+    return result
 
-    # Convert datetime objects to ISO strings
-    for key in ["created", "updated"]:
-        if key in data and data[key]:
-            data[key] = data[key].isoformat()
 
-    # Convert edges
-    for rel_type, edges in data.get("edges", {}).items():
-        for edge in edges:
-            if edge.get("since"):
-                edge["since"] = edge["since"].isoformat()
+def _json_default(value: Any) -> Any:
+    """Fallback encoder for the stdlib json path (datetimes as ISO strings)."""
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    return str(value)
 
-    # Convert steps
-    for step in data.get("steps", []):
-        if step.get("timestamp"):
-            step["timestamp"] = step["timestamp"].isoformat()
 
-    result: dict[str, Any] = data
-    return result
+def dumps_json_bytes(obj: Any, indent: bool = False) -> bytes:
+    """
+    Serialize an object to UTF-8 JSON bytes.
+
+    Uses orjson when installed (datetimes are encoded natively), otherwise
+    falls back to the stdlib json module. Unknown values are encoded with str().
+
+    Args:
+        obj: Object to serialize
+        indent: Pretty-print with two-space indentation
+    """
+    if HAS_ORJSON:
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, option=option, default=str)
+    return json.dumps(obj, indent=2 if indent else None, default=_json_default).encode(
+        "utf-8"
+    )
+
+
+def node_to_json_bytes(node: Node) -> bytes:
+    """
+    Serialize a Node straight to JSON bytes.
+
+    Uses Pydantic's Rust serializer, skipping the intermediate dict copy
+    made by node_to_dict().
+    """
+    return node.model_dump_json().encode("utf-8")
 
 
 def dict_to_node(data: dict[str, Any]) -> Node:
@@ -227,31 +369,130 @@ def dict_to_node(data: dict[str, Any]) -> Node:
 
     Handles datetime string parsing.
     """
-    from datetime import datetime
-
     # Parse datetime strings
-    for key in ["created", "updated"]:
-        if key in data and isinstance(data[key], str):
-            data[key] = datetime.fromisoformat(data[key].replace("Z", "+00:00"))
+    for key in ("created", "updated"):
+        value = data.get(key)
+        if type(value) is str:
+            data[key] = _parse_iso(value)
 
     # Parse edge datetimes
     for edges in data.get("edges", {}).values():
         for edge in edges:
-            if isinstance(edge.get("since"), str):
-                edge["since"] = datetime.fromisoformat(
-                    edge["since"].replace("Z", "+00:00")
-                )
+            since = edge.get("since")
+            if type(since) is str:
+                edge["since"] = _parse_iso(since)
 
     # Parse step datetimes
     for step in data.get("steps", []):
-        if isinstance(step.get("timestamp"), str):
-            step["timestamp"] = datetime.fromisoformat(
-                step["timestamp"].replace("Z", "+00:00")
-            )
+        timestamp = step.get("timestamp")
+        if type(timestamp) is str:
+            step["timestamp"] = _parse_iso(timestamp)
 
     return Node.from_dict(data)
 
 
+class _ParsedFileCache:
+    """
+    Parsed models keyed by file path, valid while (mtime_ns, size) match.
+
+    Lets repeated loads (e.g. watcher-driven reloads) re-parse only files
+    that changed. Cached models are private; callers always get deep
+    copies, so in-memory edits never leak into a later reload. Files
+    modified within _RACY_MTIME_WINDOW_NS are not cached, since a
+    same-tick rewrite would keep the same key.
+    """
+
+    __slots__ = ("_entries",)
+
+    def __init__(self) -> None:
+        self._entries: dict[str, tuple[tuple[int, int], Any]] = {}
+
+    def get_or_parse(self, filepath: str, parse: Callable[[str], Any]) -> Any:
+        """Return a copy of the cached model for filepath, parsing on a miss."""
+        st = os.stat(filepath)
+        key = (st.st_mtime_ns, st.st_size)
+        cached = self._entries.get(filepath)
+        if cached is not None and cached[0] == key:
+            model = cached[1]
+            return None if model is None else model.model_copy(deep=True)
+
+        model = parse(filepath)
+        if time.time_ns() - st.st_mtime_ns >= _RACY_MTIME_WINDOW_NS:
+            self._entries[filepath] = (
+                key,
+                None if model is None else model.model_copy(deep=True),
+            )
+        return model
+
+    def discard(self, filepath: str) -> None:
+        """Forget filepath (after writing or deleting it)."""
+        self._entries.pop(filepath, None)
+
+    def retain(self, filepaths: list[str]) -> None:
+        """Drop entries for files no longer present."""
+        keep = set(filepaths)
+        for filepath in [f for f in self._entries if f not in keep]:
+            del self._entries[filepath]
+
+
+def _parallel_map(
+    func: Callable[[Any], Any], items: list[Any], max_workers: int | None = None
+) -> list[Any]:
+    """
+    Apply func to each item, on a thread pool when there are enough items.
+
+    Reads dominate for small node files, so overlapping them hides most of
+    the I/O latency. Results keep the order of items.
+
+    Args:
+        func: Function to apply
+        items: Inputs
+        max_workers: Pool size cap (default: up to 32); 1 forces serial
+    """
+    workers = min(max_workers or _MAX_LOAD_WORKERS, len(items))
+    if workers <= 1 or len(items) < _PARALLEL_LOAD_THRESHOLD:
+        return [func(item) for item in items]
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(func, items))
+
+
+def _scan_files(directory: str, patterns: list[str]) -> list[str]:
+    """
+    List file paths in directory matching any of the glob patterns.
+
+    Flat patterns are matched against os.scandir() names, which avoids a
+    Path object and a stat per entry; patterns with a "/" fall back to
+    Path.glob(). Order and duplicates match successive Path.glob() calls.
+    """
+    paths: list[str] = []
+    for pattern in patterns:
+        if "/" in pattern:
+            paths.extend(
+                os.fspath(filepath)
+                for filepath in Path(directory).glob(pattern)
+                if filepath.is_file()
+            )
+            continue
+        try:
+            with os.scandir(directory) as entries:
+                paths.extend(
+                    entry.path
+                    for entry in entries
+                    if fnmatch.fnmatch(entry.name, pattern) and entry.is_file()
+                )
+        except FileNotFoundError:
+            pass
+    return paths
+
+
+def _try_html_to_node(filepath: Path | str) -> Node | None:
+    """Parse a node file, returning None for malformed files."""
+    try:
+        return _read_node_file(filepath)
+    except (ValueError, KeyError):
+        return None
+
+
 class NodeConverter:
     """
     Converter class for batch operations on multiple nodes.
@@ -262,6 +503,18 @@ class NodeConverter:
         converter.save_all(nodes)
     """
 
+    # One converter exists per collection graph; slots drop the per-instance
+    # __dict__ and make attribute access in the load/save paths cheaper.
+    __slots__ = (
+        "directory",
+        "stylesheet_path",
+        "_dir_str",
+        "_node_cache",
+        "_listing_cache",
+        "_listing_mtime_ns",
+        "_listing_racy",
+    )
+
     def __init__(self, directory: Path | str, stylesheet_path: str = "../styles.css"):
         """
         Initialize converter for a directory.
@@ -272,54 +525,152 @@ class NodeConverter:
         """
         self.directory = Path(directory)
         self.stylesheet_path = stylesheet_path
+        self._dir_str = os.fspath(self.directory)
+        self._node_cache = _ParsedFileCache()
+        self._listing_cache: set[str] | None = None
+        self._listing_mtime_ns = 0
+        self._listing_racy = False
+
+    def _refresh_listing(self) -> set[str]:
+        """
+        Return the IDs of node files in the directory.
+
+        The listing is cached and only rescanned when the directory mtime
+        changes, so batched existence checks cost one stat instead of one
+        per ID. Callers confirm misses with _file_exists(), since the
+        directory mtime can lag behind other processes (e.g. NFS attribute
+        caching).
+        """
+        try:
+            mtime_ns = os.stat(self._dir_str).st_mtime_ns
+        except FileNotFoundError:
+            self._listing_cache = None
+            return set()
+
+        if (
+            self._listing_cache is not None
+            and mtime_ns == self._listing_mtime_ns
+            and not self._listing_racy
+        ):
+            return self._listing_cache
+
+        scanned_ns = time.time_ns()
+        with os.scandir(self._dir_str) as entries:
+            listing = {
+                entry.name[:-5] for entry in entries if entry.name.endswith(".html")
+            }
+        self._listing_cache = listing
+        self._listing_mtime_ns = mtime_ns
+        self._listing_racy = scanned_ns - mtime_ns < _RACY_MTIME_WINDOW_NS
+        return listing
+
+    def _invalidate_listing(self) -> None:
+        """Drop the cached directory listing."""
+        self._listing_cache = None
+
+    def _file_exists(self, node_id: str) -> bool:
+        """Check the listing, falling back to an uncached stat on a miss."""
+        if node_id in self._refresh_listing():
+            return True
+        if os.path.exists(os.path.join(self._dir_str, f"{node_id}.html")):
+            # Created by someone else since the listing was taken
+            self._invalidate_listing()
+            return True
+        return False
 
     def load(self, node_id: str) -> Node | None:
         """Load a single node by ID."""
-        filepath = self.directory / f"{node_id}.html"
-        if filepath.exists():
-            return html_to_node(filepath)
-        return None
+        if not self._file_exists(node_id):
+            return None
+        try:
+            return cast(
+                Node,
+                self._node_cache.get_or_parse(
+                    os.path.join(self._dir_str, f"{node_id}.html"), _read_node_file
+                ),
+            )
+        except FileNotFoundError:
+            return None
 
-    def load_all(self, pattern: str | list[str] = "*.html") -> list[Node]:
+    def load_all(
+        self, pattern: str | list[str] = "*.html", max_workers: int | None = None
+    ) -> list[Node]:
         """
         Load all nodes matching pattern(s).
 
         Args:
             pattern: Glob pattern(s) to match. Can be a single pattern or list of patterns.
                      Examples: "*.html", ["*.html", "*/index.html"]
+            max_workers: Cap on parallel file loads (default: up to 32)
         """
-        nodes = []
         patterns = [pattern] if isinstance(pattern, str) else pattern
+        filepaths = _scan_files(self._dir_str, patterns)
+        self._node_cache.retain(filepaths)
 
-        for pat in patterns:
-            for filepath in self.directory.glob(pat):
-                if filepath.is_file():  # Skip directories
-                    try:
-                        nodes.append(html_to_node(filepath))
-                    except (ValueError, KeyError):
-                        continue  # Skip malformed files
-        return nodes
+        loaded = _parallel_map(self.load_file, filepaths, max_workers)
+        return [node for node in loaded if node is not None]  # Skip malformed files
+
+    def load_file(self, filepath: str | Path) -> Node | None:
+        """Load one node file through the cache; None if malformed or gone."""
+        try:
+            return cast(
+                "Node | None",
+                self._node_cache.get_or_parse(os.fspath(filepath), _try_html_to_node),
+            )
+        except FileNotFoundError:
+            return None
 
     def save(self, node: Node) -> Path:
         """Save a single node."""
         filepath = self.directory / f"{node.id}.html"
+        self._invalidate_listing()
+        self._node_cache.discard(os.fspath(filepath))
         return node_to_html(node, filepath, self.stylesheet_path)
 
-    def save_all(self, nodes: list[Node]) -> list[Path]:
-        """Save multiple nodes."""
-        return [self.save(node) for node in nodes]
+    def save_all(self, nodes: list[Node], max_workers: int | None = None) -> list[Path]:
+        """
+        Save multiple nodes.
+
+        Files are rendered and written on a thread pool once there are
+        enough of them. Batches that repeat an ID are saved serially so the
+        last occurrence still wins.
+
+        Args:
+            nodes: Nodes to save
+            max_workers: Cap on parallel writes (default: up to 32)
+        """
+        if len({node.id for node in nodes}) != len(nodes):
+            return [self.save(node) for node in nodes]
+
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self._invalidate_listing()
+        for node in nodes:
+            self._node_cache.discard(os.path.join(self._dir_str, f"{node.id}.html"))
+        return _parallel_map(
+            lambda node: node_to_html(
+                node,
+                self.directory / f"{node.id}.html",
+                self.stylesheet_path,
+                create_dirs=False,
+            ),
+            nodes,
+            max_workers,
+        )
 
     def exists(self, node_id: str) -> bool:
         """Check if a node file exists."""
-        return (self.directory / f"{node_id}.html").exists()
+        return self._file_exists(node_id)
 
     def delete(self, node_id: str) -> bool:
         """Delete a node file."""
-        filepath = self.directory / f"{node_id}.html"
-        if filepath.exists():
-            filepath.unlink()
-            return True
-        return False
+        self._invalidate_listing()
+        filepath = os.path.join(self._dir_str, f"{node_id}.html")
+        self._node_cache.discard(filepath)
+        try:
+            os.unlink(filepath)
+        except FileNotFoundError:
+            return False
+        return True
 
 
 # =============================================================================
@@ -331,22 +682,22 @@ def session_to_dict(session: Session) -> dict[str, Any]:
     """
     Convert Session to a plain dictionary (JSON-serializable).
 
-    Useful for API responses or JSON export.
+    Useful for API responses or JSON export. Every datetime (including
+    activity log and context snapshot timestamps) is serialized to an ISO
+    string by Pydantic's Rust core in a single pass.
     """
-    data = session.model_dump()
+    result: dict[str, Any] = session.model_dump(mode="json")
+    return result
 
-    # Convert datetime objects to ISO strings
-    for key in ["started_at", "ended_at", "last_activity"]:
-        if key in data and data[key]:
-            data[key] = data[key].isoformat()
 
-    # Convert activity log timestamps
-    for entry in data.get("activity_log", []):
-        if entry.get("timestamp"):
-            entry["timestamp"] = entry["timestamp"].isoformat()
+def session_to_json_bytes(session: Session) -> bytes:
+    """
+    Serialize a Session straight to JSON bytes.
 
-    result: dict[str, Any] = data
-    return result
+    Uses Pydantic's Rust serializer, skipping the intermediate dict copy
+    made by session_to_dict().
+    """
+    return session.model_dump_json().encode("utf-8")
 
 
 def dict_to_session(data: dict[str, Any]) -> Session:
@@ -355,23 +706,62 @@ def dict_to_session(data: dict[str, Any]) -> Session:
 
     Handles datetime string parsing.
     """
-    from datetime import datetime
+    parse_iso = _parse_iso
 
     # Parse datetime strings
-    for key in ["started_at", "ended_at", "last_activity"]:
-        if key in data and isinstance(data[key], str):
-            data[key] = datetime.fromisoformat(data[key].replace("Z", "+00:00"))
+    for key in ("started_at", "ended_at", "last_activity"):
+        value = data.get(key)
+        if type(value) is str:
+            data[key] = parse_iso(value)
 
     # Parse activity log timestamps
     for entry in data.get("activity_log", []):
-        if isinstance(entry.get("timestamp"), str):
-            entry["timestamp"] = datetime.fromisoformat(
-                entry["timestamp"].replace("Z", "+00:00")
-            )
+        timestamp = entry.get("timestamp")
+        if type(timestamp) is str:
+            entry["timestamp"] = parse_iso(timestamp)
 
     return Session.from_dict(data)
 
 
+# Sections of a session page that are looked up once and then queried
+# locally; the activity log can hold thousands of entries, so repeated
+# whole-document queries would each walk all of it.
+_SESSION_SECTIONS = ("data-handoff", "data-activity-log", "data-detected-patterns")
+
+
+def _collect_session_elements(root: Any) -> dict[str, Any]:
+    """
+    Find the session page landmarks in a single document walk.
+
+    Returns a dict with the first "article[data-type='session']" and "h1",
+    every "nav[data-graph-edges]" (under "navs"), and the first section for
+    each attribute in _SESSION_SECTIONS. Matched sections are not descended
+    into.
+    """
+    found: dict[str, Any] = {"navs": []}
+    stack = list(reversed(root.children)) if root.has_child_nodes() else []
+    while stack:
+        node = stack.pop()
+        name = getattr(node, "name", "#")
+        if name.startswith("#"):
+            continue
+        attrs = node.attrs
+        if name == "section":
+            section_attr = next((a for a in _SESSION_SECTIONS if a in attrs), None)
+            if section_attr is not None:
+                found.setdefault(section_attr, node)
+                continue
+        elif name == "h1":
+            found.setdefault("h1", node)
+        elif name == "nav" and "data-graph-edges" in attrs:
+            found["navs"].append(node)
+        elif name == "article" and attrs.get("data-type") == "session":
+            found.setdefault("article", node)
+        if node.has_child_nodes():
+            stack.extend(reversed(node.children))
+    return found
+
+
 def html_to_session(filepath: Path | str) -> Session:
     """
     Parse HTML file into a Session model.
@@ -386,17 +776,26 @@ def html_to_session(filepath: Path | str) -> Session:
         FileNotFoundError: If file doesn't exist
         ValueError: If HTML is malformed or missing required data
     """
-    from datetime import datetime
-
     filepath = Path(filepath)
     if not filepath.exists():
         raise FileNotFoundError(f"HTML file not found: {filepath}")
 
+    return _read_session_file(filepath)
+
+
+def _read_session_file(filepath: Path | str) -> Session:
+    """
+    html_to_session() for paths the converter built itself.
+
+    Skips the Path() coercion and the exists() stat; a missing file still
+    raises FileNotFoundError, from the read.
+    """
     parser = HtmlParser.from_file(filepath)
 
+    elements = _collect_session_elements(parser.html.root)
+
     # Get article element with session data
-    article_results = parser.query("article[data-type='session']")
-    article = article_results[0] if article_results else None
+    article = elements.get("article")
     if not article:
         raise ValueError(f"No session article found in: {filepath}")
 
@@ -416,17 +815,15 @@ def html_to_session(filepath: Path | str) -> Session:
     # Parse timestamps
     started_at = article.attrs.get("data-started-at")
     if started_at:
-        data["started_at"] = datetime.fromisoformat(started_at.replace("Z", "+00:00"))
+        data["started_at"] = _parse_iso(started_at)
 
     ended_at = article.attrs.get("data-ended-at")
     if ended_at:
-        data["ended_at"] = datetime.fromisoformat(ended_at.replace("Z", "+00:00"))
+        data["ended_at"] = _parse_iso(ended_at)
 
     last_activity = article.attrs.get("data-last-activity")
     if last_activity:
-        data["last_activity"] = datetime.fromisoformat(
-            last_activity.replace("Z", "+00:00")
-        )
+        data["last_activity"] = _parse_iso(last_activity)
 
     start_commit = article.attrs.get("data-start-commit")
     if start_commit:
@@ -439,8 +836,6 @@ def html_to_session(filepath: Path | str) -> Session:
 
     work_breakdown_json = article.attrs.get("data-work-breakdown")
     if work_breakdown_json:
-        import json
-
         try:
             data["work_breakdown"] = json.loads(work_breakdown_json)
         except (json.JSONDecodeError, ValueError):
@@ -457,46 +852,40 @@ def html_to_session(filepath: Path | str) -> Session:
 
     transcript_synced = article.attrs.get("data-transcript-synced")
     if transcript_synced:
-        data["transcript_synced_at"] = datetime.fromisoformat(
-            transcript_synced.replace("Z", "+00:00")
-        )
+        data["transcript_synced_at"] = _parse_iso(transcript_synced)
 
     transcript_branch = article.attrs.get("data-transcript-branch")
     if transcript_branch:
         data["transcript_git_branch"] = transcript_branch
 
     # Parse title
-    title_el_results = parser.query("h1")
-    title_el = title_el_results[0] if title_el_results else None
+    title_el = elements.get("h1")
     if title_el:
         data["title"] = title_el.to_text().strip()
 
     # Parse worked_on edges
     worked_on = []
-    for link in parser.query(
-        "nav[data-graph-edges] section[data-edge-type='worked-on'] a"
-    ):
-        href = link.attrs.get("href") or ""
-        # Extract feature ID from href
-        feature_id = href.replace("../features/", "").replace(".html", "")
-        if feature_id:
-            worked_on.append(feature_id)
+    continued_links = []
+    for nav in elements["navs"]:
+        continued_links.extend(nav.query("section[data-edge-type='continued-from'] a"))
+        for link in nav.query("section[data-edge-type='worked-on'] a"):
+            href = link.attrs.get("href") or ""
+            # Extract feature ID from href ("../features/<id>.html")
+            feature_id = href.removeprefix("../features/").removesuffix(".html")
+            if feature_id:
+                worked_on.append(feature_id)
     data["worked_on"] = worked_on
 
     # Parse continued_from edge
-    continued_link_results = parser.query(
-        "nav[data-graph-edges] section[data-edge-type='continued-from'] a"
-    )
-    continued_link = continued_link_results[0] if continued_link_results else None
+    continued_link = continued_links[0] if continued_links else None
     if continued_link:
         href = continued_link.attrs.get("href") or ""
-        data["continued_from"] = href.replace(".html", "")
+        data["continued_from"] = href.removesuffix(".html")
 
     # Parse handoff context
-    handoff_section_results = parser.query("section[data-handoff]")
-    handoff_section = handoff_section_results[0] if handoff_section_results else None
+    handoff_section = elements.get("data-handoff")
     if handoff_section:
-        notes_el_results = parser.query("section[data-handoff] [data-handoff-notes]")
+        notes_el_results = handoff_section.query("[data-handoff-notes]")
         notes_el = notes_el_results[0] if notes_el_results else None
         if notes_el:
             notes_text = notes_el.to_text().strip()
@@ -504,7 +893,7 @@ def html_to_session(filepath: Path | str) -> Session:
                 notes_text = notes_text.split(":", 1)[1].strip()
             data["handoff_notes"] = notes_text
 
-        next_el_results = parser.query("section[data-handoff] [data-recommended-next]")
+        next_el_results = handoff_section.query("[data-recommended-next]")
         next_el = next_el_results[0] if next_el_results else None
         if next_el:
             next_text = next_el.to_text().strip()
@@ -513,7 +902,7 @@ def html_to_session(filepath: Path | str) -> Session:
             data["recommended_next"] = next_text
 
         blockers = []
-        for li in parser.query("section[data-handoff] div[data-blockers] li"):
+        for li in handoff_section.query("div[data-blockers] li"):
             blocker_text = li.to_text().strip()
             if blocker_text:
                 blockers.append(blocker_text)
@@ -522,41 +911,46 @@ def html_to_session(filepath: Path | str) -> Session:
 
     # Parse activity log
     activity_log = []
-    for li in parser.query("section[data-activity-log] ol li"):
+    activity_section = elements.get("data-activity-log")
+    parse_iso = _parse_iso
+    for li in activity_section.query("ol li") if activity_section else ():
+        get = li.attrs.get
         entry_data = {
             "summary": li.to_text().strip(),
-            "tool": li.attrs.get("data-tool") or "unknown",
-            "success": li.attrs.get("data-success") != "false",
+            "tool": get("data-tool") or "unknown",
+            "success": get("data-success") != "false",
         }
 
-        ts = li.attrs.get("data-ts")
+        ts = get("data-ts")
         if ts:
-            entry_data["timestamp"] = datetime.fromisoformat(ts.replace("Z", "+00:00"))
+            entry_data["timestamp"] = parse_iso(ts)
 
-        event_id = li.attrs.get("data-event-id")
+        event_id = get("data-event-id")
         if event_id:
             entry_data["id"] = event_id
 
-        feature = li.attrs.get("data-feature")
+        feature = get("data-feature")
         if feature:
             entry_data["feature_id"] = feature
 
-        drift = li.attrs.get("data-drift")
+        drift = get("data-drift")
         if drift:
             entry_data["drift_score"] = float(drift)
 
-        parent = li.attrs.get("data-parent")
+        parent = get("data-parent")
         if parent:
             entry_data["parent_activity_id"] = parent
 
         activity_log.append(ActivityEntry(**entry_data))
 
     # Activity log in HTML is reversed (newest first), so reverse back
-    data["activity_log"] = list(reversed(activity_log))
+    activity_log.reverse()
+    data["activity_log"] = activity_log
 
     # Parse detected patterns from table (if present)
     detected_patterns = []
-    for tr in parser.query("section[data-detected-patterns] table tbody tr"):
+    patterns_section = elements.get("data-detected-patterns")
+    for tr in patterns_section.query("table tbody tr") if patterns_section else ():
         # Extract pattern data from table row
         pattern_type = tr.attrs.get("data-pattern-type", "neutral")
 
@@ -617,12 +1011,17 @@ def session_to_html(
         Path to written file
     """
     filepath = Path(filepath)
+    html_content = session.to_html(stylesheet_path=stylesheet_path)
 
-    if create_dirs:
+    # The parent almost always exists already, so only mkdir when the
+    # write fails for lack of it rather than spending a syscall per save
+    try:
+        _write_html_file(filepath, html_content)
+    except FileNotFoundError:
+        if not create_dirs:
+            raise
         filepath.parent.mkdir(parents=True, exist_ok=True)
-
-    html_content = session.to_html(stylesheet_path=stylesheet_path)
-    filepath.write_text(html_content, encoding="utf-8")
+        _write_html_file(filepath, html_content)
 
     return filepath
 
@@ -640,6 +1039,8 @@ class SessionConverter:
     def __init__(self, directory: Path | str, stylesheet_path: str = "../styles.css"):
         self.directory = Path(directory)
         self.stylesheet_path = stylesheet_path
+        self._dir_str = os.fspath(self.directory)
+        self._session_cache = _ParsedFileCache()
 
     def load(self, session_id: str) -> Session | None:
         """
@@ -648,13 +1049,15 @@ class SessionConverter:
         This automatically removes references to deleted/missing work items
         from the session's worked_on list to maintain data integrity.
         """
-        filepath = self.directory / f"{session_id}.html"
-        if not filepath.exists():
+        filepath = os.path.join(self._dir_str, f"{session_id}.html")
+        try:
+            # Load session from HTML (re-parsed only if the file changed)
+            session = cast(
+                Session, self._session_cache.get_or_parse(filepath, _read_session_file)
+            )
+        except FileNotFoundError:
             return None
 
-        # Load session from HTML
-        session = html_to_session(filepath)
-
         # Cleanup stale work item references
         # (removes IDs from worked_on that no longer exist in .htmlgraph/)
         graph_dir = self.directory.parent  # .htmlgraph directory
@@ -671,42 +1074,85 @@ class SessionConverter:
 
         return session
 
-    def load_all(self, pattern: str = "*.html") -> list[Session]:
+    def _try_load(self, session_id: str) -> Session | None:
+        """Load a session, returning None for malformed files."""
+        try:
+            return self.load(session_id)
+        except (ValueError, KeyError):
+            return None
+
+    def load_all(
+        self, pattern: str = "*.html", max_workers: int | None = None
+    ) -> list[Session]:
         """
         Load all sessions matching pattern and cleanup stale references.
 
         Each session is loaded through self.load() which automatically cleans up
-        stale work item references.
+        stale work item references. Files are loaded on a thread pool once
+        there are enough of them.
+
+        Args:
+            pattern: Glob pattern to match
+            max_workers: Cap on parallel file loads (default: up to 32)
         """
-        sessions = []
-        for filepath in self.directory.glob(pattern):
-            try:
-                # Extract session_id from filename
-                session_id = filepath.stem  # e.g., "sess-abc123"
-                session = self.load(session_id)
-                if session:
-                    sessions.append(session)
-            except (ValueError, KeyError):
-                continue
-        return sessions
+        # Extract session_id from filename, e.g. "sess-abc123"
+        filepaths = _scan_files(self._dir_str, [pattern])
+        self._session_cache.retain(filepaths)
+        session_ids = [
+            os.path.splitext(os.path.basename(filepath))[0] for filepath in filepaths
+        ]
+        loaded = _parallel_map(self._try_load, session_ids, max_workers)
+        return [session for session in loaded if session]
 
     def save(self, session: Session) -> Path:
         """Save a single session."""
         filepath = self.directory / f"{session.id}.html"
+        self._session_cache.discard(os.fspath(filepath))
         return session_to_html(session, filepath, self.stylesheet_path)
 
-    def save_all(self, sessions: list[Session]) -> list[Path]:
-        """Save multiple sessions."""
-        return [self.save(session) for session in sessions]
+    def save_all(
+        self, sessions: list[Session], max_workers: int | None = None
+    ) -> list[Path]:
+        """
+        Save multiple sessions.
+
+        Files are rendered and written on a thread pool once there are
+        enough of them. Batches that repeat an ID are saved serially so the
+        last occurrence still wins.
+
+        Args:
+            sessions: Sessions to save
+            max_workers: Cap on parallel writes (default: up to 32)
+        """
+        if len({session.id for session in sessions}) != len(sessions):
+            return [self.save(session) for session in sessions]
+
+        self.directory.mkdir(parents=True, exist_ok=True)
+        for session in sessions:
+            self._session_cache.discard(
+                os.path.join(self._dir_str, f"{session.id}.html")
+            )
+        return _parallel_map(
+            lambda session: session_to_html(
+                session,
+                self.directory / f"{session.id}.html",
+                self.stylesheet_path,
+                create_dirs=False,
+            ),
+            sessions,
+            max_workers,
+        )
 
     def exists(self, session_id: str) -> bool:
         """Check if a session file exists."""
-        return (self.directory / f"{session_id}.html").exists()
+        return os.path.exists(os.path.join(self._dir_str, f"{session_id}.html"))
 
     def delete(self, session_id: str) -> bool:
         """Delete a session file."""
-        filepath = self.directory / f"{session_id}.html"
-        if filepath.exists():
-            filepath.unlink()
-            return True
-        return False
+        filepath = os.path.join(self._dir_str, f"{session_id}.html")
+        self._session_cache.discard(filepath)
+        try:
+            os.unlink(filepath)
+        except FileNotFoundError:
+            return False
+        return True
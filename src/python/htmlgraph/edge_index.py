@@ -13,7 +13,7 @@ in the graph - O(V×E) complexity.
 from __future__ import annotations
 
 from collections import defaultdict
-from collections.abc import Iterator
+from collections.abc import Iterator, Mapping
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING
 
@@ -402,7 +402,7 @@ class EdgeIndex:
                     return True
         return False
 
-    def rebuild(self, nodes: dict[str, Node]) -> int:
+    def rebuild(self, nodes: Mapping[str, Node]) -> int:
         """
         Rebuild the entire index from a node dictionary.
 
@@ -12,14 +12,72 @@ Design goals:
 from __future__ import annotations
 
 import json
+import os
+import select
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
+try:
+    import orjson
+
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+# Optional: fcntl (POSIX only) serializes appends too large to be atomic
+try:
+    import fcntl
+
+    HAS_FCNTL = True
+except ImportError:
+    HAS_FCNTL = False
+
 if TYPE_CHECKING:
     pass
 
+# Appends up to this size go out as one write() with no lock
+_ATOMIC_APPEND_SIZE = getattr(select, "PIPE_BUF", 4096)
+_APPEND_FLAGS = os.O_WRONLY | os.O_APPEND | os.O_CREAT | getattr(os, "O_BINARY", 0)
+
+
+def _dumps_line(obj: dict[str, Any]) -> bytes:
+    """Serialize one JSONL line (UTF-8, newline-terminated)."""
+    if HAS_ORJSON:
+        try:
+            return orjson.dumps(
+                obj,
+                option=orjson.OPT_APPEND_NEWLINE | orjson.OPT_NON_STR_KEYS,
+                default=str,
+            )
+        except orjson.JSONEncodeError:
+            # e.g. integers wider than 64 bits; the stdlib handles those
+            pass
+    return (json.dumps(obj, ensure_ascii=False, default=str) + "\n").encode("utf-8")
+
+
+def append_jsonl_bytes(path: Path | str, data: bytes) -> None:
+    """
+    Append whole JSONL lines to a file without interleaving concurrent writers.
+
+    Uses an unbuffered O_APPEND descriptor so small payloads land in a single
+    write() call. Larger payloads take an exclusive flock where available.
+    """
+    fd = os.open(path, _APPEND_FLAGS, 0o644)
+    try:
+        locked = HAS_FCNTL and len(data) > _ATOMIC_APPEND_SIZE
+        if locked:
+            fcntl.flock(fd, fcntl.LOCK_EX)
+        view = memoryview(data)
+        while view:
+            written = os.write(fd, view)
+            view = view[written:]
+        if locked:
+            fcntl.flock(fd, fcntl.LOCK_UN)
+    finally:
+        os.close(fd)
+
 
 @dataclass(frozen=True)
 class EventRecord:
@@ -101,13 +159,41 @@ class JsonlEventLog:
         return self.events_dir / f"{session_id}.jsonl"
 
     def append(self, record: EventRecord) -> Path:
-        path = self.path_for_session(record.session_id)
-        line = json.dumps(record.to_json(), ensure_ascii=False, default=str) + "\n"
-        path.parent.mkdir(parents=True, exist_ok=True)
+        return self.append_many([record])[0]
 
-        # Best-effort dedupe: some producers (e.g. git hooks) may retry or be chained.
-        # Event IDs are intended to be unique; if we already have this ID in the
-        # existing file tail, skip appending.
+    def append_many(self, records: list[EventRecord]) -> list[Path]:
+        """
+        Append several records, opening each session file once.
+
+        Returns the path each record was routed to, in order.
+        """
+        paths = [self.path_for_session(record.session_id) for record in records]
+        by_path: dict[Path, list[EventRecord]] = {}
+        for path, record in zip(paths, records):
+            by_path.setdefault(path, []).append(record)
+
+        for path, path_records in by_path.items():
+            path.parent.mkdir(parents=True, exist_ok=True)
+
+            # Best-effort dedupe: some producers (e.g. git hooks) may retry or be
+            # chained. Event IDs are intended to be unique; skip records whose ID
+            # is already in the existing file tail (or earlier in this batch).
+            seen = self._recent_event_ids(path)
+            lines: list[bytes] = []
+            for record in path_records:
+                if record.event_id in seen:
+                    continue
+                seen.add(record.event_id)
+                lines.append(_dumps_line(record.to_json()))
+
+            if lines:
+                append_jsonl_bytes(path, b"".join(lines))
+        return paths
+
+    @staticmethod
+    def _recent_event_ids(path: Path) -> set[str]:
+        """Event IDs among the last lines of an existing JSONL file."""
+        event_ids: set[str] = set()
         try:
             if path.exists():
                 with path.open("rb") as f:
@@ -125,14 +211,12 @@ class JsonlEventLog:
                                 existing = json.loads(raw)
                             except json.JSONDecodeError:
                                 continue
-                            if existing.get("event_id") == record.event_id:
-                                return path
+                            event_id = existing.get("event_id")
+                            if event_id is not None:
+                                event_ids.add(event_id)
         except Exception:
             pass
-
-        with path.open("a", encoding="utf-8") as f:
-            f.write(line)
-        return path
+        return event_ids
 
     def iter_events(self) -> Any:
         """
@@ -5,7 +5,10 @@ Monitors .htmlgraph/**/*.html files and reloads collections when changes are det
 """
 
 import fnmatch
+import os
+import re
 import threading
+import time
 from collections.abc import Callable
 from pathlib import Path
 from typing import Any
@@ -26,23 +29,59 @@ COLLECTION_PATTERNS = {
     "metrics": ["metr-*.html", "metric-*.html"],
 }
 
+# Characters that make a glob prefix more than a literal string
+_WILDCARD_RE = re.compile(r"[*?\[]")
+
+# Above this many changed files per debounce window, rebuild the collection
+MAX_INCREMENTAL_RELOAD = 50
+
 
 class GraphFileHandler(FileSystemEventHandler):
     """Handler for filesystem events on graph HTML files."""
 
-    def __init__(self, collection: str, reload_callback: Callable[[], None]):
+    def __init__(
+        self, collection: str, reload_callback: Callable[[set[str]], None]
+    ) -> None:
         """
         Initialize handler.
 
         Args:
             collection: Name of the collection (e.g., 'features', 'sessions')
-            reload_callback: Function to call when reload is needed
+            reload_callback: Function called with the set of changed file
+                paths when a reload is needed
         """
         self.collection = collection
         self.reload_callback = reload_callback
-        self.debounce_timer: threading.Timer | None = None
         self.debounce_delay = 0.5  # 500ms debounce
 
+        # One long-lived worker per handler coalesces bursts of events,
+        # instead of spawning (and cancelling) a Timer thread per event
+        self._last_event = 0.0
+        self._pending = threading.Event()
+        self._stopped = threading.Event()
+        self._worker: threading.Thread | None = None
+        self._changed_lock = threading.Lock()
+        self._changed: set[str] = set()
+
+        # Get patterns for this collection (default to all HTML if not found).
+        # "prefix*.html" patterns reduce to a startswith() check on a tuple of
+        # prefixes; anything else is compiled into one regex.
+        patterns = [
+            os.path.normcase(p) for p in COLLECTION_PATTERNS.get(collection, ["*.html"])
+        ]
+        prefixes = tuple(p[: -len("*.html")] for p in patterns)
+        self._prefixes: tuple[str, ...] | None = None
+        self._pattern_re: re.Pattern[str] | None = None
+        if all(
+            p.endswith("*.html") and not _WILDCARD_RE.search(prefix)
+            for p, prefix in zip(patterns, prefixes)
+        ):
+            self._prefixes = prefixes
+        else:
+            self._pattern_re = re.compile(
+                "|".join(fnmatch.translate(p) for p in patterns)
+            )
+
     def _is_relevant_file(self, filepath: str) -> bool:
         """
         Check if changed file is relevant to this watcher's collection.
@@ -53,30 +92,67 @@ class GraphFileHandler(FileSystemEventHandler):
         Returns:
             True if the file matches this collection's patterns
         """
-        filename = Path(filepath).name
+        filename = os.path.basename(filepath)
 
         # Skip non-HTML files
         if not filename.endswith(".html"):
             return False
 
-        # Get patterns for this collection (default to all HTML if not found)
-        patterns = COLLECTION_PATTERNS.get(self.collection, ["*.html"])
-
         # Check if filename matches any pattern
-        return any(fnmatch.fnmatch(filename, pattern) for pattern in patterns)
+        filename = os.path.normcase(filename)
+        if self._prefixes is not None:
+            return filename.startswith(self._prefixes)
+        assert self._pattern_re is not None
+        return self._pattern_re.match(filename) is not None
 
-    def _trigger_reload(self) -> None:
+    def _trigger_reload(self, paths: set[str]) -> None:
         """Trigger a reload after debounce delay."""
         print(f"[FileWatcher] Reloading collection: {self.collection}")
-        self.reload_callback()
+        self.reload_callback(paths)
 
-    def _debounced_reload(self) -> None:
+    def _debounced_reload(self, path: str | None = None) -> None:
         """Debounce rapid file changes to avoid excessive reloads."""
-        if self.debounce_timer:
-            self.debounce_timer.cancel()
+        if path is not None:
+            with self._changed_lock:
+                self._changed.add(path)
+        self._last_event = time.monotonic()
+        if self._worker is None:
+            self._worker = threading.Thread(
+                target=self._reload_loop,
+                name=f"htmlgraph-watch-{self.collection}",
+                daemon=True,
+            )
+            self._worker.start()
+        self._pending.set()
+
+    def _reload_loop(self) -> None:
+        """Reload once events have been quiet for debounce_delay seconds."""
+        while True:
+            self._pending.wait()
+            while not self._stopped.is_set():
+                remaining = self._last_event + self.debounce_delay - time.monotonic()
+                if remaining <= 0:
+                    break
+                self._stopped.wait(remaining)
+            if self._stopped.is_set():
+                return
+
+            # Events arriving from here on schedule another reload
+            self._pending.clear()
+            with self._changed_lock:
+                paths, self._changed = self._changed, set()
+            try:
+                self._trigger_reload(paths)
+            except Exception as e:
+                # Keep the worker alive for later events
+                print(f"[FileWatcher] Reload failed for {self.collection}: {e}")
 
-        self.debounce_timer = threading.Timer(self.debounce_delay, self._trigger_reload)
-        self.debounce_timer.start()
+    def stop(self) -> None:
+        """Stop the reload worker, dropping any pending reload."""
+        self._stopped.set()
+        self._pending.set()
+        if self._worker is not None:
+            self._worker.join()
 
     def on_created(self, event: FileSystemEvent) -> None:
         """Handle file creation."""
@@ -90,7 +166,7 @@ class GraphFileHandler(FileSystemEventHandler):
         print(
             f"[FileWatcher] {self.collection}: File created - {Path(str(event.src_path)).name}"
         )
-        self._debounced_reload()
+        self._debounced_reload(str(event.src_path))
 
     def on_modified(self, event: FileSystemEvent) -> None:
         """Handle file modification."""
@@ -104,7 +180,7 @@ class GraphFileHandler(FileSystemEventHandler):
         print(
             f"[FileWatcher] {self.collection}: File modified - {Path(str(event.src_path)).name}"
         )
-        self._debounced_reload()
+        self._debounced_reload(str(event.src_path))
 
     def on_deleted(self, event: FileSystemEvent) -> None:
         """Handle file deletion."""
@@ -118,7 +194,7 @@ class GraphFileHandler(FileSystemEventHandler):
         print(
             f"[FileWatcher] {self.collection}: File deleted - {Path(str(event.src_path)).name}"
         )
-        self._debounced_reload()
+        self._debounced_reload(str(event.src_path))
 
 
 class GraphWatcher:
@@ -156,10 +232,19 @@ class GraphWatcher:
                 continue
 
             # Create handler with reload callback
-            def make_reload_callback(coll: str) -> Callable[[], None]:
-                def reload() -> None:
+            def make_reload_callback(coll: str) -> Callable[[set[str]], None]:
+                def reload(paths: set[str]) -> None:
                     graph = self.get_graph_callback(coll)
-                    count = graph.reload()
+                    count = None
+                    # Re-parse just the changed files; a large burst or a
+                    # failed incremental update falls back to a full reload
+                    if paths and len(paths) <= MAX_INCREMENTAL_RELOAD:
+                        try:
+                            count = graph.reload_paths(paths)
+                        except Exception as e:
+                            print(f"[FileWatcher] Incremental reload failed: {e}")
+                    if count is None:
+                        count = graph.reload()
                     print(f"[FileWatcher] Reloaded {count} nodes in {coll}")
 
                 return reload
@@ -181,7 +266,6 @@ class GraphWatcher:
         self.observer.stop()
         self.observer.join()
 
-        # Cancel any pending debounce timers
+        # Stop reload workers, dropping pending debounced reloads
         for handler in self.handlers.values():
-            if handler.debounce_timer:
-                handler.debounce_timer.cancel()
+            handler.stop()
@@ -15,88 +15,162 @@ from __future__ import annotations
 import os
 import re
 import subprocess
+import sys
 from datetime import datetime
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, cast
 
-from htmlgraph.event_log import EventRecord, JsonlEventLog
+from htmlgraph.background import popen_detached
+from htmlgraph.event_log import (
+    EventRecord,
+    JsonlEventLog,
+    _dumps_line,
+    append_jsonl_bytes,
+)
+
+# Optional: pygit2 reads the repository in-process instead of spawning git
+try:
+    import pygit2
+
+    HAS_PYGIT2 = True
+except ImportError:
+    HAS_PYGIT2 = False
 
 if TYPE_CHECKING:
     from htmlgraph.session_manager import SessionManager
 
 
-def get_git_info() -> dict:
+def get_git_info(rev: str = "HEAD") -> dict:
     """
     Get current Git repository information.
 
+    Uses pygit2 when it is installed, falling back to the git CLI.
+
+    Args:
+        rev: Commit to describe (defaults to HEAD)
+
     Returns:
         Dictionary with commit hash, branch, author, etc.
         Returns empty dict if not in a Git repo.
     """
+    if HAS_PYGIT2:
+        info = _get_git_info_pygit2(rev)
+        if info is not None:
+            return info
+    return _get_git_info_cli(rev)
+
+
+def _get_git_info_pygit2(rev: str = "HEAD") -> dict | None:
+    """get_git_info() via libgit2; None if libgit2 can't read the repo."""
     try:
-        # Get commit hash
-        commit_hash = subprocess.check_output(
-            ["git", "rev-parse", "HEAD"], stderr=subprocess.DEVNULL, text=True
-        ).strip()
+        repo_path = pygit2.discover_repository(os.getcwd())
+        if repo_path is None:
+            return {}
+        repo = pygit2.Repository(repo_path)
+        if repo.head_is_unborn:
+            return {}
+        commit = repo.revparse_single(rev).peel(pygit2.Commit)
+
+        # Match `git log -1 --numstat`: root commits diff against the empty
+        # tree, merge commits report no changes
+        files_changed: list[str] = []
+        insertions = 0
+        deletions = 0
+        if len(commit.parents) <= 1:
+            if commit.parents:
+                diff = commit.parents[0].tree.diff_to_tree(commit.tree)
+            else:
+                diff = commit.tree.diff_to_tree(swap=True)
+            files_changed = [delta.new_file.path for delta in diff.deltas]
+            insertions = diff.stats.insertions
+            deletions = diff.stats.deletions
 
-        commit_hash_short = subprocess.check_output(
-            ["git", "rev-parse", "--short", "HEAD"],
-            stderr=subprocess.DEVNULL,
-            text=True,
-        ).strip()
+        return {
+            "commit_hash": str(commit.id),
+            "commit_hash_short": commit.short_id,
+            "parents": [str(parent_id) for parent_id in commit.parent_ids],
+            "branch": "HEAD" if repo.head_is_detached else repo.head.shorthand,
+            "author_name": commit.author.name,
+            "author_email": commit.author.email,
+            "commit_message": commit.message.strip(),
+            "files_changed": files_changed,
+            "insertions": insertions,
+            "deletions": deletions,
+        }
+    except (KeyError, pygit2.GitError):
+        return None
+
+
+def _run_git_concurrently(*commands: list[str]) -> list[str]:
+    """
+    Run several git commands at once and return their stdout, in order.
 
-        # Get branch name
-        branch = subprocess.check_output(
-            ["git", "rev-parse", "--abbrev-ref", "HEAD"],
+    Raises:
+        subprocess.CalledProcessError: If any command fails
+    """
+    procs = [
+        subprocess.Popen(
+            ["git", *args],
+            stdout=subprocess.PIPE,
             stderr=subprocess.DEVNULL,
             text=True,
-        ).strip()
-
-        # Get author info
-        author_name = subprocess.check_output(
-            ["git", "log", "-1", "--format=%an"], stderr=subprocess.DEVNULL, text=True
-        ).strip()
-
-        author_email = subprocess.check_output(
-            ["git", "log", "-1", "--format=%ae"], stderr=subprocess.DEVNULL, text=True
-        ).strip()
-
-        # Get commit message
-        commit_message = subprocess.check_output(
-            ["git", "log", "-1", "--format=%B"], stderr=subprocess.DEVNULL, text=True
-        ).strip()
-
-        # Get changed files
-        files_changed = (
-            subprocess.check_output(
-                ["git", "diff-tree", "--no-commit-id", "--name-only", "-r", "HEAD"],
-                stderr=subprocess.DEVNULL,
-                text=True,
-            )
-            .strip()
-            .split("\n")
         )
-        files_changed = [f for f in files_changed if f]  # Remove empty strings
+        for args in commands
+    ]
+    outputs = [proc.communicate()[0] for proc in procs]
+    for proc, args in zip(procs, commands):
+        if proc.returncode:
+            raise subprocess.CalledProcessError(proc.returncode, ["git", *args])
+    return outputs
 
-        # Get stats (insertions/deletions)
-        stats = subprocess.check_output(
-            ["git", "diff-tree", "--no-commit-id", "--numstat", "-r", "HEAD"],
-            stderr=subprocess.DEVNULL,
-            text=True,
-        ).strip()
 
+def _get_git_info_cli(rev: str = "HEAD") -> dict:
+    """get_git_info() by running the git CLI."""
+    try:
+        # One `git log` for the commit fields, parents and numstat, one
+        # rev-parse for the branch, both started before waiting on either.
+        # NUL-separated fields keep %B (which may contain any text)
+        # unambiguous; the numstat lines follow the last NUL.
+        output, branch = _run_git_concurrently(
+            [
+                "log",
+                "-1",
+                "--no-renames",
+                "--numstat",
+                "--format=%H%x00%h%x00%P%x00%an%x00%ae%x00%B%x00",
+                rev,
+            ],
+            ["rev-parse", "--abbrev-ref", "HEAD"],
+        )
+        (
+            commit_hash,
+            commit_hash_short,
+            parents,
+            author_name,
+            author_email,
+            commit_message,
+            stats,
+        ) = output.split("\0", 6)
+        commit_message = commit_message.strip()
+        branch = branch.strip()
+
+        # Get changed files and stats (insertions/deletions)
+        files_changed = []
         insertions = 0
         deletions = 0
         for line in stats.split("\n"):
-            if line:
-                parts = line.split("\t")
-                if len(parts) >= 2 and parts[0] != "-" and parts[1] != "-":
-                    insertions += int(parts[0])
-                    deletions += int(parts[1])
+            parts = line.split("\t", 2)
+            if len(parts) < 3:
+                continue
+            files_changed.append(parts[2])
+            if parts[0] != "-" and parts[1] != "-":
+                insertions += int(parts[0])
+                deletions += int(parts[1])
 
         return {
             "commit_hash": commit_hash,
             "commit_hash_short": commit_hash_short,
+            "parents": parents.split(),
             "branch": branch,
             "author_name": author_name,
             "author_email": author_email,
@@ -126,7 +200,28 @@ def get_active_features(graph_dir: str | Path = ".htmlgraph") -> list[str]:
     Returns:
         List of feature IDs with status 'in-progress'
     """
-    manager = _get_session_manager(graph_dir)
+    return _active_feature_ids(_get_session_manager(graph_dir))
+
+
+def get_primary_feature_id(graph_dir: str | Path = ".htmlgraph") -> str | None:
+    return _primary_feature_id(_get_session_manager(graph_dir))
+
+
+def get_active_session(graph_dir: str | Path = ".htmlgraph") -> Any:
+    """
+    Get the current active HtmlGraph session.
+
+    Returns:
+        Session if active session exists, None otherwise
+    """
+    return _active_session(_get_session_manager(graph_dir))
+
+
+# The helpers below take an already-built SessionManager, so one hook
+# invocation can answer several questions from a single instance.
+
+
+def _active_feature_ids(manager: SessionManager | None) -> list[str]:
     if not manager:
         return []
     try:
@@ -136,8 +231,7 @@ def get_active_features(graph_dir: str | Path = ".htmlgraph") -> list[str]:
         return []
 
 
-def get_primary_feature_id(graph_dir: str | Path = ".htmlgraph") -> str | None:
-    manager = _get_session_manager(graph_dir)
+def _primary_feature_id(manager: SessionManager | None) -> str | None:
     if not manager:
         return None
     try:
@@ -147,14 +241,7 @@ def get_primary_feature_id(graph_dir: str | Path = ".htmlgraph") -> str | None:
         return None
 
 
-def get_active_session(graph_dir: str | Path = ".htmlgraph") -> Any:
-    """
-    Get the current active HtmlGraph session.
-
-    Returns:
-        Session if active session exists, None otherwise
-    """
-    manager = _get_session_manager(graph_dir)
+def _active_session(manager: SessionManager | None) -> Any:
     if not manager:
         return None
     try:
@@ -163,6 +250,22 @@ def get_active_session(graph_dir: str | Path = ".htmlgraph") -> Any:
         return None
 
 
+# All HtmlGraph ID prefixes (current + legacy)
+_ID_PREFIXES = r"(?:feat|feature|bug|spk|spike|chr|chore|trk|track|todo)"
+
+# Feature reference patterns, in priority order
+_EXPLICIT_REF_PATTERNS = (
+    # Explicit tags (Implements: feat-xyz)
+    re.compile(
+        rf"(?:Implements|Fixes|Closes|Refs):\s*({_ID_PREFIXES}-[\w-]+)", re.IGNORECASE
+    ),
+    # Square brackets [feat-xyz] (common in commit messages)
+    re.compile(rf"\[({_ID_PREFIXES}-[\w-]+)\]", re.IGNORECASE),
+)
+# Anywhere in message as word boundary (a superset of the explicit forms)
+_BARE_REF_PATTERN = re.compile(rf"\b({_ID_PREFIXES}-[\w-]+)\b", re.IGNORECASE)
+
+
 def parse_feature_refs(message: str) -> list[str]:
     """
     Parse feature IDs from commit message.
@@ -188,32 +291,19 @@ def parse_feature_refs(message: str) -> list[str]:
     Returns:
         List of feature IDs found
     """
-    features = []
-
-    # All HtmlGraph ID prefixes (current + legacy)
-    id_prefixes = r"(?:feat|feature|bug|spk|spike|chr|chore|trk|track|todo)"
-
-    # Pattern 1: Explicit tags (Implements: feat-xyz)
-    pattern1 = rf"(?:Implements|Fixes|Closes|Refs):\s*({id_prefixes}-[\w-]+)"
-    features.extend(re.findall(pattern1, message, re.IGNORECASE))
-
-    # Pattern 2: Square brackets [feat-xyz] (common in commit messages)
-    pattern2 = rf"\[({id_prefixes}-[\w-]+)\]"
-    features.extend(re.findall(pattern2, message, re.IGNORECASE))
+    # Every explicit ref is also a bare mention, so most messages (no refs at
+    # all) are settled by a single scan.
+    mentioned = _BARE_REF_PATTERN.findall(message)
+    if not mentioned:
+        return []
 
-    # Pattern 3: Anywhere in message as word boundary
-    pattern3 = rf"\b({id_prefixes}-[\w-]+)\b"
-    features.extend(re.findall(pattern3, message, re.IGNORECASE))
+    features: list[str] = []
+    for pattern in _EXPLICIT_REF_PATTERNS:
+        features.extend(pattern.findall(message))
+    features.extend(mentioned)
 
     # Remove duplicates while preserving order
-    seen = set()
-    unique_features = []
-    for f in features:
-        if f not in seen:
-            seen.add(f)
-            unique_features.append(f)
-
-    return unique_features
+    return list(dict.fromkeys(features))
 
 
 def _parse_checkout_from_reflog(
@@ -244,12 +334,44 @@ def _append_event(
     session_status: str | None,
     now: datetime | None = None,
 ) -> None:
+    record = _make_event_record(
+        session_id=session_id,
+        agent=agent,
+        event_id=event_id,
+        tool=tool,
+        summary=summary,
+        feature_id=feature_id,
+        file_paths=file_paths,
+        payload=payload,
+        start_commit=start_commit,
+        continued_from=continued_from,
+        session_status=session_status,
+        now=now,
+    )
+    _append_events(graph_dir, [record])
+
+
+def _make_event_record(
+    *,
+    session_id: str,
+    agent: str,
+    event_id: str,
+    tool: str,
+    summary: str,
+    feature_id: str | None,
+    file_paths: list[str] | None,
+    payload: dict,
+    start_commit: str | None,
+    continued_from: str | None,
+    session_status: str | None,
+    now: datetime | None = None,
+) -> EventRecord:
     # Auto-infer work type from feature_id (Phase 1: Work Type Classification)
     from htmlgraph.work_type_utils import infer_work_type_from_id
 
     work_type = infer_work_type_from_id(feature_id)
 
-    record = EventRecord(
+    return EventRecord(
         event_id=event_id,
         timestamp=now or datetime.now(),
         session_id=session_id,
@@ -267,22 +389,22 @@ def _append_event(
         payload=payload,
     )
 
+
+def _append_events(graph_dir: Path, records: list[EventRecord]) -> None:
+    """Write event records with one open per destination file."""
     # Optional override for custom event file (useful for debugging or routing).
     # If set, write directly to that JSONL path.
     override_path = os.environ.get("HTMLGRAPH_EVENT_FILE")
     if override_path:
-        import json
-
         p = Path(override_path)
         p.parent.mkdir(parents=True, exist_ok=True)
-        with p.open("a", encoding="utf-8") as f:
-            f.write(
-                json.dumps(record.to_json(), ensure_ascii=False, default=str) + "\n"
-            )
+        append_jsonl_bytes(
+            p, b"".join(_dumps_line(record.to_json()) for record in records)
+        )
         return
 
     log = JsonlEventLog(graph_dir / "events")
-    log.append(record)
+    log.append_many(records)
 
 
 def _determine_context(graph_dir: Path, commit_message: str | None = None) -> dict:
@@ -294,23 +416,22 @@ def _determine_context(graph_dir: Path, commit_message: str | None = None) -> di
       - active_features (list[str]), primary_feature_id (str|None)
       - message_features (list[str]), all_features (list[str])
     """
-    active_features = get_active_features(graph_dir)
-    primary_feature_id = get_primary_feature_id(graph_dir)
+    manager = _get_session_manager(graph_dir)
+    active_features = _active_feature_ids(manager)
+    primary_feature_id = _primary_feature_id(manager)
     message_features = (
         parse_feature_refs(commit_message or "") if commit_message else []
     )
 
-    all_features: list[str] = []
-    for f in active_features + message_features:
-        if f and f not in all_features:
-            all_features.append(f)
+    all_features = list(
+        dict.fromkeys(f for f in active_features + message_features if f)
+    )
 
     # Try to find the right session based on feature IDs in commit message
     # This handles multi-agent scenarios where multiple sessions are active
     session = None
     if message_features:
         # If commit mentions specific features, find the session working on them
-        manager = _get_session_manager(graph_dir)
         if manager:
             try:
                 # Try to find a session that has any of the message features as active
@@ -341,7 +462,7 @@ def _determine_context(graph_dir: Path, commit_message: str | None = None) -> di
 
     # Fallback to any active session if we couldn't match by feature
     if not session:
-        session = get_active_session(graph_dir)
+        session = _active_session(manager)
 
     if session:
         return {
@@ -370,12 +491,15 @@ def _determine_context(graph_dir: Path, commit_message: str | None = None) -> di
     }
 
 
-def log_git_commit(graph_dir: str | Path = ".htmlgraph") -> bool:
+def log_git_commit(
+    graph_dir: str | Path = ".htmlgraph", commit_hash: str | None = None
+) -> bool:
     """
     Log a Git commit event to HtmlGraph.
 
     Args:
         graph_dir: HtmlGraph directory (defaults to .htmlgraph)
+        commit_hash: Commit to log (defaults to HEAD)
 
     Returns:
         True if event was logged successfully, False otherwise
@@ -383,23 +507,12 @@ def log_git_commit(graph_dir: str | Path = ".htmlgraph") -> bool:
     try:
         graph_dir_path = Path(graph_dir)
         # Get Git info
-        git_info = get_git_info()
+        git_info = get_git_info(commit_hash or "HEAD")
         if not git_info:
             return False  # Not in a Git repo
 
-        # Best-effort parent list for commit-graph analytics.
-        parents: list[str] = []
-        try:
-            line = subprocess.check_output(
-                ["git", "rev-list", "--parents", "-n", "1", git_info["commit_hash"]],
-                stderr=subprocess.DEVNULL,
-                text=True,
-            ).strip()
-            parts = line.split()
-            if len(parts) >= 2:
-                parents = parts[1:]
-        except Exception:
-            parents = []
+        # Parent list for commit-graph analytics.
+        parents: list[str] = git_info.get("parents", [])
 
         ctx = _determine_context(
             graph_dir_path, commit_message=git_info.get("commit_message")
@@ -419,6 +532,7 @@ def log_git_commit(graph_dir: str | Path = ".htmlgraph") -> bool:
         )
         base_event_id = f"git-commit-{git_info['commit_hash']}"
 
+        records = []
         for fid in feature_ids:
             event_id = base_event_id if fid is None else f"{base_event_id}-{fid}"
             summary = f"Commit {git_info['commit_hash_short']}: {subject}".strip()
@@ -442,21 +556,24 @@ def log_git_commit(graph_dir: str | Path = ".htmlgraph") -> bool:
                 "features": all_features,
             }
 
-            _append_event(
-                graph_dir=graph_dir_path,
-                session_id=ctx["session_id"],
-                agent=ctx["agent"],
-                event_id=event_id,
-                tool="GitCommit",
-                summary=summary,
-                feature_id=fid,
-                file_paths=git_info.get("files_changed") or [],
-                payload=payload,
-                start_commit=ctx["start_commit"],
-                continued_from=ctx["continued_from"],
-                session_status=ctx["session_status"],
+            records.append(
+                _make_event_record(
+                    session_id=ctx["session_id"],
+                    agent=ctx["agent"],
+                    event_id=event_id,
+                    tool="GitCommit",
+                    summary=summary,
+                    feature_id=fid,
+                    file_paths=git_info.get("files_changed") or [],
+                    payload=payload,
+                    start_commit=ctx["start_commit"],
+                    continued_from=ctx["continued_from"],
+                    session_status=ctx["session_status"],
+                )
             )
 
+        # One write for all per-feature events of this commit
+        _append_events(graph_dir_path, records)
         return True
 
     except Exception as e:
@@ -682,10 +799,53 @@ def log_git_push(
         return False
 
 
+def spawn_git_commit_logger(commit_hash: str | None = None) -> bool:
+    """
+    Run log_git_commit() in a detached background process.
+
+    The commit event is informational, so a hook run in the foreground
+    shouldn't hold the user's terminal while SessionManager loads. HEAD is
+    resolved here and passed to the child, so a commit made while the child
+    starts up can't be logged in its place.
+
+    The shipped hooks already background the call and set
+    HTMLGRAPH_SYNC_GIT_EVENTS=1 to log in-process instead.
+
+    Args:
+        commit_hash: Commit to log (defaults to HEAD)
+
+    Returns:
+        True if the background process was started
+    """
+    if os.environ.get("HTMLGRAPH_SYNC_GIT_EVENTS") == "1":
+        return False
+
+    try:
+        if commit_hash is None:
+            commit_hash = subprocess.run(
+                ["git", "rev-parse", "HEAD"],
+                capture_output=True,
+                text=True,
+                check=True,
+            ).stdout.strip()
+        popen_detached(
+            [
+                sys.executable,
+                "-m",
+                "htmlgraph.git_events",
+                "_commit_async",
+                commit_hash,
+            ],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return False
+    return True
+
+
 def main() -> None:
     """CLI entry point for git hook."""
-    import sys
-
     if len(sys.argv) < 2:
         print(
             "Usage: python -m htmlgraph.git_events <commit|checkout|merge|push> [args...]"
@@ -694,8 +854,11 @@ def main() -> None:
 
     event_type = sys.argv[1]
 
-    if event_type == "commit":
-        sys.exit(0 if log_git_commit() else 1)
+    if event_type in ("commit", "_commit_async"):
+        commit_hash = sys.argv[2] if len(sys.argv) > 2 else None
+        if event_type == "commit" and spawn_git_commit_logger(commit_hash):
+            sys.exit(0)
+        sys.exit(0 if log_git_commit(commit_hash=commit_hash) else 1)
 
     if event_type == "checkout":
         old_head = sys.argv[2] if len(sys.argv) > 2 else None
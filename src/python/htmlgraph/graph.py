@@ -11,13 +11,15 @@ Provides:
 
 import hashlib
 import os
+import re
 import time
 from collections import defaultdict, deque
-from collections.abc import Callable, Iterator
+from collections.abc import Callable, Iterable, Iterator, Mapping
 from contextlib import contextmanager
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
+from types import MappingProxyType
 from typing import Any, cast
 
 from htmlgraph.attribute_index import AttributeIndex
@@ -26,18 +28,28 @@ from htmlgraph.edge_index import EdgeIndex, EdgeRef
 from htmlgraph.exceptions import NodeNotFoundError
 from htmlgraph.find_api import FindAPI
 from htmlgraph.models import Node
-from htmlgraph.parser import HtmlParser
+from htmlgraph.parser import (
+    HtmlParser,
+    compile_selector,
+    matches_attributes,
+    selector_attribute_names,
+)
 from htmlgraph.query_builder import QueryBuilder
 
+# <article> attributes every Node.to_html() renders directly from a field
+_ARTICLE_FIELD_ATTRS = frozenset({"id", "data-type", "data-status", "data-priority"})
+
+# Characters an HTML parser would not read back verbatim from an attribute
+_ATTR_UNSAFE_CHARS = re.compile(r'["&\r\x00]')
+
 
 @dataclass
 class CompiledQuery:
     """
     Pre-compiled CSS selector query for efficient reuse.
 
-    While justhtml doesn't support native selector pre-compilation,
-    this class provides:
-    - Cached selector string to avoid string manipulation overhead
+    Provides:
+    - Selector parsed once by justhtml, reused for every node matched
     - Reusable query execution with metrics tracking
     - Integration with query cache for performance
 
@@ -51,6 +63,21 @@ class CompiledQuery:
     selector: str
     _compiled_at: datetime = field(default_factory=datetime.now)
     _use_count: int = field(default=0, init=False)
+    _parsed: Any = field(default=None, init=False, repr=False)
+    _field_attrs_only: bool = field(default=False, init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        try:
+            self._parsed = compile_selector(f"article{self.selector}")
+        except ValueError:
+            # Invalid selectors match nothing, as with per-node parsing
+            self._parsed = None
+            return
+
+        # Selectors that only test id/type/status/priority on the article can
+        # be checked against the model fields without rendering the node
+        names = selector_attribute_names(self._parsed)
+        self._field_attrs_only = names is not None and names <= _ARTICLE_FIELD_ATTRS
 
     def matches(self, node: Node) -> bool:
         """
@@ -62,6 +89,23 @@ class CompiledQuery:
         Returns:
             True if node matches selector
         """
+        if self._parsed is None:
+            return False
+
+        if self._field_attrs_only and not (
+            _ATTR_UNSAFE_CHARS.search(node.id) or _ATTR_UNSAFE_CHARS.search(node.type)
+        ):
+            return matches_attributes(
+                self._parsed,
+                "article",
+                {
+                    "id": node.id,
+                    "data-type": node.type,
+                    "data-status": node.status,
+                    "data-priority": node.priority,
+                },
+            )
+
         try:
             # Convert node to HTML in-memory
             html_content = node.to_html()
@@ -70,7 +114,7 @@ class CompiledQuery:
             parser = HtmlParser.from_string(html_content)
 
             # Check if selector matches
-            return bool(parser.query(f"article{self.selector}"))
+            return bool(parser.query(self._parsed))
         except Exception:
             return False
 
@@ -129,35 +173,25 @@ class GraphSnapshot:
         # Return a copy to prevent mutation of snapshot
         return node.model_copy(deep=True) if node else None
 
-    def query(self, selector: str) -> list[Node]:
+    def query(self, selector: str | CompiledQuery) -> list[Node]:
         """
         Query nodes using CSS selector.
 
         Args:
-            selector: CSS selector string
+            selector: CSS selector string or pre-compiled query
 
         Returns:
             List of matching nodes (copies)
         """
-        matching = []
-
-        for node in self._nodes.values():
-            try:
-                # Convert node to HTML in-memory
-                html_content = node.to_html()
-
-                # Parse the HTML string
-                parser = HtmlParser.from_string(html_content)
+        if isinstance(selector, str):
+            selector = CompiledQuery(selector=selector)
 
-                # Check if selector matches
-                if parser.query(f"article{selector}"):
-                    # Return copy to prevent mutation
-                    matching.append(node.model_copy(deep=True))
-            except Exception:
-                # Skip nodes that fail to parse
-                continue
-
-        return matching
+        # Return copies to prevent mutation
+        return [
+            node.model_copy(deep=True)
+            for node in self._nodes.values()
+            if selector.matches(node)
+        ]
 
     def filter(self, predicate: Callable[[Node], bool]) -> list[Node]:
         """
@@ -215,6 +249,7 @@ class HtmlGraph:
         stylesheet_path: str = "../styles.css",
         auto_load: bool = False,
         pattern: str | list[str] = "*.html",
+        lazy: bool = False,
     ):
         """
         Initialize graph from a directory.
@@ -225,21 +260,31 @@ class HtmlGraph:
             auto_load: Whether to load all nodes on init (default: False for lazy loading)
             pattern: Glob pattern(s) for node files. Can be a single pattern or list.
                      Examples: "*.html", ["*.html", "*/index.html"]
+            lazy: Before the first full load, have get() parse only the
+                  requested node's file instead of loading the whole directory
         """
         self.directory = Path(directory)
         self.directory.mkdir(parents=True, exist_ok=True)
         self.stylesheet_path = stylesheet_path
         self.pattern = pattern
+        self.lazy = lazy
 
         self._nodes: dict[str, Node] = {}
         self._converter = NodeConverter(directory, stylesheet_path)
         self._edge_index = EdgeIndex()
         self._attr_index = AttributeIndex()
         self._query_cache: dict[str, list[Node]] = {}
+        # Rendered exports (to_mermaid/to_context) and the stats() edge count
+        self._render_cache: dict[tuple[Any, ...], Any] = {}
         self._adjacency_cache: dict[str, dict[str, list[str]]] | None = None
         self._cache_enabled: bool = True
         self._explicitly_loaded: bool = False
+        # Set when get() has parsed single nodes ahead of the first full load
+        self._lazily_populated: bool = False
         self._file_hashes: dict[str, str] = {}  # Track file content hashes
+        # Node ID last loaded from each file (absolute path), for files whose
+        # name doesn't match the ID they hold
+        self._path_ids: dict[str, str] = {}
 
         # Query compilation cache (LRU cache with max 100 compiled queries)
         self._compiled_queries: dict[str, CompiledQuery] = {}
@@ -269,11 +314,15 @@ class HtmlGraph:
             self.reload()
 
     def _invalidate_cache(self) -> None:
-        """Clear query, adjacency, attribute, and compiled query caches. Called when graph is modified."""
+        """Clear query, adjacency, and compiled query caches. Called when graph is modified.
+
+        The attribute index is maintained incrementally by every mutator, so
+        it is left intact here.
+        """
         self._query_cache.clear()
+        self._render_cache.clear()
         self._compiled_queries.clear()
         self._adjacency_cache = None
-        self._attr_index.clear()
 
     def _compute_file_hash(self, filepath: Path) -> str:
         """
@@ -324,6 +373,7 @@ class HtmlGraph:
         try:
             self._nodes.clear()
             self._file_hashes.clear()
+            self._path_ids.clear()
 
             # Load all nodes and compute file hashes
             for node in self._converter.load_all(self.pattern):
@@ -334,6 +384,7 @@ class HtmlGraph:
                 if filepath:
                     file_hash = self._compute_file_hash(filepath)
                     self._file_hashes[str(filepath)] = file_hash
+                    self._path_ids[os.path.abspath(filepath)] = node.id
 
             # Rebuild edge index for O(1) reverse lookups
             # Rebuild attribute index for O(1) attribute lookups
@@ -341,6 +392,7 @@ class HtmlGraph:
             self._edge_index.rebuild(self._nodes)
 
             self._explicitly_loaded = True
+            self._lazily_populated = False
 
             # Track metrics
             elapsed_ms = (time.perf_counter() - start) * 1000
@@ -353,11 +405,45 @@ class HtmlGraph:
             self._cache_enabled = True
             self._invalidate_cache()
 
+    def _needs_full_load(self) -> bool:
+        """True until reload() has run, unless nodes were only add()ed."""
+        return not self._explicitly_loaded and (
+            not self._nodes or self._lazily_populated
+        )
+
     def _ensure_loaded(self) -> None:
         """Ensure nodes are loaded. Called lazily on first access."""
-        if not self._explicitly_loaded and not self._nodes:
+        if self._needs_full_load():
             self.reload()
 
+    def _finish_lazy_load(self) -> None:
+        """Load the rest of the graph if get() has only parsed single nodes."""
+        if self._lazily_populated and not self._explicitly_loaded:
+            self.reload()
+
+    def _load_single_before_reload(self, node_id: str) -> Node | None:
+        """
+        Parse one flat node file without loading the whole directory.
+
+        Only used before the first full load, and only when the file is one
+        reload() would pick up under the same ID; otherwise returns None so
+        the caller falls back to a full load.
+        """
+        patterns = [self.pattern] if isinstance(self.pattern, str) else self.pattern
+        if "*.html" not in patterns:
+            return None
+
+        node = self._converter.load(node_id)
+        if node is None or node.id != node_id:
+            return None
+
+        self._nodes[node_id] = node
+        self._edge_index.add_node_edges(node_id, node)
+        self._attr_index.add_node(node_id, node)
+        self._render_cache.clear()
+        self._lazily_populated = True
+        return node
+
     def _get_node_files(self) -> list[Path]:
         """
         Get all node files matching the configured pattern(s).
@@ -385,8 +471,14 @@ class HtmlGraph:
             return filepath.stem
 
     @property
-    def nodes(self) -> dict[str, Node]:
-        """Get all nodes (read-only view)."""
+    def nodes(self) -> Mapping[str, Node]:
+        """Get all nodes as a live read-only view (use nodes_copy() to mutate)."""
+        self._finish_lazy_load()
+        return MappingProxyType(self._nodes)
+
+    def nodes_copy(self) -> dict[str, Node]:
+        """Get a shallow copy of the node dict."""
+        self._finish_lazy_load()
         return self._nodes.copy()
 
     def __len__(self) -> int:
@@ -403,6 +495,7 @@ class HtmlGraph:
             >>> print(f"Graph has {len(graph)} nodes")
             Graph has 42 nodes
         """
+        self._finish_lazy_load()
         return len(self._nodes)
 
     def __contains__(self, node_id: str) -> bool:
@@ -426,6 +519,7 @@ class HtmlGraph:
             ...     print("Not found")
             Not found
         """
+        self._finish_lazy_load()
         return node_id in self._nodes
 
     def __iter__(self) -> Iterator[Node]:
@@ -604,6 +698,7 @@ class HtmlGraph:
             node_id: node.model_copy(deep=True) for node_id, node in self._nodes.items()
         }
         snapshot_file_hashes = self._file_hashes.copy()
+        snapshot_path_ids = self._path_ids.copy()
 
         # Transaction context for collecting operations
         class TransactionContext:
@@ -647,6 +742,7 @@ class HtmlGraph:
             # Rollback: restore snapshot state
             self._nodes = snapshot_nodes
             self._file_hashes = snapshot_file_hashes
+            self._path_ids = snapshot_path_ids
             self._invalidate_cache()
 
             # Rebuild indexes from restored state
@@ -756,6 +852,11 @@ class HtmlGraph:
         Returns:
             Node instance or None if not found
         """
+        if self.lazy and not self._explicitly_loaded:
+            # Before the first full load, parse just this node's file
+            node = self._nodes.get(node_id) or self._load_single_before_reload(node_id)
+            if node is not None:
+                return node
         self._ensure_loaded()
         return self._nodes.get(node_id)
 
@@ -771,6 +872,9 @@ class HtmlGraph:
         node = self._converter.load(node_id)
         if node:
             self._nodes[node_id] = node
+            self._edge_index.add_node_edges(node_id, node)
+            self._attr_index.add_node(node_id, node)
+            self._render_cache.clear()
             reload_count: int = int(self._metrics.get("single_reload_count", 0))  # type: ignore[call-overload]
             self._metrics["single_reload_count"] = reload_count + 1
         return node
@@ -803,10 +907,11 @@ class HtmlGraph:
             return self._nodes.get(node_id)
 
         try:
-            # Remove old node's edges from index if exists
-            if node_id in self._nodes:
-                old_node = self._nodes[node_id]
+            # Remove old node's edges and attributes from the indexes if exists
+            old_node = self._nodes.get(node_id)
+            if old_node is not None:
                 self._edge_index.remove_node_edges(node_id, old_node)
+                self._attr_index.remove_node(node_id, old_node)
 
             # Load updated node from disk (converter.load expects node_id)
             updated_node = self._converter.load(node_id)
@@ -820,8 +925,9 @@ class HtmlGraph:
             file_hash = self._compute_file_hash(filepath)
             self._file_hashes[str(filepath)] = file_hash
 
-            # Add new edges to index
+            # Add new edges and attributes to the indexes
             self._edge_index.add_node_edges(node_id, updated_node)
+            self._attr_index.add_node(node_id, updated_node)
 
             # Invalidate query cache
             self._invalidate_cache()
@@ -834,6 +940,72 @@ class HtmlGraph:
         except Exception:
             return None
 
+    def reload_paths(self, paths: Iterable[str | Path]) -> int:
+        """
+        Apply on-disk changes for specific node files.
+
+        Re-parses files that exist (upserting by the ID they contain) and
+        drops nodes whose files are gone or no longer parse, as reload()
+        would, updating the edge index per node instead of rebuilding the
+        whole graph. Removals use the ID last loaded from each file, so files
+        named differently from their ID, or edits that change the ID, don't
+        leave stale nodes behind. Falls back to a full reload() if nothing
+        has been loaded yet.
+
+        Args:
+            paths: Created, modified or deleted node file paths
+
+        Returns:
+            Number of nodes in the graph afterwards
+
+        Example:
+            >>> graph.reload_paths(["features/feat-001.html"])
+        """
+        if self._needs_full_load():
+            return self.reload()
+
+        for path in paths:
+            filepath = Path(path)
+            path_key = os.path.abspath(filepath)
+            node = self._converter.load_file(filepath)
+            if node is not None:
+                previous_id = self._path_ids.get(path_key)
+                if previous_id is not None and previous_id != node.id:
+                    # The edit changed the ID this file holds
+                    self._drop_loaded_node(previous_id)
+                old_node = self._nodes.get(node.id)
+                if old_node is not None:
+                    self._edge_index.remove_node_edges(node.id, old_node)
+                    self._attr_index.remove_node(node.id, old_node)
+                self._nodes[node.id] = node
+                self._edge_index.add_node_edges(node.id, node)
+                self._attr_index.add_node(node.id, node)
+                self._file_hashes[str(filepath)] = self._compute_file_hash(filepath)
+                self._path_ids[path_key] = node.id
+            else:
+                # Deleted, or rewritten into something that no longer parses
+                node_id = self._path_ids.pop(path_key, None)
+                if node_id is None:
+                    node_id = (
+                        filepath.parent.name
+                        if filepath.name == "index.html"
+                        else filepath.stem
+                    )
+                self._drop_loaded_node(node_id)
+                self._file_hashes.pop(str(filepath), None)
+
+        self._invalidate_cache()
+        reload_count: int = int(self._metrics.get("single_reload_count", 0))  # type: ignore[call-overload]
+        self._metrics["single_reload_count"] = reload_count + 1
+        return len(self._nodes)
+
+    def _drop_loaded_node(self, node_id: str) -> None:
+        """Remove a node from memory and the indexes (the file is left alone)."""
+        old_node = self._nodes.pop(node_id, None)
+        if old_node is not None:
+            self._edge_index.remove_node_edges(node_id, old_node)
+            self._attr_index.remove_node(node_id, old_node)
+
     def _find_node_file(self, node_id: str) -> Path | None:
         """
         Find the file path for a node by ID.
@@ -884,6 +1056,7 @@ class HtmlGraph:
             filepath = self._find_node_file(node_id)
             if filepath:
                 self._file_hashes.pop(str(filepath), None)
+                self._path_ids.pop(os.path.abspath(filepath), None)
 
             # Remove node from indexes
             old_node = self._nodes[node_id]
@@ -933,15 +1106,17 @@ class HtmlGraph:
     # CSS Selector Queries
     # =========================================================================
 
-    def query(self, selector: str) -> list[Node]:
+    def query(self, selector: str | CompiledQuery) -> list[Node]:
         """
         Query nodes using CSS selector with caching and metrics.
 
         Selector is applied to article element of each node.
         Uses cached nodes instead of re-parsing from disk for better performance.
+        The selector is parsed once per call, not once per node.
 
         Args:
-            selector: CSS selector string
+            selector: CSS selector string, or a CompiledQuery to reuse
+                across calls (see query_compiled)
 
         Returns:
             List of matching nodes
@@ -950,6 +1125,9 @@ class HtmlGraph:
             graph.query("[data-status='blocked']")
             graph.query("[data-priority='high'][data-type='feature']")
         """
+        if not isinstance(selector, str):
+            return self.query_compiled(selector)
+
         self._ensure_loaded()
         query_count: int = int(self._metrics.get("query_count", 0))  # type: ignore[call-overload]
         self._metrics["query_count"] = query_count + 1
@@ -967,22 +1145,8 @@ class HtmlGraph:
         start = time.perf_counter()
 
         # Perform query using cached nodes instead of disk I/O
-        matching = []
-
-        for node in self._nodes.values():
-            try:
-                # Convert node to HTML in-memory
-                html_content = node.to_html()
-
-                # Parse the HTML string
-                parser = HtmlParser.from_string(html_content)
-
-                # Check if selector matches
-                if parser.query(f"article{selector}"):
-                    matching.append(node)
-            except Exception:
-                # Skip nodes that fail to parse
-                continue
+        compiled = CompiledQuery(selector=selector)
+        matching = [node for node in self._nodes.values() if compiled.matches(node)]
 
         # Track timing
         elapsed_ms = (time.perf_counter() - start) * 1000
@@ -1541,20 +1705,28 @@ class HtmlGraph:
 
         adj = self._build_adjacency(relationship)
 
-        # BFS
-        queue = deque([(from_id, [from_id])])
-        visited = {from_id}
+        # BFS, recording each node's predecessor instead of copying paths
+        queue = deque([from_id])
+        parent: dict[str, str | None] = {from_id: None}
 
         while queue:
-            current, path = queue.popleft()
+            current = queue.popleft()
 
             for neighbor in adj.get(current, []):
+                if neighbor in parent or neighbor not in self._nodes:
+                    continue
+                parent[neighbor] = current
+
                 if neighbor == to_id:
-                    return path + [neighbor]
+                    path = []
+                    step: str | None = neighbor
+                    while step is not None:
+                        path.append(step)
+                        step = parent[step]
+                    path.reverse()
+                    return path
 
-                if neighbor not in visited and neighbor in self._nodes:
-                    visited.add(neighbor)
-                    queue.append((neighbor, path + [neighbor]))
+                queue.append(neighbor)
 
         return None
 
@@ -1627,7 +1799,10 @@ class HtmlGraph:
         blocked_count: dict[str, int] = defaultdict(int)
 
         for node in self._nodes.values():
-            for edge in node.edges.get(relationship, []):
+            edges = node.edges.get(relationship)
+            if not edges:
+                continue
+            for edge in edges:
                 blocked_count[edge.target_id] += 1
 
         sorted_bottlenecks = sorted(
@@ -1649,27 +1824,31 @@ class HtmlGraph:
         adj = self._build_adjacency(relationship)
         cycles: list[list[str]] = []
         visited: set[str] = set()
-        rec_stack: set[str] = set()
-
-        def dfs(node: str, path: list[str]) -> None:
-            visited.add(node)
-            rec_stack.add(node)
-            path.append(node)
 
-            for neighbor in adj.get(node, []):
-                if neighbor not in visited:
-                    dfs(neighbor, path)
-                elif neighbor in rec_stack:
+        # Iterative DFS with an explicit stack of (node, neighbor iterator),
+        # so long dependency chains can't hit the recursion limit
+        for start in self._nodes:
+            if start in visited:
+                continue
+            visited.add(start)
+            path = [start]
+            on_path = {start}
+            stack = [iter(adj.get(start, ()))]
+
+            while stack:
+                neighbor = next(stack[-1], None)
+                if neighbor is None:
+                    stack.pop()
+                    on_path.discard(path.pop())
+                elif neighbor in on_path:
                     # Found cycle
                     cycle_start = path.index(neighbor)
                     cycles.append(path[cycle_start:] + [neighbor])
-
-            path.pop()
-            rec_stack.remove(node)
-
-        for node_id in self._nodes:
-            if node_id not in visited:
-                dfs(node_id, [])
+                elif neighbor not in visited:
+                    visited.add(neighbor)
+                    path.append(neighbor)
+                    on_path.add(neighbor)
+                    stack.append(iter(adj.get(neighbor, ())))
 
         return cycles
 
@@ -1683,13 +1862,16 @@ class HtmlGraph:
         Returns:
             List of node IDs in dependency order, or None if cycles exist
         """
-        # Build in-degree map
+        # Build in-degree map (a node's in-degree is its dependency count)
+        # and, in the same pass, the dependents of each node
         in_degree: dict[str, int] = {node_id: 0 for node_id in self._nodes}
+        dependents: dict[str, list[str]] = defaultdict(list)
 
         for node in self._nodes.values():
             for edge in node.edges.get(relationship, []):
                 if edge.target_id in in_degree:
                     in_degree[node.id] = in_degree.get(node.id, 0) + 1
+                    dependents[edge.target_id].append(node.id)
 
         # Start with nodes having no dependencies
         queue = deque([n for n, d in in_degree.items() if d == 0])
@@ -1700,7 +1882,7 @@ class HtmlGraph:
             result.append(node_id)
 
             # Reduce in-degree of dependents
-            for dependent in self.dependents(node_id, relationship):
+            for dependent in dependents.get(node_id, ()):
                 in_degree[dependent] -= 1
                 if in_degree[dependent] == 0:
                     queue.append(dependent)
@@ -1972,54 +2154,57 @@ class HtmlGraph:
         - by_priority: Count per priority
         - completion_rate: Overall completion percentage
         - edge_count: Total number of edges
+
+        The per-status/type/priority counts come from the attribute index,
+        which add(), update(), remove() and the reloads keep current, and the
+        edge count is cached until the next of those calls. A node returned
+        by get() that is changed in place must therefore be passed to
+        update() before its new status, type, priority or edges are counted.
         """
-        by_status: defaultdict[str, int] = defaultdict(int)
-        by_type: defaultdict[str, int] = defaultdict(int)
-        by_priority: defaultdict[str, int] = defaultdict(int)
-        edge_count = 0
+        # Per-attribute counts come from the incrementally maintained index
+        self._attr_index.ensure_built(self._nodes)
+        by_status = self._attr_index.count_by_status()
+
+        edge_count = self._render_cache.get(("edge_count",))
+        if edge_count is None:
+            edge_count = sum(
+                len(edges)
+                for node in self._nodes.values()
+                for edges in node.edges.values()
+            )
+            if self._cache_enabled:
+                self._render_cache[("edge_count",)] = edge_count
 
-        stats: dict[str, Any] = {
+        done_count = by_status.get("done", 0)
+        return {
             "total": len(self._nodes),
             "by_status": by_status,
-            "by_type": by_type,
-            "by_priority": by_priority,
+            "by_type": self._attr_index.count_by_type(),
+            "by_priority": self._attr_index.count_by_priority(),
             "edge_count": edge_count,
+            "completion_rate": (
+                round(done_count / len(self._nodes) * 100, 1) if self._nodes else 0
+            ),
         }
 
-        done_count = 0
-        for node in self._nodes.values():
-            by_status[node.status] += 1
-            by_type[node.type] += 1
-            by_priority[node.priority] += 1
-
-            for edges in node.edges.values():
-                edge_count += len(edges)
-
-            if node.status == "done":
-                done_count += 1
-
-        stats["edge_count"] = edge_count
-        stats["completion_rate"] = (
-            round(done_count / len(self._nodes) * 100, 1) if self._nodes else 0
-        )
-
-        # Convert defaultdicts to regular dicts
-        stats["by_status"] = dict(by_status)
-        stats["by_type"] = dict(by_type)
-        stats["by_priority"] = dict(by_priority)
-
-        return stats
-
     def to_context(self, max_nodes: int = 20) -> str:
         """
         Generate lightweight context for AI agents.
 
+        The result is cached until the graph is next modified through add(),
+        update(), remove() or a reload; pass nodes changed in place to
+        update() for them to show up here.
+
         Args:
             max_nodes: Maximum nodes to include
 
         Returns:
             Compact string representation of graph state
         """
+        key = ("to_context", max_nodes)
+        if self._cache_enabled and key in self._render_cache:
+            return cast(str, self._render_cache[key])
+
         lines = ["# Graph Summary"]
         stats = self.stats()
         lines.append(
@@ -2042,7 +2227,10 @@ class HtmlGraph:
             for node in high_priority:
                 lines.append(f"- {node.id}: {node.title} [{node.status}]")
 
-        return "\n".join(lines)
+        context = "\n".join(lines)
+        if self._cache_enabled:
+            self._render_cache[key] = context
+        return context
 
     # =========================================================================
     # Export
@@ -2058,12 +2246,20 @@ class HtmlGraph:
         """
         Export graph as Mermaid diagram.
 
+        The result is cached until the graph is next modified through add(),
+        update(), remove() or a reload; pass nodes changed in place to
+        update() for them to show up here.
+
         Args:
             relationship: Optional filter to specific edge type
 
         Returns:
             Mermaid diagram string
         """
+        key = ("to_mermaid", relationship)
+        if self._cache_enabled and key in self._render_cache:
+            return cast(str, self._render_cache[key])
+
         lines = ["graph TD"]
 
         for node in self._nodes.values():
@@ -2079,4 +2275,7 @@ class HtmlGraph:
                     arrow = "-->" if rel_type != "blocked_by" else "-.->|blocked|"
                     lines.append(f"    {node.id} {arrow} {edge.target_id}")
 
-        return "\n".join(lines)
+        diagram = "\n".join(lines)
+        if self._cache_enabled:
+            self._render_cache[key] = diagram
+        return diagram
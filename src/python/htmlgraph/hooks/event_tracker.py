@@ -14,20 +14,45 @@ import os
 import re
 import subprocess
 import sys
+import tempfile
+from collections.abc import Callable, Iterable
 from datetime import datetime, timedelta
+from itertools import islice
 from pathlib import Path
 from typing import Any, cast
 
+from htmlgraph.background import popen_detached
 from htmlgraph.session_manager import SessionManager
 
 # Drift classification queue (stored in session directory)
 DRIFT_QUEUE_FILE = "drift-queue.json"
 # Active parent activity tracker (for Skill/Task invocations)
 PARENT_ACTIVITY_FILE = "parent-activity.json"
+# Background headless classifier: PID of the running worker and its output
+CLASSIFICATION_PID_FILE = "drift-classification.pid"
+CLASSIFICATION_LOG_FILE = "drift-classification.log"
+# The log is started afresh once it grows past this size
+CLASSIFICATION_LOG_MAX_BYTES = 1024 * 1024
+
+# Path-like tokens in Bash commands (e.g. "src/app.py")
+_FILE_PATH_RE = re.compile(r"[\w./\-_]+\.[a-zA-Z]{1,5}")
+# Failure markers in Bash tool output
+_EXIT_CODE_RE = re.compile(r"Exit code [1-9]\d*|exit status [1-9]\d*", re.IGNORECASE)
+
+# Resolved project roots keyed by absolute starting directory
+_PROJECT_PATH_CACHE: dict[str, str] = {}
+
+# Parsed drift configs keyed by path, valid while (mtime_ns, size) match
+_DRIFT_CONFIG_CACHE: dict[Path, tuple[tuple[int, int], dict]] = {}
 
 
 def load_drift_config() -> dict:
-    """Load drift configuration from plugin config or project .claude directory."""
+    """
+    Load drift configuration from plugin config or project .claude directory.
+
+    Parsed files are cached per process until their mtime or size changes;
+    callers must treat the returned dict as read-only.
+    """
     config_paths = [
         Path(__file__).parent.parent.parent.parent.parent
         / ".claude"
@@ -41,12 +66,21 @@ def load_drift_config() -> dict:
     ]
 
     for config_path in config_paths:
-        if config_path.exists():
-            try:
-                with open(config_path) as f:
-                    return cast(dict[Any, Any], json.load(f))
-            except Exception:
-                pass
+        try:
+            st = config_path.stat()
+        except OSError:
+            continue
+        signature = (st.st_mtime_ns, st.st_size)
+        cached = _DRIFT_CONFIG_CACHE.get(config_path)
+        if cached is not None and cached[0] == signature:
+            return cached[1]
+        try:
+            with open(config_path) as f:
+                config = cast(dict[Any, Any], json.load(f))
+        except Exception:
+            continue
+        _DRIFT_CONFIG_CACHE[config_path] = (signature, config)
+        return config
 
     # Default config
     return {
@@ -67,22 +101,40 @@ def load_drift_config() -> dict:
     }
 
 
+def _write_json_atomic(path: Path, data: dict) -> None:
+    """
+    Write compact JSON via a temp file and os.replace().
+
+    Readers see either the old or the new file, never a torn write.
+    """
+    payload = json.dumps(data, separators=(",", ":"), default=str)
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=path.name, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(payload)
+        os.replace(tmp_name, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_name)
+        except OSError:
+            pass
+        raise
+
+
 def load_parent_activity(graph_dir: Path) -> dict:
     """Load the active parent activity state."""
     path = graph_dir / PARENT_ACTIVITY_FILE
-    if path.exists():
-        try:
-            with open(path) as f:
-                data = cast(dict[Any, Any], json.load(f))
-                # Clean up stale parent activities (older than 5 minutes)
-                if data.get("timestamp"):
-                    ts = datetime.fromisoformat(data["timestamp"])
-                    if datetime.now() - ts > timedelta(minutes=5):
-                        return {}
-                return data
-        except Exception:
-            pass
-    return {}
+    try:
+        with open(path) as f:
+            data = cast(dict[Any, Any], json.load(f))
+        # Clean up stale parent activities (older than 5 minutes)
+        if data.get("timestamp"):
+            ts = datetime.fromisoformat(data["timestamp"])
+            if datetime.now() - ts > timedelta(minutes=5):
+                return {}
+        return data
+    except Exception:
+        return {}
 
 
 def save_parent_activity(
@@ -92,15 +144,14 @@ def save_parent_activity(
     path = graph_dir / PARENT_ACTIVITY_FILE
     try:
         if parent_id:
-            with open(path, "w") as f:
-                json.dump(
-                    {
-                        "parent_id": parent_id,
-                        "tool": tool,
-                        "timestamp": datetime.now().isoformat(),
-                    },
-                    f,
-                )
+            _write_json_atomic(
+                path,
+                {
+                    "parent_id": parent_id,
+                    "tool": tool,
+                    "timestamp": datetime.now().isoformat(),
+                },
+            )
         else:
             # Clear parent activity
             path.unlink(missing_ok=True)
@@ -119,74 +170,92 @@ def load_drift_queue(graph_dir: Path, max_age_hours: int = 48) -> dict:
     Returns:
         Drift queue dict with only recent activities
     """
+    queue, removed = _read_drift_queue(graph_dir, max_age_hours)
+    if removed:
+        save_drift_queue(graph_dir, queue)
+    return queue
+
+
+def _read_drift_queue(graph_dir: Path, max_age_hours: int) -> tuple[dict, int]:
+    """Read the drift queue, dropping stale activities without saving."""
     queue_path = graph_dir / DRIFT_QUEUE_FILE
-    if queue_path.exists():
-        try:
-            with open(queue_path) as f:
-                queue = json.load(f)
+    try:
+        with open(queue_path) as f:
+            queue = json.load(f)
+
+        # Filter out stale activities
+        cutoff_time = datetime.now() - timedelta(hours=max_age_hours)
+        activities = queue.get("activities", [])
+        original_count = len(activities)
+        fresh_activities = [a for a in activities if _is_fresh(a, cutoff_time)]
+
+        removed = original_count - len(fresh_activities)
+        if removed:
+            queue["activities"] = fresh_activities
+            print(
+                f"Cleaned {removed} stale drift queue entries (older than {max_age_hours}h)",
+                file=sys.stderr,
+            )
 
-            # Filter out stale activities
-            cutoff_time = datetime.now() - timedelta(hours=max_age_hours)
-            original_count = len(queue.get("activities", []))
+        return cast(dict[Any, Any], queue), removed
+    except Exception:
+        return {"activities": [], "last_classification": None}, 0
 
-            fresh_activities = []
-            for activity in queue.get("activities", []):
-                try:
-                    activity_time = datetime.fromisoformat(
-                        activity.get("timestamp", "")
-                    )
-                    if activity_time >= cutoff_time:
-                        fresh_activities.append(activity)
-                except (ValueError, TypeError):
-                    # Keep activities with invalid timestamps to avoid data loss
-                    fresh_activities.append(activity)
-
-            # Update queue if we removed stale entries
-            if len(fresh_activities) < original_count:
-                queue["activities"] = fresh_activities
-                save_drift_queue(graph_dir, queue)
-                removed = original_count - len(fresh_activities)
-                print(
-                    f"Cleaned {removed} stale drift queue entries (older than {max_age_hours}h)",
-                    file=sys.stderr,
-                )
 
-            return cast(dict[Any, Any], queue)
-        except Exception:
-            pass
-    return {"activities": [], "last_classification": None}
+def _is_fresh(activity: dict, cutoff_time: datetime) -> bool:
+    """True if the activity is newer than the cutoff."""
+    try:
+        return datetime.fromisoformat(activity.get("timestamp", "")) >= cutoff_time
+    except (ValueError, TypeError):
+        # Keep activities with invalid timestamps to avoid data loss
+        return True
 
 
 def save_drift_queue(graph_dir: Path, queue: dict) -> None:
     """Save the drift queue to file."""
     queue_path = graph_dir / DRIFT_QUEUE_FILE
     try:
-        with open(queue_path, "w") as f:
-            json.dump(queue, f, indent=2, default=str)
+        _write_json_atomic(queue_path, queue)
     except Exception as e:
         print(f"Warning: Could not save drift queue: {e}", file=sys.stderr)
 
 
-def clear_drift_queue_activities(graph_dir: Path) -> None:
+def clear_drift_queue_activities(
+    graph_dir: Path, timestamps: Iterable[str] | None = None
+) -> None:
     """
     Clear activities from the drift queue after successful classification.
 
     This removes stale entries that have been processed, preventing indefinite accumulation.
+
+    Args:
+        graph_dir: Path to .htmlgraph directory
+        timestamps: Timestamps of the classified activities; only these are
+            removed, so activities queued while a background classifier ran
+            are kept. None clears every activity.
     """
     queue_path = graph_dir / DRIFT_QUEUE_FILE
     try:
         # Load existing queue to preserve last_classification timestamp
         queue = {"activities": [], "last_classification": datetime.now().isoformat()}
-        if queue_path.exists():
+        try:
             with open(queue_path) as f:
                 existing = json.load(f)
-                # Preserve the classification timestamp if it exists
-                if existing.get("last_classification"):
-                    queue["last_classification"] = existing["last_classification"]
+        except FileNotFoundError:
+            existing = {}
+        # Preserve the classification timestamp if it exists
+        if existing.get("last_classification"):
+            queue["last_classification"] = existing["last_classification"]
+        if timestamps is not None:
+            classified = set(timestamps)
+            queue["activities"] = [
+                a
+                for a in existing.get("activities", [])
+                if a.get("timestamp") not in classified
+            ]
 
         # Save cleared queue
-        with open(queue_path, "w") as f:
-            json.dump(queue, f, indent=2)
+        _write_json_atomic(queue_path, queue)
     except Exception as e:
         print(f"Warning: Could not clear drift queue: {e}", file=sys.stderr)
 
@@ -194,7 +263,8 @@ def clear_drift_queue_activities(graph_dir: Path) -> None:
 def add_to_drift_queue(graph_dir: Path, activity: dict, config: dict) -> dict:
     """Add a high-drift activity to the queue."""
     max_age_hours = config.get("queue", {}).get("max_age_hours", 48)
-    queue = load_drift_queue(graph_dir, max_age_hours=max_age_hours)
+    # Stale-entry cleanup is persisted by the single save below
+    queue, _ = _read_drift_queue(graph_dir, max_age_hours)
     max_pending = config.get("queue", {}).get("max_pending_classifications", 5)
 
     queue["activities"].append(
@@ -245,20 +315,24 @@ def build_classification_prompt(queue: dict, feature_id: str) -> str:
     """Build the prompt for the classification agent."""
     activities = queue.get("activities", [])
 
-    activity_lines = []
-    for act in activities:
-        line = f"- {act.get('tool', 'unknown')}: {act.get('summary', 'no summary')}"
-        if act.get("file_paths"):
-            line += f" (files: {', '.join(act['file_paths'][:2])})"
-        line += f" [drift: {act.get('drift_score', 0):.2f}]"
-        activity_lines.append(line)
+    # Joined outside the f-string: backslashes in f-string expressions need 3.12+
+    activity_lines = "\n".join(
+        f"- {act.get('tool', 'unknown')}: {act.get('summary', 'no summary')}"
+        + (
+            f" (files: {', '.join(act['file_paths'][:2])})"
+            if act.get("file_paths")
+            else ""
+        )
+        + f" [drift: {act.get('drift_score', 0):.2f}]"
+        for act in activities
+    )
 
     return f"""Classify these high-drift activities into a work item.
 
 Current feature context: {feature_id}
 
 Recent activities with high drift:
-{chr(10).join(activity_lines)}
+{activity_lines}
 
 Based on the activity patterns:
 1. Determine the work item type (bug, feature, spike, chore, or hotfix)
@@ -275,9 +349,144 @@ Use the classification rules:
 Create the work item now using Write tool."""
 
 
+def classification_in_progress(graph_dir: Path) -> bool:
+    """Check whether a background headless classifier is still running."""
+    try:
+        pid = int((graph_dir / CLASSIFICATION_PID_FILE).read_text().strip())
+    except (OSError, ValueError):
+        return False
+    if os.name == "nt":
+        # os.kill() terminates the target on Windows; rely on the cooldown
+        return False
+    try:
+        os.kill(pid, 0)
+    except PermissionError:
+        return True  # Alive, owned by another user
+    except OSError:
+        return False
+    return True
+
+
+def spawn_headless_classification(
+    graph_dir: Path, prompt: str, timestamps: Iterable[str] = ()
+) -> bool:
+    """
+    Start headless classification in a detached background process.
+
+    The worker runs run_headless_classification() so the hook can return
+    immediately. Its output goes to CLASSIFICATION_LOG_FILE, which is
+    truncated once it exceeds CLASSIFICATION_LOG_MAX_BYTES.
+
+    Args:
+        graph_dir: Path to .htmlgraph directory
+        prompt: Classification prompt
+        timestamps: Timestamps of the activities in the prompt, removed from
+            the queue once classification succeeds
+
+    Returns:
+        True if the worker was started
+    """
+    log_path = graph_dir / CLASSIFICATION_LOG_FILE
+    try:
+        try:
+            oversized = log_path.stat().st_size > CLASSIFICATION_LOG_MAX_BYTES
+        except FileNotFoundError:
+            oversized = False
+        with open(log_path, "wb" if oversized else "ab") as log:
+            proc = popen_detached(
+                [
+                    sys.executable,
+                    "-c",
+                    "import sys\n"
+                    "from htmlgraph.hooks.event_tracker import "
+                    "run_headless_classification\n"
+                    "sys.exit(run_headless_classification("
+                    "sys.argv[1], sys.argv[2], sys.argv[3:]))",
+                    str(graph_dir),
+                    prompt,
+                    *timestamps,
+                ],
+                stdout=log,
+                stderr=subprocess.STDOUT,
+            )
+        (graph_dir / CLASSIFICATION_PID_FILE).write_text(str(proc.pid))
+    except OSError:
+        return False
+    return True
+
+
+def run_headless_classification(
+    graph_dir: Path | str, prompt: str, timestamps: Iterable[str] | None = None
+) -> int:
+    """
+    Run `claude` in print mode to classify drifted work (background worker).
+
+    Clears the classified drift queue activities (all of them if timestamps
+    is None) on success.
+
+    Returns:
+        The classifier's exit code (1 if it could not be run)
+    """
+    graph_dir = Path(graph_dir)
+    try:
+        result = subprocess.run(
+            [
+                "claude",
+                "-p",
+                prompt,
+                "--model",
+                "haiku",
+                "--dangerously-skip-permissions",
+            ],
+            stdin=subprocess.DEVNULL,
+            timeout=120,
+            cwd=str(graph_dir.parent),
+            env={
+                **os.environ,
+                # Prevent hooks from writing new HtmlGraph sessions/events
+                # when we spawn nested `claude` processes.
+                "HTMLGRAPH_DISABLE_TRACKING": "1",
+            },
+        )
+        if result.returncode == 0:
+            # Clear the classified activities after successful classification
+            clear_drift_queue_activities(graph_dir, timestamps)
+        return result.returncode
+    except Exception as e:
+        print(f"Drift classification error: {e}", file=sys.stderr)
+        return 1
+    finally:
+        (graph_dir / CLASSIFICATION_PID_FILE).unlink(missing_ok=True)
+
+
 def resolve_project_path(cwd: str | None = None) -> str:
-    """Resolve project path (git root or cwd)."""
+    """
+    Resolve project path (git root or cwd).
+
+    Results are cached per starting directory for the life of the process.
+    """
     start_dir = cwd or os.getcwd()
+    key = os.path.abspath(start_dir)
+    cached = _PROJECT_PATH_CACHE.get(key)
+    if cached is None:
+        cached = _PROJECT_PATH_CACHE[key] = _find_git_root(start_dir) or start_dir
+    return cached
+
+
+def _find_git_root(start_dir: str) -> str | None:
+    """Git work tree root containing start_dir, or None outside a repo."""
+    # GIT_DIR/GIT_WORK_TREE can point anywhere; only git itself knows
+    if "GIT_DIR" not in os.environ and "GIT_WORK_TREE" not in os.environ:
+        # .git is a directory, or a file for worktrees and submodules
+        current = os.path.realpath(start_dir)
+        while True:
+            if os.path.exists(os.path.join(current, ".git")):
+                return current
+            parent = os.path.dirname(current)
+            if parent == current:
+                return None
+            current = parent
+
     try:
         result = subprocess.run(
             ["git", "rev-parse", "--show-toplevel"],
@@ -290,7 +499,7 @@ def resolve_project_path(cwd: str | None = None) -> str:
             return result.stdout.strip()
     except Exception:
         pass
-    return start_dir
+    return None
 
 
 def extract_file_paths(tool_input: dict, tool_name: str) -> list[str]:
@@ -311,63 +520,39 @@ def extract_file_paths(tool_input: dict, tool_name: str) -> list[str]:
     # Bash commands - extract paths heuristically
     if tool_name == "Bash" and "command" in tool_input:
         cmd = tool_input["command"]
-        file_matches = re.findall(r"[\w./\-_]+\.[a-zA-Z]{1,5}", cmd)
-        paths.extend(file_matches[:3])
+        # Only the first three are kept, so stop scanning once they're found
+        paths.extend(m.group() for m in islice(_FILE_PATH_RE.finditer(cmd), 3))
 
     return paths
 
 
+# Per-tool summary formatters, keyed by tool name
+_SUMMARY_FORMATTERS: dict[str, Callable[[dict], str]] = {
+    "Read": lambda ti: f"Read: {ti.get('file_path', 'unknown')}",
+    "Write": lambda ti: f"Write: {ti.get('file_path', 'unknown')}",
+    "Edit": lambda ti: (
+        f"Edit: {ti.get('file_path', 'unknown')} ({ti.get('old_string', '')[:30]}...)"
+    ),
+    "Bash": lambda ti: f"Bash: {ti.get('description') or ti.get('command', '')[:60]}",
+    "Glob": lambda ti: f"Glob: {ti.get('pattern', '')}",
+    "Grep": lambda ti: f"Grep: {ti.get('pattern', '')}",
+    "Task": lambda ti: (
+        f"Task ({ti.get('subagent_type', '')}): {ti.get('description', '')[:50]}"
+    ),
+    "TodoWrite": lambda ti: f"TodoWrite: {len(ti.get('todos', []))} items",
+    "WebSearch": lambda ti: f"WebSearch: {ti.get('query', '')[:40]}",
+    "WebFetch": lambda ti: f"WebFetch: {ti.get('url', '')[:40]}",
+}
+
+
 def format_tool_summary(
     tool_name: str, tool_input: dict, tool_result: dict | None = None
 ) -> str:
     """Format a human-readable summary of the tool call."""
-    if tool_name == "Read":
-        path = tool_input.get("file_path", "unknown")
-        return f"Read: {path}"
-
-    elif tool_name == "Write":
-        path = tool_input.get("file_path", "unknown")
-        return f"Write: {path}"
-
-    elif tool_name == "Edit":
-        path = tool_input.get("file_path", "unknown")
-        old = tool_input.get("old_string", "")[:30]
-        return f"Edit: {path} ({old}...)"
-
-    elif tool_name == "Bash":
-        cmd = tool_input.get("command", "")[:60]
-        desc = tool_input.get("description", "")
-        if desc:
-            return f"Bash: {desc}"
-        return f"Bash: {cmd}"
-
-    elif tool_name == "Glob":
-        pattern = tool_input.get("pattern", "")
-        return f"Glob: {pattern}"
-
-    elif tool_name == "Grep":
-        pattern = tool_input.get("pattern", "")
-        return f"Grep: {pattern}"
-
-    elif tool_name == "Task":
-        desc = tool_input.get("description", "")[:50]
-        agent = tool_input.get("subagent_type", "")
-        return f"Task ({agent}): {desc}"
-
-    elif tool_name == "TodoWrite":
-        todos = tool_input.get("todos", [])
-        return f"TodoWrite: {len(todos)} items"
-
-    elif tool_name == "WebSearch":
-        query = tool_input.get("query", "")[:40]
-        return f"WebSearch: {query}"
-
-    elif tool_name == "WebFetch":
-        url = tool_input.get("url", "")[:40]
-        return f"WebFetch: {url}"
-
-    else:
-        return f"{tool_name}: {str(tool_input)[:50]}"
+    formatter = _SUMMARY_FORMATTERS.get(tool_name)
+    if formatter is not None:
+        return formatter(tool_input)
+    return f"{tool_name}: {str(tool_input)[:50]}"
 
 
 def track_event(hook_type: str, hook_input: dict) -> dict:
@@ -381,6 +566,11 @@ def track_event(hook_type: str, hook_input: dict) -> dict:
     Returns:
         Response dict with {"continue": True} and optional hookSpecificOutput
     """
+    # Nested processes (e.g. the headless classifier) opt out of tracking;
+    # bail before resolving the project or building a SessionManager
+    if os.environ.get("HTMLGRAPH_DISABLE_TRACKING") == "1":
+        return {"continue": True}
+
     cwd = hook_input.get("cwd")
     project_dir = resolve_project_path(cwd if cwd else None)
     graph_dir = Path(project_dir) / ".htmlgraph"
@@ -469,9 +659,7 @@ def track_event(hook_type: str, hook_input: dict) -> dict:
                     tool_response.get("output", "") or tool_response.get("content", "")
                 )
                 # Check for exit code patterns (e.g., "Exit code 1", "exit status 1")
-                if re.search(
-                    r"Exit code [1-9]\d*|exit status [1-9]\d*", output, re.IGNORECASE
-                ):
+                if _EXIT_CODE_RE.search(output):
                     is_error = True
         else:
             # For list or other non-dict responses (like Playwright), assume success
@@ -479,6 +667,7 @@ def track_event(hook_type: str, hook_input: dict) -> dict:
 
         # Get drift thresholds from config
         drift_settings = drift_config.get("drift_detection", {})
+        drift_enabled = drift_settings.get("enabled", True)
         warning_threshold = drift_settings.get("warning_threshold", 0.7)
         auto_classify_threshold = drift_settings.get("auto_classify_threshold", 0.85)
 
@@ -520,7 +709,12 @@ def track_event(hook_type: str, hook_input: dict) -> dict:
 
             # Check for drift and handle accordingly
             # Skip drift detection for child activities (they inherit parent's context)
-            if result and hasattr(result, "drift_score") and not parent_activity_id:
+            if (
+                drift_enabled
+                and result
+                and hasattr(result, "drift_score")
+                and not parent_activity_id
+            ):
                 drift_score = result.drift_score
                 feature_id = getattr(result, "feature_id", "unknown")
 
@@ -544,46 +738,37 @@ def track_event(hook_type: str, hook_input: dict) -> dict:
                             queue, feature_id
                         )
 
+                        # Mark classification as triggered (before spawning, so
+                        # the worker's queue clear isn't overwritten)
+                        queue["last_classification"] = datetime.now().isoformat()
+                        save_drift_queue(graph_dir, queue)
+
                         # Try to run headless classification
                         use_headless = drift_config.get("classification", {}).get(
                             "use_headless", True
                         )
                         if use_headless:
-                            try:
-                                # Run claude in print mode for classification
-                                proc_result = subprocess.run(
-                                    [
-                                        "claude",
-                                        "-p",
-                                        classification_prompt,
-                                        "--model",
-                                        "haiku",
-                                        "--dangerously-skip-permissions",
-                                    ],
-                                    capture_output=True,
-                                    text=True,
-                                    timeout=120,
-                                    cwd=str(graph_dir.parent),
-                                    env={
-                                        **os.environ,
-                                        # Prevent hooks from writing new HtmlGraph sessions/events
-                                        # when we spawn nested `claude` processes.
-                                        "HTMLGRAPH_DISABLE_TRACKING": "1",
-                                    },
-                                )
-                                if proc_result.returncode == 0:
-                                    nudge = "Drift auto-classification completed. Check .htmlgraph/ for new work item."
-                                    # Clear the queue after successful classification
-                                    clear_drift_queue_activities(graph_dir)
-                                else:
-                                    # Fallback to manual prompt
-                                    nudge = f"""HIGH DRIFT ({drift_score:.2f}) - Headless classification failed.
+                            # Classify in the background; the cooldown and PID
+                            # file keep overlapping runs from piling up
+                            if classification_in_progress(graph_dir):
+                                nudge = "Drift classification already running in the background."
+                            elif spawn_headless_classification(
+                                graph_dir,
+                                classification_prompt,
+                                [
+                                    a["timestamp"]
+                                    for a in queue["activities"]
+                                    if a.get("timestamp")
+                                ],
+                            ):
+                                nudge = "Drift auto-classification started in the background. Check .htmlgraph/ for a new work item shortly."
+                            else:
+                                # Fallback to manual prompt
+                                nudge = f"""HIGH DRIFT ({drift_score:.2f}) - Headless classification could not be started.
 
 {len(queue["activities"])} activities don't align with '{feature_id}'.
 
 Please classify manually: bug, feature, spike, or chore in .htmlgraph/"""
-                            except Exception as e:
-                                nudge = f"Drift classification error: {e}. Please classify manually."
                         else:
                             nudge = f"""HIGH DRIFT DETECTED ({drift_score:.2f}) - Auto-classification triggered.
 
@@ -596,10 +781,6 @@ Task tool with subagent_type="general-purpose", model="haiku", prompt:
 ```
 
 Or manually create a work item in .htmlgraph/ (bug, feature, spike, or chore)."""
-
-                        # Mark classification as triggered
-                        queue["last_classification"] = datetime.now().isoformat()
-                        save_drift_queue(graph_dir, queue)
                     else:
                         nudge = f"Drift detected ({drift_score:.2f}): Activity queued for classification ({len(queue['activities'])}/{drift_settings.get('min_activities_before_classify', 3)} needed)."
 
@@ -26,7 +26,6 @@ Public API:
 """
 
 import json
-import re
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, cast
@@ -38,6 +37,50 @@ from htmlgraph.orchestrator_validator import OrchestratorValidator
 TOOL_HISTORY_FILE = Path("/tmp/htmlgraph-tool-history.json")
 MAX_HISTORY_SIZE = 50  # Keep last 50 tool calls
 
+# Compilation, testing and building commands (should be run in a subagent),
+# keyed on the command's first token. A subcommand set of None blocks the
+# command outright; otherwise only the listed subcommands are blocked.
+_BLOCKED_BASH_COMMANDS: dict[str, tuple[frozenset[str] | None, str]] = {
+    "npm": (frozenset({"run", "test", "build"}), "npm test/build"),
+    "pytest": (None, "pytest"),
+    "cargo": (frozenset({"build", "test"}), "cargo build/test"),
+    "mvn": (frozenset({"compile", "test", "package"}), "maven build/test"),
+    "make": (frozenset({"test", "build"}), "make test/build"),
+}
+
+# Two-token launchers that run pytest as their third token
+_PYTEST_LAUNCHERS = frozenset({("uv", "run"), ("python", "-m")})
+
+
+def _blocked_bash_command(command: str) -> str | None:
+    """
+    Match a Bash command against the blocked test/build commands.
+
+    Args:
+        command: Bash command line
+
+    Returns:
+        Display name of the blocked command, or None if it is not blocked
+    """
+    parts = command.split(None, 3)
+    if not parts:
+        return None
+
+    entry = _BLOCKED_BASH_COMMANDS.get(parts[0])
+    if entry is not None:
+        subcommands, name = entry
+        if subcommands is None or (len(parts) > 1 and parts[1] in subcommands):
+            return name
+        return None
+
+    if (
+        len(parts) > 2
+        and parts[2] == "pytest"
+        and (parts[0], parts[1]) in _PYTEST_LAUNCHERS
+    ):
+        return "pytest"
+    return None
+
 
 def load_tool_history() -> list[dict]:
     """
@@ -71,19 +114,24 @@ def save_tool_history(history: list[dict]) -> None:
         recent = (
             history[-MAX_HISTORY_SIZE:] if len(history) > MAX_HISTORY_SIZE else history
         )
-        TOOL_HISTORY_FILE.write_text(json.dumps({"history": recent}, indent=2))
+        # Compact output: this file is rewritten on every tool call
+        TOOL_HISTORY_FILE.write_text(
+            json.dumps({"history": recent}, separators=(",", ":"))
+        )
     except Exception:
         pass  # Fail silently on history save errors
 
 
-def add_to_tool_history(tool: str) -> None:
+def add_to_tool_history(tool: str, history: list[dict] | None = None) -> None:
     """
     Add a tool call to history.
 
     Args:
         tool: Name of the tool being called
+        history: History already loaded by the caller (read from disk otherwise)
     """
-    history = load_tool_history()
+    if history is None:
+        history = load_tool_history()
     history.append(
         {
             "tool": tool,
@@ -93,13 +141,41 @@ def add_to_tool_history(tool: str) -> None:
     save_tool_history(history)
 
 
-def is_allowed_orchestrator_operation(tool: str, params: dict) -> tuple[bool, str, str]:
+def _find_graph_dir() -> Path:
+    """
+    Find the .htmlgraph directory for the current working directory.
+
+    Looks in cwd first, then up to three parent directories.
+
+    Returns:
+        Path to the .htmlgraph directory (cwd/.htmlgraph if none was found)
+    """
+    cwd = Path.cwd()
+    graph_dir = cwd / ".htmlgraph"
+    if not graph_dir.exists():
+        for parent in [cwd.parent, cwd.parent.parent, cwd.parent.parent.parent]:
+            candidate = parent / ".htmlgraph"
+            if candidate.exists():
+                return candidate
+    return graph_dir
+
+
+def is_allowed_orchestrator_operation(
+    tool: str,
+    params: dict,
+    enforcement_level: str | None = None,
+    history: list[dict] | None = None,
+) -> tuple[bool, str, str]:
     """
     Check if operation is allowed for orchestrators.
 
     Args:
         tool: Tool name (e.g., "Read", "Edit", "Bash")
         params: Tool parameters dict
+        enforcement_level: Enforcement level if the caller already loaded it
+            (looked up from orchestrator-mode.json otherwise)
+        history: Tool history if the caller already loaded it
+            (read from the history file otherwise)
 
     Returns:
         Tuple of (is_allowed, reason_if_not, category)
@@ -108,21 +184,12 @@ def is_allowed_orchestrator_operation(tool: str, params: dict) -> tuple[bool, st
         - category: Operation category for logging
     """
     # Get enforcement level from manager
-    try:
-        cwd = Path.cwd()
-        graph_dir = cwd / ".htmlgraph"
-        if not graph_dir.exists():
-            for parent in [cwd.parent, cwd.parent.parent, cwd.parent.parent.parent]:
-                candidate = parent / ".htmlgraph"
-                if candidate.exists():
-                    graph_dir = candidate
-                    break
-        manager = OrchestratorModeManager(graph_dir)
-        enforcement_level = (
-            manager.get_enforcement_level() if manager.is_enabled() else "guidance"
-        )
-    except Exception:
-        enforcement_level = "guidance"
+    if enforcement_level is None:
+        try:
+            mode = OrchestratorModeManager(_find_graph_dir()).load()
+            enforcement_level = mode.enforcement_level if mode.enabled else "guidance"
+        except Exception:
+            enforcement_level = "guidance"
 
     # Use OrchestratorValidator for comprehensive validation
     validator = OrchestratorValidator()
@@ -167,20 +234,7 @@ def is_allowed_orchestrator_operation(tool: str, params: dict) -> tuple[bool, st
         # Block non-whitelisted bash commands in strict mode
         if enforcement_level == "strict":
             # Check if it's a blocked test/build pattern (handled below)
-            blocked_patterns = [
-                r"^npm (run|test|build)",
-                r"^pytest",
-                r"^uv run pytest",
-                r"^python -m pytest",
-                r"^cargo (build|test)",
-                r"^mvn (compile|test|package)",
-                r"^make (test|build)",
-            ]
-            is_blocked_pattern = any(
-                re.match(pattern, command) for pattern in blocked_patterns
-            )
-
-            if not is_blocked_pattern:
+            if _blocked_bash_command(command) is None:
                 # Not a specifically blocked pattern, but also not whitelisted
                 # In strict mode, we should delegate
                 return (
@@ -193,7 +247,8 @@ def is_allowed_orchestrator_operation(tool: str, params: dict) -> tuple[bool, st
     # Category 3: Quick Lookups - Single operations only
     if tool in ["Read", "Grep", "Glob"]:
         # Check tool history to see if this is a single lookup or part of a sequence
-        history = load_tool_history()
+        if history is None:
+            history = load_tool_history()
 
         # FIX #4: Check for mixed exploration pattern
         exploration_count = sum(
@@ -242,24 +297,14 @@ def is_allowed_orchestrator_operation(tool: str, params: dict) -> tuple[bool, st
         command = params.get("command", "")
 
         # Block compilation, testing, building (should be in subagent)
-        test_build_patterns: list[tuple[str, str]] = [
-            (r"^npm (run|test|build)", "npm test/build"),
-            (r"^pytest", "pytest"),
-            (r"^uv run pytest", "pytest"),
-            (r"^python -m pytest", "pytest"),
-            (r"^cargo (build|test)", "cargo build/test"),
-            (r"^mvn (compile|test|package)", "maven build/test"),
-            (r"^make (test|build)", "make test/build"),
-        ]
-
-        for pattern, name in test_build_patterns:
-            if re.match(pattern, command):
-                return (
-                    False,
-                    f"Testing/building ({name}) should be delegated to subagent.\n\n"
-                    f"Use Task tool to run tests and report results.",
-                    "test-build-blocked",
-                )
+        name = _blocked_bash_command(command)
+        if name is not None:
+            return (
+                False,
+                f"Testing/building ({name}) should be delegated to subagent.\n\n"
+                f"Use Task tool to run tests and report results.",
+                "test-build-blocked",
+            )
 
     # FIX #1: Remove "allowed-default" escape hatch in strict mode
     if enforcement_level == "strict":
@@ -387,21 +432,11 @@ def enforce_orchestrator_mode(tool: str, params: dict) -> dict:
     """
     # Get manager and check if mode is enabled
     try:
-        # Look for .htmlgraph directory starting from cwd
-        cwd = Path.cwd()
-        graph_dir = cwd / ".htmlgraph"
-
-        # If not found in cwd, try parent directories (up to 3 levels)
-        if not graph_dir.exists():
-            for parent in [cwd.parent, cwd.parent.parent, cwd.parent.parent.parent]:
-                candidate = parent / ".htmlgraph"
-                if candidate.exists():
-                    graph_dir = candidate
-                    break
+        manager = OrchestratorModeManager(_find_graph_dir())
+        # Load the mode file once and read every setting from it
+        mode = manager.load()
 
-        manager = OrchestratorModeManager(graph_dir)
-
-        if not manager.is_enabled():
+        if not mode.enabled:
             # Mode not active, allow everything
             add_to_tool_history(tool)
             return {
@@ -411,7 +446,7 @@ def enforce_orchestrator_mode(tool: str, params: dict) -> dict:
                 },
             }
 
-        enforcement_level = manager.get_enforcement_level()
+        enforcement_level = mode.enforcement_level
     except Exception:
         # If we can't check mode, fail open (allow)
         add_to_tool_history(tool)
@@ -423,12 +458,12 @@ def enforce_orchestrator_mode(tool: str, params: dict) -> dict:
         }
 
     # Check if circuit breaker is triggered in strict mode
-    if enforcement_level == "strict" and manager.is_circuit_breaker_triggered():
+    if enforcement_level == "strict" and mode.circuit_breaker_triggered:
         # Circuit breaker triggered - block all non-core operations
         if tool not in ["Task", "AskUserQuestion", "TodoWrite"]:
             circuit_breaker_message = (
                 "🚨 ORCHESTRATOR CIRCUIT BREAKER TRIGGERED\n\n"
-                f"You have violated delegation rules {manager.get_violation_count()} times this session.\n\n"
+                f"You have violated delegation rules {mode.violations} times this session.\n\n"
                 "Violations detected:\n"
                 "- Direct execution instead of delegation\n"
                 "- Context waste on tactical operations\n\n"
@@ -447,11 +482,16 @@ def enforce_orchestrator_mode(tool: str, params: dict) -> dict:
                 },
             }
 
+    # Read the history once for both the sequence checks and the update
+    history = load_tool_history()
+
     # Check if operation is allowed
-    is_allowed, reason, category = is_allowed_orchestrator_operation(tool, params)
+    is_allowed, reason, category = is_allowed_orchestrator_operation(
+        tool, params, enforcement_level, history
+    )
 
     # Add to history (for sequence detection)
-    add_to_tool_history(tool)
+    add_to_tool_history(tool, history)
 
     # Operation is allowed
     if is_allowed:
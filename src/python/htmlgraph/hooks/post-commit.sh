@@ -15,10 +15,10 @@ fi
 
 if ! command -v htmlgraph &> /dev/null; then
   if command -v python3 &> /dev/null; then
-    python3 -m htmlgraph.git_events commit &> /dev/null &
+    HTMLGRAPH_SYNC_GIT_EVENTS=1 python3 -m htmlgraph.git_events commit &> /dev/null &
   fi
   exit 0
 fi
 
-htmlgraph git-event commit &> /dev/null &
+HTMLGRAPH_SYNC_GIT_EVENTS=1 htmlgraph git-event commit &> /dev/null &
 exit 0
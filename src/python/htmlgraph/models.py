@@ -7,6 +7,7 @@ These models provide:
 - Lightweight context generation for AI agents
 """
 
+import json
 from datetime import datetime
 from enum import Enum
 from pathlib import Path
@@ -1372,8 +1373,6 @@ class Session(BaseModel):
             parent_session_attrs += f' data-nesting-depth="{self.nesting_depth}"'
 
         # Serialize work_breakdown as JSON if present
-        import json
-
         work_breakdown_attr = ""
         if self.work_breakdown:
             work_breakdown_json = json.dumps(self.work_breakdown)
@@ -1685,8 +1684,6 @@ class Pattern(Node):
         pattern_attrs += f' data-success-rate="{self.success_rate:.2f}"'
         pattern_attrs += f' data-detection-trend="{self.detection_trend}"'
         if self.sequence:
-            import json
-
             sequence_json = json.dumps(self.sequence)
             pattern_attrs += f" data-sequence='{sequence_json}'"
 
@@ -1852,8 +1849,6 @@ class SessionInsight(Node):
         </section>"""
 
         # Build insight-specific attributes
-        import json
-
         insight_attrs = (
             f' data-session-id="{self.session_id}"' if self.session_id else ""
         )
@@ -2049,8 +2044,6 @@ class AggregatedMetric(Node):
         </section>"""
 
         # Build metric-specific attributes
-        import json
-
         metric_attrs = f' data-metric-type="{self.metric_type}"'
         metric_attrs += f' data-scope="{self.scope}"'
         if self.scope_id:
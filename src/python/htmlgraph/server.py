@@ -16,6 +16,7 @@ import json
 import socket
 import sys
 import urllib.parse
+from collections.abc import Iterable
 from datetime import datetime, timezone
 from http.server import HTTPServer, SimpleHTTPRequestHandler
 from pathlib import Path
@@ -150,9 +151,17 @@ class HtmlGraphAPIHandler(SimpleHTTPRequestHandler):
                                     graph._nodes[track.id] = track  # type: ignore[assignment]
                                 except Exception:
                                     continue
+                    graph._invalidate_cache()
+                    graph._attr_index.clear()
                     return len(graph._nodes)
 
+                # A track's has_spec/has_plan depends on its sibling files,
+                # so file-level updates from the watcher redo the conversion
+                def reload_track_paths(paths: Iterable[str | Path]) -> int:
+                    return reload_tracks()
+
                 graph.reload = reload_tracks  # type: ignore[method-assign]
+                graph.reload_paths = reload_track_paths  # type: ignore[method-assign]
                 self.graphs[collection] = graph
             else:
                 self.graphs[collection] = HtmlGraph(
@@ -156,7 +156,11 @@ class TrackCollection:
             # Also remove from graph cache if loaded
             if self._graph is not None and track_id in self._graph._nodes:
                 self._graph._edge_index.remove_node(track_id)
+                self._graph._attr_index.remove_node(
+                    track_id, self._graph._nodes[track_id]
+                )
                 del self._graph._nodes[track_id]
+                self._graph._invalidate_cache()
             return True
 
         # Check for directory-based track: {track_id}/
@@ -166,7 +170,11 @@ class TrackCollection:
             # Also remove from graph cache if loaded
             if self._graph is not None and track_id in self._graph._nodes:
                 self._graph._edge_index.remove_node(track_id)
+                self._graph._attr_index.remove_node(
+                    track_id, self._graph._nodes[track_id]
+                )
                 del self._graph._nodes[track_id]
+                self._graph._invalidate_cache()
             return True
 
         return False
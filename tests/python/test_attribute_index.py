@@ -0,0 +1,173 @@
+"""
+Tests for AttributeIndex counts, HtmlGraph.stats(), node access and export caching.
+"""
+
+from collections import Counter
+
+import pytest
+from htmlgraph.attribute_index import AttributeIndex
+from htmlgraph.converter import node_to_html
+from htmlgraph.graph import HtmlGraph
+from htmlgraph.models import Edge, Node
+
+
+def _expected_stats(graph: HtmlGraph) -> dict:
+    nodes = list(graph.nodes.values())
+    done = sum(1 for node in nodes if node.status == "done")
+    return {
+        "total": len(nodes),
+        "by_status": dict(Counter(node.status for node in nodes)),
+        "by_type": dict(Counter(node.type for node in nodes)),
+        "by_priority": dict(Counter(node.priority for node in nodes)),
+        "edge_count": sum(
+            len(edges) for node in nodes for edges in node.edges.values()
+        ),
+        "completion_rate": round(done / len(nodes) * 100, 1) if nodes else 0,
+    }
+
+
+class TestAttributeIndexCounts:
+    def test_counts_follow_updates(self):
+        index = AttributeIndex()
+        todo = Node(id="a", title="A", type="feature", status="todo")
+        done = Node(id="a", title="A", type="feature", status="done", priority="high")
+
+        index.add_node("a", todo)
+        index.add_node("b", Node(id="b", title="B", type="bug", status="todo"))
+        index.update_node("a", todo, done)
+
+        assert index.count_by_status() == {"todo": 1, "done": 1}
+        assert index.count_by_priority() == {"medium": 1, "high": 1}
+        assert index.count_by_type() == {"feature": 1, "bug": 1}
+
+
+class TestGraphStats:
+    def test_stats_track_mutations(self, tmp_path):
+        graph = HtmlGraph(tmp_path, auto_load=False)
+        assert graph.stats() == _expected_stats(graph)
+
+        graph.add(Node(id="a", title="A", type="feature", status="todo"))
+        graph.add(
+            Node(
+                id="b",
+                title="B",
+                type="bug",
+                status="done",
+                edges={"blocked_by": [Edge(target_id="a")]},
+            )
+        )
+        assert graph.stats() == _expected_stats(graph)
+
+        graph.update(Node(id="a", title="A", type="feature", status="done"))
+        assert graph.stats() == _expected_stats(graph)
+
+        graph.remove("b")
+        assert graph.stats() == _expected_stats(graph)
+
+        # Changed on disk and picked up by reload_node
+        node_to_html(
+            Node(id="a", title="A", type="feature", status="blocked"),
+            tmp_path / "a.html",
+        )
+        graph.reload_node("a")
+        assert graph.stats()["by_status"] == {"blocked": 1}
+        assert graph.stats() == _expected_stats(graph)
+
+    def test_stats_after_add_does_not_rebuild_index(self, tmp_path, monkeypatch):
+        graph = HtmlGraph(tmp_path, auto_load=False)
+        graph.add(Node(id="a", title="A", type="feature", status="todo"))
+        graph.stats()
+
+        rebuilds = []
+        original = AttributeIndex.rebuild
+
+        def recording_rebuild(self, nodes):
+            rebuilds.append(len(nodes))
+            original(self, nodes)
+
+        monkeypatch.setattr(AttributeIndex, "rebuild", recording_rebuild)
+
+        graph.add(Node(id="b", title="B", type="bug", status="done"))
+        graph.update(Node(id="a", title="A", type="feature", status="done"))
+        graph.remove("b")
+        assert graph.stats() == _expected_stats(graph)
+        assert rebuilds == []
+
+    def test_stats_follow_in_place_mutation(self, tmp_path):
+        graph = HtmlGraph(tmp_path, auto_load=False)
+        graph.add(Node(id="a", title="A", type="feature", status="todo"))
+        graph.stats()
+
+        node = graph.get("a")
+        node.status = "done"
+        node.priority = "high"
+        graph.update(node)
+
+        assert graph.stats() == _expected_stats(graph)
+        assert graph.stats()["by_status"] == {"done": 1}
+
+
+class TestGraphNodesView:
+    def test_nodes_is_live_read_only_view(self, tmp_path):
+        graph = HtmlGraph(tmp_path, auto_load=False)
+        view = graph.nodes
+        graph.add(Node(id="a", title="A"))
+
+        assert list(view) == ["a"]
+        with pytest.raises(TypeError):
+            view["b"] = Node(id="b", title="B")  # type: ignore[index]
+
+        copy = graph.nodes_copy()
+        copy.pop("a")
+        assert "a" in graph.nodes
+
+
+class TestGraphLazyGet:
+    def test_get_parses_one_file_before_full_load(self, tmp_path):
+        for node_id in ("a", "b", "c"):
+            node_to_html(
+                Node(id=node_id, title=node_id.upper()), tmp_path / f"{node_id}.html"
+            )
+
+        graph = HtmlGraph(tmp_path, lazy=True)
+        assert graph.get("b").title == "B"
+        assert list(graph._nodes) == ["b"]
+
+        # Anything needing the whole graph still triggers the full load
+        assert len(graph) == 3
+        assert graph.get("a").title == "A"
+        assert graph.stats() == _expected_stats(graph)
+
+    def test_get_falls_back_when_filename_differs_from_id(self, tmp_path):
+        node_to_html(Node(id="real-id", title="X"), tmp_path / "other-name.html")
+
+        graph = HtmlGraph(tmp_path, lazy=True)
+        assert graph.get("other-name") is None
+        assert graph.get("real-id").title == "X"
+
+
+class TestGraphRenderCache:
+    def test_exports_are_cached_until_mutation(self, tmp_path):
+        graph = HtmlGraph(tmp_path, auto_load=False)
+        graph.add(Node(id="a", title="A", priority="high"))
+
+        diagram = graph.to_mermaid()
+        context = graph.to_context()
+        assert graph.to_mermaid() is diagram
+        assert graph.to_context() is context
+
+        graph.add(
+            Node(
+                id="b",
+                title="B",
+                priority="high",
+                edges={"blocked_by": [Edge(target_id="a")]},
+            )
+        )
+        assert "b -.->|blocked| a" in graph.to_mermaid()
+        assert "- b: B [todo]" in graph.to_context()
+        assert graph.stats()["edge_count"] == 1
+
+        graph.remove("b")
+        assert "b" not in graph.to_mermaid()
+        assert graph.stats()["edge_count"] == 0
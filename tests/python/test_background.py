@@ -0,0 +1,21 @@
+import subprocess
+import sys
+
+from htmlgraph import background
+
+
+def test_popen_detached_starts_new_session(monkeypatch):
+    calls = []
+    monkeypatch.setattr(sys, "platform", "linux")
+    monkeypatch.setattr(
+        background.subprocess, "Popen", lambda args, **kw: calls.append((args, kw))
+    )
+
+    background.popen_detached(["worker"], stdout=subprocess.DEVNULL)
+
+    [(args, kwargs)] = calls
+    assert args == ["worker"]
+    assert kwargs["start_new_session"] is True
+    assert kwargs["stdin"] is subprocess.DEVNULL
+    assert kwargs["stdout"] is subprocess.DEVNULL
+    assert "creationflags" not in kwargs
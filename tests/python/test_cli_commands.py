@@ -296,3 +296,176 @@ def test_cli_init_bootstraps_events_index_and_hooks(temp_graph_dir):
 
     gitignore = (temp_graph_dir / ".gitignore").read_text(encoding="utf-8")
     assert ".htmlgraph/index.sqlite" in gitignore
+    assert ".htmlgraph/drift-classification.log" in gitignore
+    assert ".htmlgraph/drift-classification.pid" in gitignore
+
+
+def test_cli_handler_maps_cli_error_to_exit_code(temp_graph_dir, capsys):
+    import argparse
+
+    from htmlgraph.cli import cmd_archive_list
+
+    args = argparse.Namespace(graph_dir=str(temp_graph_dir / "missing"), format="text")
+
+    with pytest.raises(SystemExit) as exc_info:
+        cmd_archive_list(args)
+
+    assert exc_info.value.code == 1
+    assert "Error: Directory not found" in capsys.readouterr().err
+
+
+@pytest.mark.parametrize("count", [0, 2])
+def test_cli_query_streams_valid_json(temp_graph_dir, capsys, count):
+    import argparse
+    import json
+
+    from htmlgraph.cli import cmd_query
+
+    graph = HtmlGraph(temp_graph_dir / "features")
+    for i in range(count):
+        graph.add(Node(id=f"feat-{i}", title=f"Feature {i}", status="todo"))
+
+    args = argparse.Namespace(
+        graph_dir=str(temp_graph_dir), selector="[data-status='todo']", format="json"
+    )
+    cmd_query(args)
+
+    results = json.loads(capsys.readouterr().out)
+    assert sorted(r["id"] for r in results) == [f"feat-{i}" for i in range(count)]
+    assert all(r.pop("_collection") == "features" for r in results)
+    for r in results:
+        assert r == json.loads(graph.get(r["id"]).model_dump_json())
+
+
+def test_cli_query_closes_json_array_on_error(temp_graph_dir, capsys, monkeypatch):
+    import argparse
+    import json
+
+    from htmlgraph.cli import cmd_query
+
+    HtmlGraph(temp_graph_dir / "features").add(Node(id="feat-1", title="One"))
+    HtmlGraph(temp_graph_dir / "bugs").add(Node(id="bug-1", title="Bug"))
+    real_query = HtmlGraph.query
+    returned = []
+
+    # Fail on the first collection queried after one produced output
+    def failing_query(self, selector):
+        if returned:
+            raise ValueError("malformed collection")
+        matches = real_query(self, selector)
+        returned.extend(matches)
+        return matches
+
+    monkeypatch.setattr(HtmlGraph, "query", failing_query)
+
+    args = argparse.Namespace(
+        graph_dir=str(temp_graph_dir), selector="[data-status='todo']", format="json"
+    )
+    with pytest.raises(ValueError, match="malformed collection"):
+        cmd_query(args)
+
+    results = json.loads(capsys.readouterr().out)
+    assert len(results) == 1
+
+
+def test_cli_status_index_tracks_file_changes(temp_graph_dir, capsys):
+    import argparse
+    import json
+    import os
+
+    from htmlgraph.cli import cmd_status
+
+    graph = HtmlGraph(temp_graph_dir / "features")
+    graph.add(Node(id="feat-1", title="One", type="feature", status="todo"))
+    graph.add(Node(id="feat-2", title="Two", type="feature", status="done"))
+    graph.add(Node(id="note-1", title="Other type", type="note"))
+    # Age the files so the index caches them
+    for path in (temp_graph_dir / "features").iterdir():
+        os.utime(path, ns=(1_000_000_000, 1_000_000_000))
+
+    args = argparse.Namespace(
+        graph_dir=str(temp_graph_dir), format="json", quiet=False, verbose=0
+    )
+
+    def status() -> dict:
+        cmd_status(args)
+        return json.loads(capsys.readouterr().out)["data"]
+
+    assert status()["by_status"] == {"done": 1, "todo": 1}
+    assert (temp_graph_dir / ".status-index.json").exists()
+
+    graph.update(Node(id="feat-1", title="One", type="feature", status="done"))
+    data = status()
+    assert data["total_nodes"] == 2
+    assert data["by_status"] == {"done": 2}
+
+    graph.remove("feat-2")
+    assert status()["by_collection"] == {"features": 1}
+
+
+def test_cli_status_resolves_duplicate_ids_like_sdk(temp_graph_dir, capsys):
+    import argparse
+    import json
+
+    from htmlgraph.cli import cmd_status
+    from htmlgraph.converter import node_to_html
+
+    features_dir = temp_graph_dir / "features"
+    features_dir.mkdir(exist_ok=True)
+    # Several files claim the same ID; directory order decides which one
+    # HtmlGraph keeps, which generally differs from sorted order
+    statuses = ["done", "in-progress", "todo", "blocked"]
+    for i in range(8):
+        node_to_html(
+            Node(
+                id="feat-dup", title=f"Copy {i}", type="feature", status=statuses[i % 4]
+            ),
+            features_dir / f"dup-{i}.html",
+        )
+
+    args = argparse.Namespace(
+        graph_dir=str(temp_graph_dir), format="json", quiet=False, verbose=0
+    )
+    cmd_status(args)
+    data = json.loads(capsys.readouterr().out)["data"]
+
+    sdk_node = HtmlGraph(features_dir).get("feat-dup")
+    assert data["by_status"] == {sdk_node.status: 1}
+
+
+def test_query_accepts_compiled_selector(sample_graph):
+    from htmlgraph.graph import CompiledQuery
+
+    sample_graph.add(Node(id="feat-1", title="One", status="blocked"))
+    sample_graph.add(Node(id="feat-2", title="Two", status="todo"))
+
+    compiled = CompiledQuery(selector="[data-status='blocked']")
+
+    assert [n.id for n in sample_graph.query(compiled)] == ["feat-1"]
+    assert [n.id for n in sample_graph.snapshot().query(compiled)] == ["feat-1"]
+    assert sample_graph.query("[data-status='todo']")[0].id == "feat-2"
+    assert sample_graph.query("[data-status=") == []
+
+
+@pytest.mark.parametrize("selector", ["#feat-1", "[id='feat-1']", "[id=feat-1]"])
+def test_cli_query_id_selector_loads_single_node(
+    temp_graph_dir, capsys, monkeypatch, selector
+):
+    import argparse
+    import json
+
+    from htmlgraph.cli import cmd_query
+
+    HtmlGraph(temp_graph_dir / "features").add(Node(id="feat-1", title="One"))
+    HtmlGraph(temp_graph_dir / "bugs").add(Node(id="bug-1", title="Bug"))
+    monkeypatch.setattr(
+        HtmlGraph, "reload", lambda self: pytest.fail("full load for ID selector")
+    )
+
+    args = argparse.Namespace(
+        graph_dir=str(temp_graph_dir), selector=selector, format="json"
+    )
+    cmd_query(args)
+
+    results = json.loads(capsys.readouterr().out)
+    assert [(r["id"], r["_collection"]) for r in results] == [("feat-1", "features")]
@@ -0,0 +1,535 @@
+"""Tests for HTML <-> model converters."""
+
+import json
+import os
+import time
+from datetime import datetime
+
+import pytest
+from htmlgraph import converter, parser
+from htmlgraph.converter import dumps_json_bytes, node_to_json_bytes
+from htmlgraph.models import ActivityEntry, Chore, Edge, Node, Session, Spike, Step
+from htmlgraph.parser import HtmlParser
+
+
+@pytest.fixture
+def sample_node():
+    """Node with datetimes on the node and on an edge."""
+    return Node(
+        id="feat-001",
+        title="Sample",
+        created=datetime(2024, 1, 2, 3, 4, 5),
+        updated=datetime(2024, 1, 2, 3, 4, 6),
+        edges={
+            "blocks": [Edge(target_id="feat-002", since=datetime(2024, 1, 1, 0, 0, 0))]
+        },
+    )
+
+
+class TestJsonExport:
+    """Tests for JSON export helpers."""
+
+    @pytest.mark.parametrize("has_orjson", [True, False])
+    def test_dumps_json_bytes_encodes_datetimes(
+        self, monkeypatch, sample_node, has_orjson
+    ):
+        """Both the orjson and stdlib paths emit ISO datetimes."""
+        if has_orjson and not converter.HAS_ORJSON:
+            pytest.skip("orjson not installed")
+        monkeypatch.setattr(converter, "HAS_ORJSON", has_orjson)
+
+        data = json.loads(dumps_json_bytes(sample_node.model_dump(), indent=True))
+
+        assert data["created"] == "2024-01-02T03:04:05"
+        assert data["edges"]["blocks"][0]["since"] == "2024-01-01T00:00:00"
+
+    @pytest.mark.parametrize("has_orjson", [True, False])
+    def test_dumps_json_bytes_coerces_non_str_keys(self, monkeypatch, has_orjson):
+        """Both paths stringify int keys the way the stdlib json module does."""
+        if has_orjson and not converter.HAS_ORJSON:
+            pytest.skip("orjson not installed")
+        monkeypatch.setattr(converter, "HAS_ORJSON", has_orjson)
+
+        data = json.loads(dumps_json_bytes({"properties": {1: "a", 2.5: "b"}}))
+
+        assert data == {"properties": {"1": "a", "2.5": "b"}}
+
+    def test_node_to_json_bytes_round_trips(self, sample_node):
+        """Serialized bytes decode back to the node's fields."""
+        data = json.loads(node_to_json_bytes(sample_node))
+
+        assert data["id"] == "feat-001"
+        assert data["edges"]["blocks"][0]["target_id"] == "feat-002"
+
+    def test_node_to_dict_is_json_serializable(self, sample_node):
+        """All datetimes, including optional ones, become ISO strings."""
+        sample_node.claimed_at = datetime(2024, 1, 3, 0, 0, 0)
+
+        data = converter.node_to_dict(sample_node)
+
+        assert data["created"] == "2024-01-02T03:04:05"
+        assert data["claimed_at"] == "2024-01-03T00:00:00"
+        assert data["edges"]["blocks"][0]["since"] == "2024-01-01T00:00:00"
+        json.dumps(data)
+
+    def test_session_export_serializes_all_datetimes(self):
+        """Dict and bytes export agree and stringify every timestamp."""
+        session = Session(
+            id="sess-001",
+            agent="claude",
+            started_at=datetime(2024, 1, 2, 3, 4, 5),
+            transcript_synced_at=datetime(2024, 1, 2, 4, 0, 0),
+            activity_log=[
+                ActivityEntry(
+                    tool="Edit", summary="x", timestamp=datetime(2024, 1, 2, 3, 5, 0)
+                )
+            ],
+        )
+
+        data = converter.session_to_dict(session)
+
+        assert data["started_at"] == "2024-01-02T03:04:05"
+        assert data["transcript_synced_at"] == "2024-01-02T04:00:00"
+        assert data["activity_log"][0]["timestamp"] == "2024-01-02T03:05:00"
+        assert json.loads(converter.session_to_json_bytes(session)) == data
+
+
+class TestNodeConverter:
+    """Tests for NodeConverter batch operations."""
+
+    @pytest.mark.parametrize("count", [3, 20])
+    def test_load_all_skips_malformed_files(self, tmp_path, count):
+        """Serial and pooled loads both return every valid node."""
+        conv = converter.NodeConverter(tmp_path)
+        for i in range(count):
+            conv.save(Node(id=f"feat-{i:03d}", title=f"Feature {i}"))
+        (tmp_path / "broken.html").write_text("<html><body></body></html>")
+
+        nodes = conv.load_all()
+
+        assert sorted(n.id for n in nodes) == [f"feat-{i:03d}" for i in range(count)]
+
+    def test_load_all_nested_pattern(self, tmp_path):
+        """Flat and nested patterns match what Path.glob would return."""
+        conv = converter.NodeConverter(tmp_path)
+        conv.save(Node(id="feat-001", title="Flat"))
+        converter.node_to_html(
+            Node(id="trk-001", title="Nested"), tmp_path / "trk-001" / "index.html"
+        )
+        (tmp_path / "dir.html").mkdir()
+
+        flat = conv.load_all()
+        both = conv.load_all(["*.html", "*/index.html"])
+
+        assert [n.id for n in flat] == ["feat-001"]
+        assert sorted(n.id for n in both) == ["feat-001", "trk-001"]
+
+    @pytest.mark.parametrize("count", [3, 20])
+    def test_save_all_writes_rendered_nodes(self, tmp_path, count):
+        """Serial and pooled saves write each node's full render."""
+        conv = converter.NodeConverter(tmp_path / "features")
+        nodes = [Node(id=f"feat-{i:03d}", title=f"Feature {i}") for i in range(count)]
+
+        paths = conv.save_all(nodes)
+
+        assert [p.name for p in paths] == [f"{n.id}.html" for n in nodes]
+        for node, path in zip(nodes, paths):
+            assert path.read_text(encoding="utf-8") == node.to_html()
+        assert all(conv.exists(n.id) for n in nodes)
+
+    def test_save_all_last_duplicate_wins(self, tmp_path):
+        """A batch that repeats an ID keeps the last version."""
+        conv = converter.NodeConverter(tmp_path)
+        nodes = [Node(id="feat-001", title=f"Version {i}") for i in range(10)]
+
+        conv.save_all(nodes)
+
+        assert conv.load("feat-001").title == "Version 9"
+
+    def test_load_all_reparses_only_changed_files(self, tmp_path, monkeypatch):
+        """Unchanged files come from the cache as independent copies."""
+        conv = converter.NodeConverter(tmp_path)
+        for i in range(3):
+            conv.save(Node(id=f"feat-{i}", title=f"Feature {i}"))
+        for path in tmp_path.iterdir():
+            os.utime(path, ns=(1_000_000_000, 1_000_000_000))
+        first = {n.id: n for n in conv.load_all()}
+
+        parsed = []
+        real_try_html_to_node = converter._try_html_to_node
+
+        def counting(filepath):
+            parsed.append(os.path.basename(filepath))
+            return real_try_html_to_node(filepath)
+
+        monkeypatch.setattr(converter, "_try_html_to_node", counting)
+        first["feat-0"].title = "Edited in memory"
+        other = converter.NodeConverter(tmp_path)
+        other.save(Node(id="feat-1", title="Changed on disk"))
+        (tmp_path / "feat-2.html").unlink()
+
+        second = {n.id: n for n in conv.load_all()}
+
+        assert parsed == ["feat-1.html"]
+        assert second["feat-0"].title == "Feature 0"
+        assert second["feat-1"].title == "Changed on disk"
+        assert "feat-2" not in second
+
+    def test_load_all_sees_same_size_rewrite_within_coarse_tick(self, tmp_path):
+        """A file still inside a 1-2 s timestamp tick is not served from cache."""
+        conv = converter.NodeConverter(tmp_path)
+        filepath = tmp_path / "feat-001.html"
+        # As written on a 2 s granularity filesystem: mtime truncated to the tick
+        tick_ns = time.time_ns() - 1_500_000_000
+
+        conv.save(Node(id="feat-001", title="Feature A", status="todo"))
+        os.utime(filepath, ns=(tick_ns, tick_ns))
+        assert conv.load_all()[0].title == "Feature A"
+
+        # Same size, same tick: only the racy window can tell them apart
+        converter.NodeConverter(tmp_path).save(
+            Node(id="feat-001", title="Feature B", status="todo")
+        )
+        os.utime(filepath, ns=(tick_ns, tick_ns))
+        assert conv.load_all()[0].title == "Feature B"
+
+    def test_exists_tracks_save_and_delete(self, tmp_path):
+        """Cached listing reflects the converter's own writes."""
+        conv = converter.NodeConverter(tmp_path)
+        assert not conv.exists("feat-001")
+        assert conv.load("feat-001") is None
+
+        conv.save(Node(id="feat-001", title="Feature"))
+        assert conv.exists("feat-001")
+        assert conv.load("feat-001").title == "Feature"
+
+        assert conv.delete("feat-001") is True
+        assert not conv.exists("feat-001")
+        assert conv.delete("feat-001") is False
+
+    def test_exists_sees_external_writes(self, tmp_path):
+        """Files written behind the converter's back are still found."""
+        conv = converter.NodeConverter(tmp_path)
+        assert not conv.exists("feat-002")
+
+        other = converter.NodeConverter(tmp_path)
+        other.save(Node(id="feat-002", title="External"))
+
+        assert conv.exists("feat-002")
+
+    def test_exists_sees_writes_hidden_by_stale_directory_mtime(self, tmp_path):
+        """A miss is confirmed on disk when the directory mtime did not move."""
+        old_ns = 1_000_000_000_000_000_000
+        os.utime(tmp_path, ns=(old_ns, old_ns))
+        conv = converter.NodeConverter(tmp_path)
+        assert not conv.exists("feat-002")
+
+        # Same directory mtime, as on a coarse-timestamp or NFS mount
+        converter.NodeConverter(tmp_path).save(Node(id="feat-002", title="External"))
+        os.utime(tmp_path, ns=(old_ns, old_ns))
+
+        assert conv.exists("feat-002")
+        assert conv.load("feat-002").title == "External"
+
+    def test_update_node_html_applies_known_fields(self, tmp_path):
+        """Known fields are written back; unknown keys are ignored."""
+        filepath = converter.node_to_html(
+            Node(id="feat-001", title="Feature"), tmp_path / "feat-001.html"
+        )
+
+        updated = converter.update_node_html(
+            filepath, {"status": "done", "title": "Renamed", "bogus": 1}
+        )
+
+        assert updated.status == "done"
+        reloaded = converter.html_to_node(filepath)
+        assert reloaded.status == "done"
+        assert reloaded.title == "Renamed"
+
+    @pytest.mark.parametrize("model", [Node, Spike, Chore])
+    def test_update_node_html_patch_matches_full_render(self, tmp_path, model):
+        """The in-place patch yields exactly what a full render would."""
+        node = model(id="feat-001", title="Feature", status="todo", priority="low")
+        filepath = converter.node_to_html(node, tmp_path / "feat-001.html")
+
+        updated = converter.update_node_html(
+            filepath,
+            {
+                "status": "in-progress",
+                "priority": "high",
+                "updated": datetime(2024, 5, 6, 7, 8, 9),
+            },
+        )
+
+        assert filepath.read_text(encoding="utf-8") == updated.to_html()
+        assert converter.html_to_node(filepath).status == "in-progress"
+
+    def test_update_node_html_falls_back_on_ambiguous_html(self, tmp_path):
+        """Content that repeats a patched fragment forces a full render."""
+        node = Node(
+            id="feat-001",
+            title="Feature",
+            status="todo",
+            content='<p data-status="todo">note</p>',
+        )
+        filepath = converter.node_to_html(node, tmp_path / "feat-001.html")
+
+        updated = converter.update_node_html(filepath, {"status": "done"})
+
+        assert filepath.read_text(encoding="utf-8") == updated.to_html()
+        assert converter.html_to_node(filepath).status == "done"
+
+    def test_update_node_html_reflects_file_contents(self, tmp_path):
+        """Each update starts from the file, not from earlier in-process writes."""
+        filepath = converter.node_to_html(
+            Node(id="feat-001", title="Feature"), tmp_path / "feat-001.html"
+        )
+
+        # plan_task_id is not rendered to HTML, so it must not carry over
+        converter.update_node_html(filepath, {"plan_task_id": "task-1"})
+        second = converter.update_node_html(filepath, {"priority": "high"})
+
+        assert second.plan_task_id is None
+        assert second == converter.html_to_node(filepath)
+
+        converter.node_to_html(Node(id="feat-001", title="Edited elsewhere"), filepath)
+        third = converter.update_node_html(filepath, {"status": "done"})
+        assert third.title == "Edited elsewhere"
+
+    def test_html_to_node_round_trips_edges_and_steps(self, tmp_path):
+        """Edges and steps read back equal to what was written."""
+        node = Node(
+            id="feat-001",
+            title="Feature",
+            edges={
+                "blocks": [
+                    Edge(
+                        target_id="feat-002",
+                        relationship="blocks",
+                        title="Other",
+                        since=datetime(2024, 1, 1, 0, 0, 0),
+                    )
+                ]
+            },
+            steps=[
+                Step(description="First", completed=True, agent="claude"),
+                Step(description="Second"),
+            ],
+        )
+        filepath = converter.node_to_html(node, tmp_path / "feat-001.html")
+
+        loaded = converter.html_to_node(filepath)
+
+        assert loaded.edges["blocks"][0] == node.edges["blocks"][0]
+        assert [(s.description, s.completed, s.agent) for s in loaded.steps] == [
+            ("First", True, "claude"),
+            ("Second", False, None),
+        ]
+
+    def test_html_to_node_reads_crlf_files(self, tmp_path):
+        """Files with Windows line endings parse like their LF originals."""
+        node = Node(id="feat-001", title="Feature", content="<p>Body</p>")
+        html = node.to_html()
+        filepath = tmp_path / "feat-001.html"
+        filepath.write_bytes(html.replace("\n", "\r\n").encode("utf-8"))
+
+        assert converter.html_to_node(filepath).title == "Feature"
+        assert HtmlParser.from_file(filepath)._raw == html
+
+    def test_dict_to_node_parses_iso_strings(self):
+        """Z-suffixed and offset timestamps parse to aware datetimes."""
+        node = converter.dict_to_node(
+            {
+                "id": "feat-001",
+                "title": "Feature",
+                "created": "2024-01-02T03:04:05Z",
+                "updated": "2024-01-02T03:04:06+00:00",
+                "edges": {
+                    "blocks": [
+                        {"target_id": "feat-002", "since": "2024-01-01T00:00:00Z"}
+                    ]
+                },
+                "steps": [{"description": "Step", "timestamp": "2024-01-03T00:00:00"}],
+            }
+        )
+
+        assert node.created.utcoffset().total_seconds() == 0
+        assert node.created == node.updated.replace(second=5)
+        assert node.edges["blocks"][0].since.year == 2024
+        assert node.steps[0].timestamp == datetime(2024, 1, 3)
+
+    @pytest.mark.parametrize("parse_iso", [parser._parse_iso, parser._parse_iso_compat])
+    def test_parse_iso_handles_z_suffix(self, parse_iso):
+        """Both the native and compat parsers treat "Z" as UTC."""
+        assert parse_iso("2024-01-02T03:04:05Z") == parse_iso(
+            "2024-01-02T03:04:05+00:00"
+        )
+        assert parse_iso("2024-01-02T03:04:05").tzinfo is None
+
+    def test_node_to_html_creates_missing_parent_dirs(self, tmp_path):
+        """Parent directories are created on demand unless disabled."""
+        node = Node(id="feat-1", title="One")
+        filepath = tmp_path / "a" / "b" / "feat-1.html"
+
+        with pytest.raises(FileNotFoundError):
+            converter.node_to_html(node, filepath, create_dirs=False)
+        converter.node_to_html(node, filepath)
+
+        assert converter.html_to_node(filepath).id == "feat-1"
+
+    def test_read_node_file_matches_html_to_node(self, tmp_path):
+        """The internal reader parses the same node and still raises on
+        missing files."""
+        filepath = tmp_path / "feat-1.html"
+        converter.node_to_html(Node(id="feat-1", title="One"), filepath)
+
+        assert converter._read_node_file(str(filepath)) == converter.html_to_node(
+            filepath
+        )
+        with pytest.raises(FileNotFoundError):
+            converter._read_node_file(str(tmp_path / "missing.html"))
+
+    def test_parser_metadata_parses_z_timestamps(self):
+        """Node metadata timestamps with a "Z" suffix parse as UTC."""
+        metadata = HtmlParser.from_string(
+            '<article id="feat-1" data-created="2024-01-02T03:04:05Z" '
+            'data-updated="2024-01-02T03:04:06"></article>'
+        ).get_node_metadata()
+
+        assert metadata["created"].utcoffset().total_seconds() == 0
+        assert metadata["updated"].tzinfo is None
+
+    def test_dict_to_session_parses_activity_timestamps(self):
+        """Session and activity timestamps are parsed from ISO strings."""
+        session = converter.dict_to_session(
+            {
+                "id": "sess-001",
+                "agent": "claude",
+                "started_at": "2024-01-02T03:04:05Z",
+                "activity_log": [
+                    {
+                        "tool": "Edit",
+                        "summary": "x",
+                        "timestamp": "2024-01-02T03:05:00Z",
+                    }
+                ],
+            }
+        )
+
+        assert session.started_at.utcoffset().total_seconds() == 0
+        assert session.activity_log[0].timestamp.minute == 5
+
+    def test_merge_nodes_applies_only_set_overlay_fields(self):
+        """Unset overlay fields keep base values; containers merge."""
+        base = Node(
+            id="feat-001",
+            title="Base",
+            priority="high",
+            properties={"a": 1, "b": 2},
+            edges={
+                "blocks": [Edge(target_id="feat-002")],
+                "related": [Edge(target_id="feat-003")],
+            },
+        )
+        overlay = Node(
+            id="feat-001",
+            title="Overlay",
+            properties={"b": 3},
+            edges={"blocks": [Edge(target_id="feat-004")]},
+        )
+
+        merged = converter.merge_nodes(base, overlay)
+
+        assert merged.title == "Overlay"
+        assert merged.priority == "high"
+        assert merged.properties == {"a": 1, "b": 3}
+        assert [e.target_id for e in merged.edges["blocks"]] == ["feat-004"]
+        assert [e.target_id for e in merged.edges["related"]] == ["feat-003"]
+        assert base.properties == {"a": 1, "b": 2}
+
+    def test_merge_nodes_result_is_independent(self):
+        """Mutating the merged node leaves base and overlay untouched."""
+        base = Node(
+            id="feat-001",
+            title="Base",
+            properties={"meta": {"k": 1}},
+            edges={"related": [Edge(target_id="feat-003")]},
+            steps=[Step(description="First")],
+        )
+        overlay = Node(
+            id="feat-001",
+            title="Overlay",
+            edges={"blocks": [Edge(target_id="feat-004")]},
+        )
+        base_before = base.model_dump()
+        overlay_before = overlay.model_dump()
+
+        merged = converter.merge_nodes(base, overlay)
+        merged.add_edge(Edge(target_id="feat-005", relationship="related"))
+        merged.add_edge(Edge(target_id="feat-006", relationship="blocks"))
+        merged.complete_step(0)
+        merged.properties["meta"]["k"] = 2
+
+        assert base.model_dump() == base_before
+        assert overlay.model_dump() == overlay_before
+
+
+class TestSessionConverter:
+    """Tests for SessionConverter batch operations."""
+
+    @pytest.mark.parametrize("max_workers", [None, 1])
+    def test_load_all_skips_malformed_files(self, tmp_path, max_workers):
+        """Pooled and serial loads both return every valid session."""
+        sessions_dir = tmp_path / "sessions"
+        conv = converter.SessionConverter(sessions_dir)
+        for i in range(10):
+            conv.save(Session(id=f"sess-{i:03d}", agent="claude"))
+        (sessions_dir / "broken.html").write_text("<html><body></body></html>")
+
+        sessions = conv.load_all(max_workers=max_workers)
+
+        assert sorted(s.id for s in sessions) == [f"sess-{i:03d}" for i in range(10)]
+
+    def test_exists_and_delete(self, tmp_path):
+        """Existence checks and deletes work on session files by ID."""
+        conv = converter.SessionConverter(tmp_path)
+        conv.save(Session(id="sess-001", agent="claude"))
+
+        assert conv.exists("sess-001")
+        assert conv.delete("sess-001") is True
+        assert not conv.exists("sess-001")
+        assert conv.delete("sess-001") is False
+
+    def test_html_to_session_round_trips_sections(self, tmp_path):
+        """Edges, handoff context and the activity log survive a round trip."""
+        session = Session(
+            id="sess-001",
+            agent="claude",
+            title="Work",
+            worked_on=["feat-001", "feat-002"],
+            continued_from="sess-000",
+            handoff_notes="Halfway",
+            recommended_next="Finish",
+            blockers=["Review"],
+        )
+        for i in range(3):
+            session.add_activity(
+                ActivityEntry(
+                    id=f"evt-{i}",
+                    tool="Edit",
+                    summary=f"Edit {i}",
+                    feature_id="feat-001",
+                    timestamp=datetime(2024, 1, 1, 0, i),
+                )
+            )
+        filepath = converter.session_to_html(session, tmp_path / "sess-001.html")
+
+        loaded = converter.html_to_session(filepath)
+
+        assert loaded.title == "Work"
+        assert loaded.worked_on == ["feat-001", "feat-002"]
+        assert loaded.continued_from == "sess-000"
+        assert (loaded.handoff_notes, loaded.recommended_next) == ("Halfway", "Finish")
+        assert loaded.blockers == ["Review"]
+        assert [e.id for e in loaded.activity_log] == ["evt-0", "evt-1", "evt-2"]
+        assert loaded.activity_log[0].feature_id == "feat-001"
@@ -1,10 +1,12 @@
 from __future__ import annotations
 
+import json
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 
 from htmlgraph.analytics_index import AnalyticsIndex
-from htmlgraph.event_log import EventRecord, JsonlEventLog
+from htmlgraph.event_log import EventRecord, JsonlEventLog, append_jsonl_bytes
 
 
 def test_jsonl_event_log_append_and_iter(tmp_path: Path):
@@ -79,6 +81,80 @@ def test_jsonl_event_log_dedupes_duplicate_event_id(tmp_path: Path):
     assert len(lines) == 1
 
 
+def test_jsonl_event_log_append_many(tmp_path: Path):
+    log = JsonlEventLog(tmp_path / "events")
+
+    def record(event_id: str, session_id: str) -> EventRecord:
+        return EventRecord(
+            event_id=event_id,
+            timestamp=datetime(2025, 1, 1, 12, 0, 0),
+            session_id=session_id,
+            agent="claude-code",
+            tool="GitCommit",
+            summary="Commit abc",
+            success=True,
+            feature_id=None,
+            drift_score=None,
+            start_commit=None,
+            continued_from=None,
+            file_paths=[],
+            payload={},
+        )
+
+    log.append(record("e-1", "s"))
+    paths = log.append_many(
+        [record("e-1", "s"), record("e-2", "s"), record("e-2", "s"), record("e-3", "t")]
+    )
+
+    assert paths == [log.path_for_session(sid) for sid in ("s", "s", "s", "t")]
+    events = sorted(e["event_id"] for _, e in log.iter_events())
+    assert events == ["e-1", "e-2", "e-3"]
+
+
+def test_jsonl_event_log_serializes_awkward_payloads(tmp_path: Path):
+    log = JsonlEventLog(tmp_path / "events")
+    payload = {"message": "héllo ✓", "numstat": {1: "a.txt"}, "big": 2**70}
+    log.append(
+        EventRecord(
+            event_id="e-1",
+            timestamp=datetime(2025, 1, 1, 12, 0, 0),
+            session_id="s",
+            agent="claude-code",
+            tool="GitCommit",
+            summary="Commit abc",
+            success=True,
+            feature_id=None,
+            drift_score=None,
+            start_commit=None,
+            continued_from=None,
+            payload=payload,
+        )
+    )
+
+    [(_, event)] = list(log.iter_events())
+    assert event["payload"] == {
+        "message": "héllo ✓",
+        "numstat": {"1": "a.txt"},
+        "big": 2**70,
+    }
+    assert event["timestamp"] == "2025-01-01T12:00:00"
+
+
+def test_append_jsonl_bytes_keeps_concurrent_lines_whole(tmp_path: Path):
+    path = tmp_path / "events.jsonl"
+
+    def write(i: int) -> None:
+        # Well past PIPE_BUF, so large appends exercise the locked path too
+        line = json.dumps({"i": i, "blob": str(i) * (1000 + i * 40)}) + "\n"
+        append_jsonl_bytes(path, line.encode("utf-8"))
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        list(pool.map(write, range(200)))
+
+    lines = path.read_text(encoding="utf-8").splitlines()
+    assert sorted(json.loads(line)["i"] for line in lines) == list(range(200))
+
+
 def test_analytics_index_rebuild_overview(tmp_path: Path):
     db = AnalyticsIndex(tmp_path / "index.sqlite")
 
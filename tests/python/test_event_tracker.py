@@ -0,0 +1,275 @@
+"""
+Tests for the hook event tracker helpers.
+"""
+
+import json
+import os
+import subprocess
+from datetime import datetime, timedelta
+
+import pytest
+from htmlgraph.hooks import event_tracker
+
+
+def test_load_drift_config_cached_until_file_changes(tmp_path, monkeypatch):
+    project = tmp_path / "project"
+    config_path = project / ".claude" / "config" / "drift-config.json"
+    config_path.parent.mkdir(parents=True)
+    config_path.write_text(json.dumps({"drift_detection": {"enabled": False}}))
+
+    # config_paths are resolved relative to the module file and CLAUDE_* dirs
+    fake_module = project / "src" / "python" / "htmlgraph" / "hooks" / "x.py"
+    monkeypatch.setattr(event_tracker, "__file__", str(fake_module))
+    monkeypatch.setattr(event_tracker, "_DRIFT_CONFIG_CACHE", {})
+    monkeypatch.delenv("CLAUDE_PROJECT_DIR", raising=False)
+    monkeypatch.delenv("CLAUDE_PLUGIN_ROOT", raising=False)
+
+    first = event_tracker.load_drift_config()
+    assert first == {"drift_detection": {"enabled": False}}
+    assert event_tracker.load_drift_config() is first
+
+    config_path.write_text(json.dumps({"drift_detection": {"enabled": True}}))
+    st = config_path.stat()
+    os.utime(config_path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+    assert event_tracker.load_drift_config() == {"drift_detection": {"enabled": True}}
+
+
+def test_add_to_drift_queue_writes_once(tmp_path, monkeypatch):
+    stale = (datetime.now() - timedelta(hours=50)).isoformat()
+    (tmp_path / event_tracker.DRIFT_QUEUE_FILE).write_text(
+        json.dumps(
+            {
+                "activities": [{"timestamp": stale, "tool": "Old"}],
+                "last_classification": None,
+            }
+        )
+    )
+    saves = []
+    real_save = event_tracker.save_drift_queue
+    monkeypatch.setattr(
+        event_tracker,
+        "save_drift_queue",
+        lambda graph_dir, queue: saves.append(queue) or real_save(graph_dir, queue),
+    )
+
+    queue = event_tracker.add_to_drift_queue(
+        tmp_path, {"tool": "Edit", "drift_score": 0.9}, {}
+    )
+
+    assert [a["tool"] for a in queue["activities"]] == ["Edit"]
+    assert len(saves) == 1
+    assert event_tracker.load_drift_queue(tmp_path) == queue
+
+
+def test_resolve_project_path_walks_up_to_git_root(tmp_path, monkeypatch):
+    monkeypatch.setattr(event_tracker, "_PROJECT_PATH_CACHE", {})
+    monkeypatch.delenv("GIT_DIR", raising=False)
+    monkeypatch.delenv("GIT_WORK_TREE", raising=False)
+    repo = tmp_path / "repo"
+    nested = repo / "src" / "pkg"
+    nested.mkdir(parents=True)
+    (repo / ".git").mkdir()
+    # A worktree or submodule checkout has a .git *file*
+    (nested / ".git").write_text("gitdir: ../../.git/modules/pkg\n")
+
+    expected = os.path.realpath(repo)
+    assert event_tracker.resolve_project_path(str(repo / "src")) == expected
+    assert event_tracker.resolve_project_path(str(nested)) == os.path.realpath(nested)
+
+    # Cached per starting directory: no repeat filesystem walk
+    monkeypatch.setattr(event_tracker, "_find_git_root", lambda start_dir: None)
+    assert event_tracker.resolve_project_path(str(repo / "src")) == expected
+
+
+def test_format_tool_summary():
+    summary = event_tracker.format_tool_summary
+    assert summary("Read", {"file_path": "a.py"}) == "Read: a.py"
+    assert summary("Bash", {"command": "ls", "description": "List"}) == "Bash: List"
+    assert summary("Bash", {"command": "x" * 80}) == "Bash: " + "x" * 60
+    assert summary("TodoWrite", {"todos": [{}, {}]}) == "TodoWrite: 2 items"
+    assert summary("Custom", {"k": 1}) == "Custom: {'k': 1}"
+
+
+def test_save_drift_queue_replaces_file_atomically(tmp_path, monkeypatch):
+    queue_path = tmp_path / event_tracker.DRIFT_QUEUE_FILE
+    event_tracker.save_drift_queue(tmp_path, {"activities": [{"tool": "A"}]})
+
+    def fail_replace(src, dst):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(event_tracker.os, "replace", fail_replace)
+    event_tracker.save_drift_queue(tmp_path, {"activities": [{"tool": "B"}]})
+
+    # The failed save leaves the previous queue intact and no temp files behind
+    assert json.loads(queue_path.read_text()) == {"activities": [{"tool": "A"}]}
+    assert [p.name for p in tmp_path.iterdir()] == [queue_path.name]
+
+
+def test_spawn_headless_classification_is_detached(tmp_path, monkeypatch):
+    calls = []
+
+    class FakePopen:
+        pid = os.getpid()
+
+        def __init__(self, cmd, **kwargs):
+            calls.append((cmd, kwargs))
+
+    monkeypatch.setattr(event_tracker.subprocess, "Popen", FakePopen)
+
+    assert event_tracker.spawn_headless_classification(tmp_path, "classify this")
+    [(cmd, kwargs)] = calls
+    assert cmd[-2:] == [str(tmp_path), "classify this"]
+    assert kwargs["stdin"] is event_tracker.subprocess.DEVNULL
+    assert event_tracker.classification_in_progress(tmp_path)
+
+    (tmp_path / event_tracker.CLASSIFICATION_PID_FILE).write_text("not-a-pid")
+    assert not event_tracker.classification_in_progress(tmp_path)
+
+
+def test_spawn_headless_classification_caps_log(tmp_path, monkeypatch):
+    class FakePopen:
+        pid = os.getpid()
+
+        def __init__(self, cmd, **kwargs):
+            kwargs["stdout"].write(b"new run\n")
+
+    monkeypatch.setattr(event_tracker.subprocess, "Popen", FakePopen)
+    log_path = tmp_path / event_tracker.CLASSIFICATION_LOG_FILE
+
+    log_path.write_bytes(b"x" * 10)
+    assert event_tracker.spawn_headless_classification(tmp_path, "prompt")
+    assert log_path.read_bytes() == b"x" * 10 + b"new run\n"
+
+    log_path.write_bytes(b"x" * (event_tracker.CLASSIFICATION_LOG_MAX_BYTES + 1))
+    assert event_tracker.spawn_headless_classification(tmp_path, "prompt")
+    assert log_path.read_bytes() == b"new run\n"
+
+
+def test_run_headless_classification_clears_queue(tmp_path, monkeypatch):
+    graph_dir = tmp_path / ".htmlgraph"
+    graph_dir.mkdir()
+    event_tracker.save_drift_queue(
+        graph_dir,
+        {"activities": [{"tool": "Edit"}], "last_classification": "2026-01-01"},
+    )
+    (graph_dir / event_tracker.CLASSIFICATION_PID_FILE).write_text("1")
+    runs = []
+    monkeypatch.setattr(
+        event_tracker.subprocess,
+        "run",
+        lambda cmd, **kw: runs.append(cmd) or subprocess.CompletedProcess(cmd, 0),
+    )
+
+    assert event_tracker.run_headless_classification(str(graph_dir), "prompt") == 0
+    assert runs[0][:3] == ["claude", "-p", "prompt"]
+    assert event_tracker.load_drift_queue(graph_dir) == {
+        "activities": [],
+        "last_classification": "2026-01-01",
+    }
+    assert not (graph_dir / event_tracker.CLASSIFICATION_PID_FILE).exists()
+
+
+def test_run_headless_classification_keeps_activities_queued_meanwhile(
+    tmp_path, monkeypatch
+):
+    graph_dir = tmp_path / ".htmlgraph"
+    graph_dir.mkdir()
+    now = datetime.now()
+    classified = [
+        {"tool": "Edit", "timestamp": (now - timedelta(minutes=2)).isoformat()},
+        {"tool": "Write", "timestamp": (now - timedelta(minutes=1)).isoformat()},
+    ]
+    queued_meanwhile = {"tool": "Bash", "timestamp": now.isoformat()}
+
+    def classify(cmd, **kw):
+        # The hook queues another activity while the worker runs
+        queue = event_tracker.load_drift_queue(graph_dir)
+        queue["activities"].append(queued_meanwhile)
+        event_tracker.save_drift_queue(graph_dir, queue)
+        return subprocess.CompletedProcess(cmd, 0)
+
+    event_tracker.save_drift_queue(
+        graph_dir, {"activities": classified, "last_classification": None}
+    )
+    monkeypatch.setattr(event_tracker.subprocess, "run", classify)
+
+    assert (
+        event_tracker.run_headless_classification(
+            graph_dir, "prompt", [a["timestamp"] for a in classified]
+        )
+        == 0
+    )
+    assert event_tracker.load_drift_queue(graph_dir)["activities"] == [queued_meanwhile]
+
+
+def test_spawn_headless_classification_passes_timestamps(tmp_path, monkeypatch):
+    calls = []
+
+    class FakePopen:
+        pid = os.getpid()
+
+        def __init__(self, cmd, **kwargs):
+            calls.append(cmd)
+
+    monkeypatch.setattr(event_tracker.subprocess, "Popen", FakePopen)
+
+    assert event_tracker.spawn_headless_classification(
+        tmp_path, "classify this", ["t1", "t2"]
+    )
+    [cmd] = calls
+    assert cmd[-4:] == [str(tmp_path), "classify this", "t1", "t2"]
+
+
+def test_track_event_disabled_skips_all_work(monkeypatch):
+    monkeypatch.setenv("HTMLGRAPH_DISABLE_TRACKING", "1")
+    monkeypatch.setattr(event_tracker, "resolve_project_path", pytest.fail)
+    monkeypatch.setattr(event_tracker, "SessionManager", pytest.fail)
+
+    assert event_tracker.track_event("PostToolUse", {"cwd": "/nowhere"}) == {
+        "continue": True
+    }
+
+
+def test_track_event_skips_drift_handling_when_disabled(tmp_path, monkeypatch):
+    class FakeActivity:
+        id = "evt-1"
+        drift_score = 0.99
+        feature_id = "feat-1"
+
+    class FakeManager:
+        def __init__(self, graph_dir):
+            pass
+
+        def get_active_session(self):
+            return type("S", (), {"id": "sess-1"})()
+
+        def track_activity(self, **kwargs):
+            return FakeActivity()
+
+    monkeypatch.delenv("HTMLGRAPH_DISABLE_TRACKING", raising=False)
+    monkeypatch.setattr(event_tracker, "SessionManager", FakeManager)
+    monkeypatch.setattr(
+        event_tracker, "resolve_project_path", lambda cwd: str(tmp_path)
+    )
+    monkeypatch.setattr(
+        event_tracker,
+        "load_drift_config",
+        lambda: {"drift_detection": {"enabled": False}},
+    )
+    queued = []
+    monkeypatch.setattr(
+        event_tracker, "add_to_drift_queue", lambda *args: queued.append(args)
+    )
+
+    response = event_tracker.track_event(
+        "PostToolUse", {"tool_name": "Read", "tool_input": {"file_path": "a.py"}}
+    )
+    assert response == {"continue": True}
+    assert queued == []
+
+
+def test_extract_file_paths_keeps_first_three_from_bash():
+    paths = event_tracker.extract_file_paths(
+        {"command": "cat a.py b.txt && diff c.md d.json"}, "Bash"
+    )
+    assert paths == ["a.py", "b.txt", "c.md"]
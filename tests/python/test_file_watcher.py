@@ -0,0 +1,157 @@
+"""Tests for file watcher event filtering."""
+
+import pytest
+from htmlgraph.file_watcher import COLLECTION_PATTERNS, GraphFileHandler
+
+
+@pytest.mark.parametrize(
+    ("collection", "filepath", "expected"),
+    [
+        ("features", "/g/features/feat-001.html", True),
+        ("features", "/g/features/feature-abc.html", True),
+        ("features", "/g/features/bug-001.html", False),
+        ("features", "/g/features/feat-001.html.tmp", False),
+        ("features", "/g/features/feat-001.htm", False),
+        ("sessions", "/g/sessions/sess-1.html", True),
+        ("unknown", "/g/unknown/anything.html", True),
+        ("unknown", "/g/unknown/notes.txt", False),
+    ],
+)
+def test_is_relevant_file(collection, filepath, expected):
+    handler = GraphFileHandler(collection, lambda paths: None)
+
+    assert handler._is_relevant_file(filepath) is expected
+
+
+def test_is_relevant_file_with_wildcard_patterns(monkeypatch):
+    monkeypatch.setitem(COLLECTION_PATTERNS, "custom", ["x?-*.html", "y-[ab]*.html"])
+    handler = GraphFileHandler("custom", lambda paths: None)
+
+    assert handler._is_relevant_file("/g/custom/x1-001.html")
+    assert handler._is_relevant_file("/g/custom/y-b1.html")
+    assert not handler._is_relevant_file("/g/custom/y-c1.html")
+    assert not handler._is_relevant_file("/g/custom/x-001.html")
+
+
+def test_burst_of_events_coalesces_into_one_reload():
+    import threading
+
+    reloaded = threading.Event()
+    calls = []
+
+    def reload(paths):
+        calls.append(paths)
+        reloaded.set()
+
+    handler = GraphFileHandler("features", reload)
+    handler.debounce_delay = 0.05
+    for i in range(50):
+        handler._debounced_reload(f"/g/features/feat-{i % 5}.html")
+
+    assert reloaded.wait(2)
+    handler._debounced_reload()
+    handler.stop()
+
+    assert calls == [{f"/g/features/feat-{i}.html" for i in range(5)}]
+    assert not handler._worker.is_alive()
+
+
+def test_reload_paths_applies_changed_and_deleted_files(tmp_path):
+    from htmlgraph import HtmlGraph
+    from htmlgraph.models import Edge, Node
+
+    writer = HtmlGraph(tmp_path, auto_load=False)
+    writer.add(Node(id="feat-1", title="One", status="todo"))
+    writer.add(
+        Node(
+            id="feat-2",
+            title="Two",
+            edges={"blocks": [Edge(target_id="feat-1")]},
+        )
+    )
+
+    graph = HtmlGraph(tmp_path, auto_load=False)
+    assert graph.reload() == 2
+    assert graph.get_incoming_edges("feat-1")
+
+    updated = Node(id="feat-1", title="One", status="done")
+    writer.add(updated, overwrite=True)
+    (tmp_path / "feat-2.html").unlink()
+
+    count = graph.reload_paths([tmp_path / "feat-1.html", tmp_path / "feat-2.html"])
+
+    assert count == 1
+    assert graph.get("feat-1").status == "done"
+    assert graph.get("feat-2") is None
+    assert graph.get_incoming_edges("feat-1") == []
+
+
+def test_reload_paths_removes_by_loaded_id(tmp_path):
+    from htmlgraph import HtmlGraph
+    from htmlgraph.converter import node_to_html
+    from htmlgraph.models import Edge, Node
+
+    node_to_html(Node(id="feat-1", title="One"), tmp_path / "feat-1.html")
+    node_to_html(
+        Node(id="feat-2", title="Two", edges={"blocks": [Edge(target_id="feat-1")]}),
+        tmp_path / "renamed.html",
+    )
+
+    graph = HtmlGraph(tmp_path, auto_load=False)
+    assert graph.reload() == 2
+
+    # File name differs from the ID it holds
+    (tmp_path / "renamed.html").unlink()
+    assert graph.reload_paths([tmp_path / "renamed.html"]) == 1
+    assert graph.get("feat-2") is None
+    assert graph.get_incoming_edges("feat-1") == []
+
+    # An edit that changes the ID replaces the old node
+    node_to_html(Node(id="feat-3", title="One, renumbered"), tmp_path / "feat-1.html")
+    assert graph.reload_paths([tmp_path / "feat-1.html"]) == 1
+    assert graph.get("feat-1") is None
+    assert graph.get("feat-3").title == "One, renumbered"
+    assert graph.stats()["total"] == 1
+
+
+def test_reload_paths_drops_node_whose_file_stops_parsing(tmp_path):
+    from htmlgraph import HtmlGraph
+    from htmlgraph.converter import node_to_html
+    from htmlgraph.models import Node
+
+    node_to_html(Node(id="feat-1", title="One"), tmp_path / "feat-1.html")
+    node_to_html(Node(id="feat-2", title="Two"), tmp_path / "feat-2.html")
+    graph = HtmlGraph(tmp_path, auto_load=False)
+    assert graph.reload() == 2
+
+    (tmp_path / "feat-1.html").write_text("<html><body>no node</body></html>")
+    assert graph.reload_paths([tmp_path / "feat-1.html"]) == 1
+    assert graph.get("feat-1") is None
+    assert set(graph.nodes) == {"feat-2"}
+
+
+def test_server_tracks_stay_tracks_after_watcher_reload(tmp_path, monkeypatch):
+    from htmlgraph.converter import node_to_html
+    from htmlgraph.models import Node
+    from htmlgraph.planning import Track
+    from htmlgraph.server import HtmlGraphAPIHandler
+
+    tracks_dir = tmp_path / "tracks"
+    track_dir = tracks_dir / "trk-a"
+    track_dir.mkdir(parents=True)
+    node_to_html(Node(id="trk-a", title="A", type="track"), track_dir / "index.html")
+    (track_dir / "spec.html").write_text("<html></html>")
+
+    handler = HtmlGraphAPIHandler.__new__(HtmlGraphAPIHandler)
+    monkeypatch.setattr(HtmlGraphAPIHandler, "graph_dir", tmp_path)
+    monkeypatch.setattr(HtmlGraphAPIHandler, "graphs", {})
+    graph = handler._get_graph("tracks")
+    assert isinstance(graph.get("trk-a"), Track)
+
+    node_to_html(Node(id="trk-a", title="A2", type="track"), track_dir / "index.html")
+    graph.reload_paths([track_dir / "index.html"])
+
+    track = graph.get("trk-a")
+    assert isinstance(track, Track)
+    assert track.title == "A2"
+    assert track.has_spec
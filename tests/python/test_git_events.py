@@ -3,8 +3,9 @@ from __future__ import annotations
 import subprocess
 from pathlib import Path
 
+import pytest
 from htmlgraph.event_log import JsonlEventLog
-from htmlgraph.git_events import log_git_commit, parse_feature_refs
+from htmlgraph.git_events import get_git_info, log_git_commit, parse_feature_refs
 from htmlgraph.session_manager import SessionManager
 
 
@@ -20,6 +21,11 @@ def test_parse_feature_refs():
     assert "feature-xyz" in refs
 
 
+def test_parse_feature_refs_lists_explicit_refs_first():
+    msg = "mentions feat-9 and [bug-2]\n\nFixes: feat-1"
+    assert parse_feature_refs(msg) == ["feat-1", "bug-2", "feat-9"]
+
+
 def test_log_git_commit_writes_event_record(tmp_path: Path, monkeypatch):
     repo = tmp_path / "repo"
     repo.mkdir()
@@ -48,3 +54,159 @@ def test_log_git_commit_writes_event_record(tmp_path: Path, monkeypatch):
     assert events
     assert any(e.get("feature_id") == "feature-1" for e in events)
     assert all("payload" in e for e in events)
+
+
+def test_determine_context_builds_one_session_manager(tmp_path: Path, monkeypatch):
+    from htmlgraph import git_events, session_manager
+
+    graph_dir = tmp_path / ".htmlgraph"
+    SessionManager(graph_dir).start_session(
+        session_id="session-1", agent="test", title="t"
+    )
+
+    created = []
+
+    class CountingSessionManager(SessionManager):
+        def __init__(self, *args, **kwargs):
+            created.append(1)
+            super().__init__(*args, **kwargs)
+
+    monkeypatch.setattr(session_manager, "SessionManager", CountingSessionManager)
+    ctx = git_events._determine_context(graph_dir, commit_message="Fixes: feat-1")
+
+    assert ctx["session_id"] == "session-1"
+    assert len(created) == 1
+
+
+def test_get_git_info_reads_head_commit(tmp_path: Path, monkeypatch):
+    repo = tmp_path / "repo"
+    repo.mkdir()
+    _run(["git", "init"], cwd=repo)
+    _run(["git", "config", "user.name", "Test User"], cwd=repo)
+    _run(["git", "config", "user.email", "test@example.com"], cwd=repo)
+    _run(["git", "config", "commit.gpgsign", "false"], cwd=repo)
+
+    (repo / "a.txt").write_text("one\ntwo\n")
+    _run(["git", "add", "a.txt"], cwd=repo)
+    _run(["git", "commit", "-m", "initial"], cwd=repo)
+    (repo / "a.txt").write_text("one\n")
+    (repo / "b.bin").write_bytes(b"\0\1")
+    _run(["git", "add", "a.txt", "b.bin"], cwd=repo)
+    _run(["git", "commit", "-m", "second", "-m", "Body line"], cwd=repo)
+
+    monkeypatch.chdir(repo)
+    info = get_git_info()
+
+    assert info["commit_hash"] == _run(["git", "rev-parse", "HEAD"], cwd=repo)
+    assert info["commit_hash"].startswith(info["commit_hash_short"])
+    assert info["parents"] == [_run(["git", "rev-parse", "HEAD~1"], cwd=repo)]
+    assert info["branch"] == _run(
+        ["git", "rev-parse", "--abbrev-ref", "HEAD"], cwd=repo
+    )
+    assert info["author_name"] == "Test User"
+    assert info["author_email"] == "test@example.com"
+    assert info["commit_message"] == "second\n\nBody line"
+    assert info["files_changed"] == ["a.txt", "b.bin"]
+    assert (info["insertions"], info["deletions"]) == (0, 1)
+
+
+def test_get_git_info_pygit2_matches_cli(tmp_path: Path, monkeypatch):
+    pytest.importorskip("pygit2")
+    from htmlgraph import git_events
+
+    repo = tmp_path / "repo"
+    repo.mkdir()
+    _run(["git", "init"], cwd=repo)
+    _run(["git", "config", "user.name", "Test User"], cwd=repo)
+    _run(["git", "config", "user.email", "test@example.com"], cwd=repo)
+    _run(["git", "config", "commit.gpgsign", "false"], cwd=repo)
+    (repo / "a.txt").write_text("one\n")
+    _run(["git", "add", "a.txt"], cwd=repo)
+    _run(["git", "commit", "-m", "initial"], cwd=repo)
+    (repo / "a.txt").write_text("two\nthree\n")
+    _run(["git", "commit", "-am", "second"], cwd=repo)
+
+    monkeypatch.chdir(repo)
+    assert git_events._get_git_info_pygit2() == git_events._get_git_info_cli()
+
+
+def test_get_git_info_outside_repo(tmp_path: Path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("GIT_CEILING_DIRECTORIES", str(tmp_path.parent))
+
+    assert get_git_info() == {}
+
+
+def test_get_git_info_reads_given_revision(tmp_path: Path, monkeypatch):
+    repo = tmp_path / "repo"
+    repo.mkdir()
+    _run(["git", "init"], cwd=repo)
+    _run(["git", "config", "user.name", "Test User"], cwd=repo)
+    _run(["git", "config", "user.email", "test@example.com"], cwd=repo)
+    _run(["git", "config", "commit.gpgsign", "false"], cwd=repo)
+    (repo / "a.txt").write_text("one\n")
+    _run(["git", "add", "a.txt"], cwd=repo)
+    _run(["git", "commit", "-m", "initial"], cwd=repo)
+    first = _run(["git", "rev-parse", "HEAD"], cwd=repo)
+    (repo / "a.txt").write_text("two\n")
+    _run(["git", "commit", "-am", "second"], cwd=repo)
+
+    monkeypatch.chdir(repo)
+    info = get_git_info(first)
+
+    assert info["commit_hash"] == first
+    assert info["commit_message"] == "initial"
+
+
+def test_commit_hook_passes_head_to_detached_logger(tmp_path: Path, monkeypatch):
+    from htmlgraph import git_events
+
+    repo = tmp_path / "repo"
+    repo.mkdir()
+    _run(["git", "init"], cwd=repo)
+    _run(["git", "config", "user.name", "Test User"], cwd=repo)
+    _run(["git", "config", "user.email", "test@example.com"], cwd=repo)
+    _run(["git", "config", "commit.gpgsign", "false"], cwd=repo)
+    (repo / "a.txt").write_text("one\n")
+    _run(["git", "add", "a.txt"], cwd=repo)
+    _run(["git", "commit", "-m", "initial"], cwd=repo)
+
+    calls = []
+    monkeypatch.chdir(repo)
+    monkeypatch.delenv("HTMLGRAPH_SYNC_GIT_EVENTS", raising=False)
+    monkeypatch.setattr(
+        git_events,
+        "popen_detached",
+        lambda cmd, **kw: calls.append((cmd, kw)),
+    )
+    monkeypatch.setattr(git_events, "log_git_commit", pytest.fail)
+    monkeypatch.setattr(git_events.sys, "argv", ["git_events", "commit"])
+
+    with pytest.raises(SystemExit) as exc:
+        git_events.main()
+
+    assert exc.value.code == 0
+    [(cmd, kwargs)] = calls
+    head = _run(["git", "rev-parse", "HEAD"], cwd=repo)
+    assert cmd[-3:] == ["htmlgraph.git_events", "_commit_async", head]
+    assert kwargs["stdout"] is subprocess.DEVNULL
+
+
+def test_commit_hook_sync_mode(monkeypatch):
+    from htmlgraph import git_events
+
+    logged = []
+    monkeypatch.setenv("HTMLGRAPH_SYNC_GIT_EVENTS", "1")
+    monkeypatch.setattr(git_events, "popen_detached", pytest.fail)
+    monkeypatch.setattr(
+        git_events,
+        "log_git_commit",
+        lambda commit_hash=None: logged.append(commit_hash) or True,
+    )
+    monkeypatch.setattr(git_events.sys, "argv", ["git_events", "commit", "abc123"])
+
+    with pytest.raises(SystemExit) as exc:
+        git_events.main()
+
+    assert exc.value.code == 0
+    assert logged == ["abc123"]
@@ -101,6 +101,79 @@ class TestAncestorsDescendants:
         descendants = dependency_graph.descendants("nonexistent")
         assert descendants == []
 
+    def test_topological_sort_dependencies_first(self, dependency_graph):
+        """Each node comes after everything it is blocked by."""
+        order = dependency_graph.topological_sort()
+
+        assert order is not None
+        assert sorted(order) == ["a", "b", "c", "d"]
+        assert order[0] == "d"
+        assert order[-1] == "a"
+
+    def test_topological_sort_duplicate_edges(self, dependency_graph):
+        """Repeated edges to the same dependency are not reported as a cycle."""
+        dependency_graph.add(
+            Node(
+                id="e",
+                title="Node E",
+                edges={"blocked_by": [Edge(target_id="d"), Edge(target_id="d")]},
+            )
+        )
+
+        order = dependency_graph.topological_sort()
+
+        assert order is not None
+        assert order.index("d") < order.index("e")
+
+    def test_topological_sort_cycle(self, dependency_graph):
+        """Cycles make the sort fail."""
+        dependency_graph.add(
+            Node(
+                id="d",
+                title="Node D",
+                edges={"blocked_by": [Edge(target_id="a")]},
+            ),
+            overwrite=True,
+        )
+
+        assert dependency_graph.topological_sort() is None
+
+    def test_find_cycles(self, dependency_graph):
+        """Cycles are reported from the first repeated node."""
+        assert dependency_graph.find_cycles() == []
+
+        dependency_graph.add(
+            Node(id="d", title="Node D", edges={"blocked_by": [Edge(target_id="a")]}),
+            overwrite=True,
+        )
+
+        cycles = dependency_graph.find_cycles()
+
+        assert cycles
+        for cycle in cycles:
+            assert cycle[0] == cycle[-1]
+            assert cycle[:-1] in (
+                ["a", "b", "d"],
+                ["a", "c", "d"],
+                ["b", "d", "a"],
+                ["c", "d", "a"],
+                ["d", "a", "b"],
+                ["d", "a", "c"],
+            )
+
+    def test_find_cycles_long_chain(self):
+        """Chains deeper than the recursion limit are handled."""
+        graph = HtmlGraph(tempfile.mkdtemp(), auto_load=False)
+        length = 5000
+        for i in range(length):
+            edges = {"blocked_by": [Edge(target_id=f"n{(i + 1) % length}")]}
+            graph._nodes[f"n{i}"] = Node(id=f"n{i}", title="N", edges=edges)
+
+        cycles = graph.find_cycles()
+
+        assert len(cycles) == 1
+        assert len(cycles[0]) == length + 1
+
 
 class TestSubgraph:
     """Tests for subgraph() method."""
@@ -348,6 +421,20 @@ class TestAllPaths:
         paths = graph_with_paths.all_paths("nonexistent", "d")
         assert paths == []
 
+    def test_shortest_path(self, graph_with_paths):
+        """Test BFS shortest path (either branch is a shortest path)."""
+        assert graph_with_paths.shortest_path("a", "d", relationship="next") in (
+            ["a", "b", "d"],
+            ["a", "c", "d"],
+        )
+        assert graph_with_paths.shortest_path("a", "c", relationship="next") == [
+            "a",
+            "c",
+        ]
+        assert graph_with_paths.shortest_path("a", "a") == ["a"]
+        assert graph_with_paths.shortest_path("d", "a", relationship="next") is None
+        assert graph_with_paths.shortest_path("a", "nonexistent") is None
+
 
 class TestTraversalIntegration:
     """Integration tests for traversal methods."""
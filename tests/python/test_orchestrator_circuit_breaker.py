@@ -320,3 +320,54 @@ class TestCircuitBreakerCLI:
 
         captured = capsys.readouterr()
         assert "2/3" in captured.out
+
+
+class TestStateFileLoading:
+    """Test how often the hook reads its state files."""
+
+    def test_mode_file_loaded_once_per_call(self, tmp_path, monkeypatch):
+        """Test that one hook call parses the mode file only once."""
+        monkeypatch.chdir(tmp_path)
+
+        manager = OrchestratorModeManager(tmp_path / ".htmlgraph")
+        manager.enable(level="strict")
+
+        loads = []
+        original_load = OrchestratorModeManager.load
+
+        def recording_load(self):
+            loads.append(self.state_file)
+            return original_load(self)
+
+        monkeypatch.setattr(OrchestratorModeManager, "load", recording_load)
+
+        result = enforce_orchestrator_mode("Bash", {"command": "git status"})
+
+        assert loads == [tmp_path / ".htmlgraph" / "orchestrator-mode.json"]
+        assert result["hookSpecificOutput"]["permissionDecision"] == "allow"
+
+    def test_tool_history_read_once_per_call(self, tmp_path, monkeypatch):
+        """Test that exploration checks and the history update share one read."""
+        from htmlgraph.hooks import orchestrator
+
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.setattr(
+            orchestrator, "TOOL_HISTORY_FILE", tmp_path / "tool-history.json"
+        )
+
+        manager = OrchestratorModeManager(tmp_path / ".htmlgraph")
+        manager.enable(level="strict")
+
+        reads = []
+        original_load_history = orchestrator.load_tool_history
+
+        def recording_load_history():
+            reads.append(True)
+            return original_load_history()
+
+        monkeypatch.setattr(orchestrator, "load_tool_history", recording_load_history)
+
+        enforce_orchestrator_mode("Read", {"file_path": "test.py"})
+
+        assert len(reads) == 1
+        assert [h["tool"] for h in original_load_history()] == ["Read"]
@@ -439,6 +439,37 @@ class TestTestBuildBlocked:
         assert response["continue"] is True  # Advisory-only: warnings but no blocking
         assert "Testing/building" in response["hookSpecificOutput"]["additionalContext"]
 
+    def test_launched_pytest_blocked(
+        self, hook_script, temp_graph_dir, clean_tool_history
+    ):
+        """pytest run through uv or python -m should be blocked in strict mode."""
+        manager = OrchestratorModeManager(temp_graph_dir)
+        manager.enable(level="strict")
+
+        response = run_hook(
+            hook_script,
+            "Bash",
+            {"command": "uv run pytest -x tests/"},
+            cwd=temp_graph_dir.parent,
+        )
+
+        context = response["hookSpecificOutput"]["additionalContext"]
+        assert "Testing/building (pytest)" in context
+
+    def test_other_subcommands_not_test_build(
+        self, hook_script, temp_graph_dir, clean_tool_history
+    ):
+        """npm subcommands outside run/test/build are not treated as test/build."""
+        manager = OrchestratorModeManager(temp_graph_dir)
+        manager.enable(level="strict")
+
+        response = run_hook(
+            hook_script, "Bash", {"command": "npm install"}, cwd=temp_graph_dir.parent
+        )
+
+        context = response["hookSpecificOutput"]["additionalContext"]
+        assert "Testing/building" not in context
+
 
 class TestGuidanceMode:
     """Test guidance mode behavior (warns but allows)."""
@@ -211,3 +211,52 @@ if __name__ == "__main__":
     test_metrics_include_compilation_stats()
     test_cache_invalidation_clears_compiled_queries()
     print("✅ All tests passed!")
+
+
+def test_field_attribute_selectors_match_like_rendered_html():
+    """Selectors on id/type/status/priority skip rendering but agree with it."""
+    from htmlgraph.models import Spike
+    from htmlgraph.parser import HtmlParser
+
+    nodes = [
+        Node(id="feat-1", title="A", type="feature", status="todo", priority="high"),
+        Spike(id="spk-2", title="B", status="blocked"),
+        Node(id='odd"id&', title="C", type="a&b"),
+    ]
+    selectors = [
+        "[data-status='todo']",
+        "[data-status=blocked][data-priority=medium]",
+        "#feat-1",
+        "[data-type^=sp]",
+        "[DATA-STATUS]",
+        "[data-type='a&b']",
+        "[data-agent-assigned]",
+        "[data-status='todo'] h1",
+    ]
+
+    for selector in selectors:
+        compiled = CompiledQuery(selector=selector)
+        for node in nodes:
+            rendered = HtmlParser.from_string(node.to_html())
+            expected = bool(rendered.query(f"article{selector}"))
+            assert compiled.matches(node) is expected, (selector, node.id)
+
+    assert CompiledQuery(selector="[data-status='todo']")._field_attrs_only
+    assert not CompiledQuery(selector="[data-agent-assigned]")._field_attrs_only
+    assert not CompiledQuery(selector="[data-status='todo'] h1")._field_attrs_only
+
+
+def test_compiled_queries_without_selector_internals(monkeypatch):
+    """Without justhtml's selector internals, selectors match as strings."""
+    from htmlgraph import parser
+
+    monkeypatch.setattr(parser, "HAS_SELECTOR_INTERNALS", False)
+    nodes = [
+        Node(id="feat-1", title="A", status="todo"),
+        Node(id="feat-2", title="B", status="blocked"),
+    ]
+
+    compiled = CompiledQuery(selector="[data-status='blocked']")
+    assert not compiled._field_attrs_only
+    assert [node.id for node in nodes if compiled.matches(node)] == ["feat-2"]
+    assert not CompiledQuery(selector="[data-status=").matches(nodes[0])